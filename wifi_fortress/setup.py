@@ -11,6 +11,9 @@ setup(
         'psutil==5.9.5',
         'netifaces==0.11.0',
         'cryptography==41.0.1',
+        'orjson==3.9.1',
+        'numpy==1.24.3',
+        'matplotlib==3.7.1',
     ],
     extras_require={
         'dev': [
@@ -0,0 +1,28 @@
+import asyncio
+import logging
+from threading import Lock, Thread
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_loop_lock = Lock()
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """Get the event loop shared by plugins for background work
+
+    The loop runs on a single daemon thread and is started on first use.
+    Coroutines are scheduled on it with asyncio.run_coroutine_threadsafe.
+
+    Returns:
+        asyncio.AbstractEventLoop: Running background event loop
+    """
+    global _loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            thread = Thread(target=_loop.run_forever, name='plugin_event_loop')
+            thread.daemon = True
+            thread.start()
+            logger.debug('Started shared plugin event loop')
+        return _loop
@@ -1,10 +1,15 @@
 import os
+import atexit
+import queue
 import logging
 import logging.handlers
 from pathlib import Path
 from typing import Optional
 from .config_manager import ConfigManager
 
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_exit_handler_registered = False
+
 def setup_logging(config_manager: Optional[ConfigManager] = None) -> None:
     """
     Configure logging for WiFi Fortress
@@ -33,6 +38,7 @@ def setup_logging(config_manager: Optional[ConfigManager] = None) -> None:
     root_logger.setLevel(log_level)
     
     # Remove existing handlers
+    _stop_queue_listener()
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
     
@@ -46,12 +52,32 @@ def setup_logging(config_manager: Optional[ConfigManager] = None) -> None:
         backupCount=5
     )
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
     
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    # Emit records from a background thread so callers (including the GUI
+    # thread) never block on file or console I/O
+    global _queue_listener, _exit_handler_registered
+    log_queue = queue.Queue(-1)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    # Flush queued records on exit
+    if not _exit_handler_registered:
+        atexit.register(_stop_queue_listener)
+        _exit_handler_registered = True
     
     # Log startup message
     logging.info('WiFi Fortress logging initialized')
+
+def _stop_queue_listener() -> None:
+    """Stop the background log listener, flushing queued records"""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
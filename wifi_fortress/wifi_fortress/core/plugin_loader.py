@@ -3,7 +3,9 @@ import importlib
 import inspect
 import os
 import sys
-from typing import Dict, List, Optional, Type
+import threading
+import time
+from typing import ClassVar, Dict, List, Optional, Tuple, Type, Union
 from pathlib import Path
 from wifi_fortress.core.error_handler import handle_errors, PluginError
 from wifi_fortress.core.security import SecurityManager
@@ -18,6 +20,13 @@ class Plugin:
     version: str = '1.0.0'
     author: str = 'Unknown'
     
+    # 'module.QualName' -> class, for every Plugin subclass defined so far
+    _registry: ClassVar[Dict[str, Type['Plugin']]] = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Plugin._registry[f'{cls.__module__}.{cls.__qualname__}'] = cls
+    
     def __init__(self):
         self.enabled = False
         self.initialized = False
@@ -66,6 +75,7 @@ class PluginLoader:
         # Initialize registries
         self.active_plugins: Dict[str, Plugin] = {}
         self.loaded_instances: Dict[str, Plugin] = {}
+        self._module_cache: Dict[Path, Tuple[int, List[Type[Plugin]]]] = {}  # Plugin file -> (mtime_ns, plugin classes)
         logger.debug('Initialized empty plugin registries')
         
         # Load plugins
@@ -100,17 +110,27 @@ class PluginLoader:
                 if not self.security.validate_plugin(plugin_file):
                     continue
                 
-                # Load module in sandbox
-                module = self.sandbox.load_plugin(plugin_file)
+                # Load module in sandbox, reusing the last load if the
+                # file hasn't changed since
+                mtime = plugin_file.stat().st_mtime_ns
+                cached = self._module_cache.get(plugin_file)
+                if cached is not None and cached[0] == mtime:
+                    plugin_classes = cached[1]
+                else:
+                    # Plugin classes register themselves as the module runs;
+                    # only take the ones this module just defined
+                    registered = dict(Plugin._registry)
+                    module = self.sandbox.load_plugin(plugin_file)
+                    plugin_classes = [
+                        cls for key, cls in Plugin._registry.items()
+                        if cls.__module__ == module.__name__
+                        and registered.get(key) is not cls
+                    ]
+                    self._module_cache[plugin_file] = (mtime, plugin_classes)
                 
-                # Find plugin class
-                for item_name in dir(module):
-                    item = getattr(module, item_name)
-                    if (isinstance(item, type) and 
-                        issubclass(item, Plugin) and 
-                        item != Plugin):
-                        self.plugins[item.name] = item
-                        logger.info(f'Loaded plugin: {item.name}')
+                for item in plugin_classes:
+                    self.plugins[item.name] = item
+                    logger.info(f'Loaded plugin: {item.name}')
                         
             except Exception as e:
                 logger.error(
@@ -249,6 +269,49 @@ class PluginLoader:
                 del self.loaded_instances[name]
             raise PluginError(msg)
             
+    def deactivate_all(self, timeout: float = 5.0) -> bool:
+        """Deactivate all active plugins concurrently
+        
+        Each plugin is cleaned up on its own daemon thread, so plugins that
+        miss the deadline are abandoned rather than holding up interpreter
+        exit.
+        
+        Args:
+            timeout: Maximum time in seconds to wait for all plugins
+            
+        Returns:
+            bool: True if every plugin was deactivated within the timeout
+        """
+        results: Dict[str, bool] = {}
+        
+        def deactivate(name: str) -> None:
+            try:
+                results[name] = self.deactivate_plugin(name)
+            except Exception as e:
+                logger.error(f'Failed to deactivate plugin {name}: {str(e)}')
+                results[name] = False
+                
+        active_plugins = self.get_active_plugins()
+        if not active_plugins:
+            return True
+            
+        threads = []
+        for name in active_plugins:
+            thread = threading.Thread(target=deactivate, args=(name,),
+                                      name=f'deactivate_{name}')
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+            
+        deadline = time.monotonic() + timeout
+        for thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+        not_done = sum(thread.is_alive() for thread in threads)
+            
+        if not_done:
+            logger.warning(f'{not_done} plugin(s) did not deactivate within {timeout}s')
+        return not not_done and all(results.get(name, False) for name in active_plugins)
+        
     @handle_errors(error_types=PluginError)
     def reload_plugins(self) -> bool:
         """Reload all plugins
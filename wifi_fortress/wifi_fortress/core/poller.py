@@ -0,0 +1,119 @@
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# Called with (time.monotonic() of the sample, psutil.net_io_counters(pernic=True))
+NetStatsCallback = Callable[[float, Dict[str, Any]], None]
+
+class NetStatsPoller:
+    """Polls per-interface network counters on a single thread
+
+    Each tick reads psutil.net_io_counters(pernic=True) once and hands the
+    same snapshot to every subscriber that is due, so plugins sampling the
+    network share one read and see consistent timestamps. The thread only
+    runs while there are subscribers.
+    """
+
+    def __init__(self, tick: float = 1.0):
+        """Initialize the poller
+
+        Args:
+            tick: Seconds between polls
+        """
+        self.tick = tick
+        self._subscribers: Dict[NetStatsCallback, List[float]] = {}  # Callback -> [interval, next due]
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._stop: Optional[threading.Event] = None
+
+    def subscribe(self, callback: NetStatsCallback, interval: float = 1.0) -> None:
+        """Register a callback to receive network counter samples
+
+        Args:
+            callback: Called with the sample time and per-interface counters
+            interval: Minimum seconds between calls to this callback
+        """
+        with self._lock:
+            self._subscribers[callback] = [interval, 0.0]
+            if self._thread is None or not self._thread.is_alive():
+                # Each thread gets its own stop event so a thread that is
+                # still winding down can't be revived by a new subscriber
+                self._stop = threading.Event()
+                self._thread = threading.Thread(
+                    target=self._run,
+                    args=(self._stop,),
+                    name='net_stats_poller'
+                )
+                self._thread.daemon = True
+                self._thread.start()
+                logger.debug('Started network stats poller')
+
+    def unsubscribe(self, callback: NetStatsCallback, timeout: float = 5.0) -> None:
+        """Remove a callback, stopping the poller thread if none remain
+
+        Args:
+            callback: Callback previously passed to subscribe
+            timeout: Seconds to wait for the poller thread to stop
+        """
+        with self._lock:
+            self._subscribers.pop(callback, None)
+            if self._subscribers or self._thread is None:
+                return
+            self._stop.set()
+            thread = self._thread
+            self._thread = None
+
+        if thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+
+    def is_subscribed(self, callback: NetStatsCallback) -> bool:
+        """Check whether a callback is registered"""
+        with self._lock:
+            return callback in self._subscribers
+
+    def _run(self, stop: threading.Event) -> None:
+        """Poll loop"""
+        while not stop.is_set():
+            now = time.monotonic()
+            with self._lock:
+                due = []
+                for callback, schedule in self._subscribers.items():
+                    if schedule[1] <= now:
+                        schedule[1] = now + schedule[0]
+                        due.append(callback)
+
+            if due:
+                try:
+                    counters = psutil.net_io_counters(pernic=True)
+                except Exception as e:
+                    logger.error('Error reading network counters: %s', e)
+                    counters = None
+
+                if counters is not None:
+                    for callback in due:
+                        try:
+                            callback(now, counters)
+                        except Exception as e:
+                            logger.error('Error in network stats subscriber: %s', e)
+
+            stop.wait(self.tick)
+
+_poller: Optional[NetStatsPoller] = None
+_poller_lock = threading.Lock()
+
+def get_net_stats_poller() -> NetStatsPoller:
+    """Get the network stats poller shared by plugins
+
+    Returns:
+        NetStatsPoller: Shared poller instance
+    """
+    global _poller
+    with _poller_lock:
+        if _poller is None:
+            _poller = NetStatsPoller()
+        return _poller
@@ -1,20 +1,23 @@
 import time
 from collections import deque
 from threading import Lock
-from typing import Deque
+from typing import Callable, Deque
 
 class RateLimiter:
     """Thread-safe rate limiter using sliding window"""
     
-    def __init__(self, max_requests: int, time_window: int):
+    def __init__(self, max_requests: int, time_window: int,
+                 clock: Callable[[], float] = time.monotonic):
         """Initialize rate limiter
         
         Args:
             max_requests: Maximum number of requests allowed in time window
             time_window: Time window in seconds
+            clock: Returns the current time in seconds
         """
         self._max_requests = max_requests
         self._time_window = time_window
+        self._clock = clock
         self._requests: Deque[float] = deque()
         self._lock = Lock()
         
@@ -25,7 +28,7 @@ class RateLimiter:
             bool: True if request is allowed, False otherwise
         """
         with self._lock:
-            now = time.time()
+            now = self._clock()
             
             # Remove old requests outside the window
             while self._requests and self._requests[0] <= now - self._time_window:
@@ -48,7 +51,7 @@ class RateLimiter:
     def current_usage(self) -> int:
         """Get current number of requests in window"""
         with self._lock:
-            now = time.time()
+            now = self._clock()
             # Remove old requests first
             while self._requests and self._requests[0] <= now - self._time_window:
                 self._requests.popleft()
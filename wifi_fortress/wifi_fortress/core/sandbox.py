@@ -16,12 +16,12 @@ logger = logging.getLogger(__name__)
 class PluginSandbox:
     """Provides a restricted execution environment for plugins"""
     
-    def __init__(self, max_memory_mb: int = 100, max_cpu_time: int = 30):
+    def __init__(self, max_memory_mb: int = 100, max_cpu_time: float = 30):
         """Initialize plugin sandbox
         
         Args:
             max_memory_mb: Maximum memory usage in MB
-            max_cpu_time: Maximum CPU time in seconds
+            max_cpu_time: Maximum CPU time in seconds, may be fractional
         """
         self.max_memory = max_memory_mb * 1024 * 1024  # Convert to bytes
         self.max_cpu_time = max_cpu_time
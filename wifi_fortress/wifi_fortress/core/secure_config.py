@@ -1,7 +1,8 @@
+import io
 import os
 import json
 import base64
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Union
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
@@ -9,11 +10,82 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# PBKDF2 iteration count, read at key derivation time so the test suite can
+# lower it
+_KDF_ITERATIONS = 100000
+
+def _derive_key(password: str, salt: bytes, iterations: int) -> bytes:
+    """Derive a Fernet key from a password with PBKDF2
+    
+    Args:
+        password: Master password
+        salt: PBKDF2 salt
+        iterations: PBKDF2 iteration count
+        
+    Returns:
+        bytes: URL-safe base64 encoded 32-byte key
+    """
+    kdf = PBKDF2HMAC(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=salt,
+        iterations=iterations,
+    )
+    return base64.b64encode(kdf.derive(password.encode()))
+
+class _FileBackend:
+    """Stores the encrypted config in a file"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        
+    def read(self) -> Optional[bytes]:
+        """Get the stored bytes, or None if nothing has been saved"""
+        if not os.path.exists(self.path):
+            return None
+        with open(self.path, 'rb') as f:
+            return f.read()
+            
+    def write(self, data: bytes) -> None:
+        """Replace the stored bytes"""
+        # Ensure directory exists
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with open(self.path, 'wb') as f:
+            f.write(data)
+
+class _BytesBackend:
+    """Stores the encrypted config in an in-memory buffer"""
+    
+    def __init__(self, buffer: io.BytesIO):
+        self.buffer = buffer
+        
+    def read(self) -> Optional[bytes]:
+        """Get the stored bytes, or None if nothing has been saved"""
+        data = self.buffer.getvalue()
+        return data or None
+        
+    def write(self, data: bytes) -> None:
+        """Replace the stored bytes"""
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        self.buffer.write(data)
+
 class SecureConfigManager:
     """Secure configuration manager with encryption support"""
     
-    def __init__(self, config_path: str, master_password: str):
+    def __init__(self, config_path: Union[str, io.BytesIO], master_password: str):
+        """Initialize the config manager
+        
+        Args:
+            config_path: Path of the encrypted config file, or a BytesIO
+                buffer to keep it in memory
+            master_password: Master password for deriving encryption key
+        """
         self.config_path = config_path
+        if isinstance(config_path, io.BytesIO):
+            self._backend = _BytesBackend(config_path)
+        else:
+            self._backend = _FileBackend(config_path)
         self._config: Dict = {}
         self._fernet = self._setup_encryption(master_password)
         
@@ -35,13 +107,7 @@ class SecureConfigManager:
             salt = salt.encode('utf-8')
             
         # Generate key using PBKDF2
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=salt,
-            iterations=100000,
-        )
-        key = base64.b64encode(kdf.derive(master_password.encode()))
+        key = _derive_key(master_password, salt, _KDF_ITERATIONS)
         return Fernet(key)
         
     def load_config(self) -> bool:
@@ -51,11 +117,10 @@ class SecureConfigManager:
             bool: True if config loaded successfully
         """
         try:
-            if os.path.exists(self.config_path):
-                with open(self.config_path, 'rb') as f:
-                    encrypted_data = f.read()
-                    decrypted_data = self._fernet.decrypt(encrypted_data)
-                    self._config = json.loads(decrypted_data)
+            encrypted_data = self._backend.read()
+            if encrypted_data is not None:
+                decrypted_data = self._fernet.decrypt(encrypted_data)
+                self._config = json.loads(decrypted_data)
             else:
                 self._config = {}
             return True
@@ -70,15 +135,11 @@ class SecureConfigManager:
             bool: True if config saved successfully
         """
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            
             # Encrypt and save
             config_json = json.dumps(self._config)
             encrypted_data = self._fernet.encrypt(config_json.encode())
             
-            with open(self.config_path, 'wb') as f:
-                f.write(encrypted_data)
+            self._backend.write(encrypted_data)
             return True
         except Exception as e:
             logger.error(f'Error saving secure config: {e}')
@@ -198,8 +259,7 @@ class SecureConfigManager:
             encrypted_data = new_fernet.encrypt(config_json.encode())
             
             # Save re-encrypted config
-            with open(self.config_path, 'wb') as f:
-                f.write(encrypted_data)
+            self._backend.write(encrypted_data)
                 
             # Update instance
             self._fernet = new_fernet
@@ -8,12 +8,14 @@ This module provides core security functionality including:
 """
 
 import os
+import re
+import ast
 import hmac
 import json
 import logging
 import hashlib
 from pathlib import Path
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Optional, Tuple, Union
 from base64 import b64encode, b64decode
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
@@ -24,6 +26,59 @@ from .error_handler import SecurityError, handle_errors
 
 logger = logging.getLogger(__name__)
 
+# Characters stripped from user input by sanitize_input
+_DANGEROUS_CHARS = re.compile(r'[<>;&|`]')
+
+# Modules plugins may not import, and calls they may not make
+_DANGEROUS_MODULES = frozenset({'subprocess', 'socket', 'requests', 'ctypes'})
+_DANGEROUS_CALLS = frozenset({'eval', 'exec', 'os.system'})
+
+def _dotted_name(node: ast.AST) -> Optional[str]:
+    """Get the dotted name of a Name or Attribute chain, e.g. 'os.system'"""
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        base = _dotted_name(node.value)
+        return f'{base}.{node.attr}' if base else None
+    return None
+
+def _find_dangerous_code(tree: ast.AST) -> Optional[str]:
+    """Find the first dangerous import or reference in a parsed plugin
+    
+    Args:
+        tree: Parsed plugin source
+        
+    Returns:
+        Optional[str]: Description of the dangerous code, or None
+    """
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                if alias.name.split('.')[0] in _DANGEROUS_MODULES:
+                    return f'import {alias.name}'
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and node.module.split('.')[0] in _DANGEROUS_MODULES:
+                return f'from {node.module} import'
+            for alias in node.names:
+                if f'{node.module}.{alias.name}' in _DANGEROUS_CALLS:
+                    return f'from {node.module} import {alias.name}'
+        elif isinstance(node, (ast.Name, ast.Attribute)):
+            # Any reference counts, not just a direct call, so aliases
+            # like f = os.system are caught too
+            name = _dotted_name(node)
+            if name in _DANGEROUS_CALLS:
+                return name
+        elif isinstance(node, ast.Call):
+            # getattr(os, 'system') and the like
+            if (_dotted_name(node.func) == 'getattr' and len(node.args) >= 2
+                    and isinstance(node.args[1], ast.Constant)
+                    and isinstance(node.args[1].value, str)):
+                base = _dotted_name(node.args[0])
+                attr = node.args[1].value
+                if attr in _DANGEROUS_CALLS or f'{base}.{attr}' in _DANGEROUS_CALLS:
+                    return f'getattr({base}, {attr!r})'
+    return None
+
 class SecurityManager:
     """Manages security operations for WiFi Fortress"""
     
@@ -40,6 +95,9 @@ class SecurityManager:
         self.blacklist_file = self.config_dir / 'plugin_blacklist.json'
         self.fernet = self._initialize_encryption()
         
+        # (path, mtime_ns, size) -> (sha256, dangerous pattern found or None)
+        self._hash_cache: Dict[Tuple[str, int, int], Tuple[str, Optional[str]]] = {}
+        
         # Initialize plugin hash lists
         self._load_hash_lists()
         
@@ -154,28 +212,23 @@ class SecurityManager:
             plugin_path = Path(plugin_path)
             
             # Check if file exists
-            if not plugin_path.exists():
+            try:
+                st = os.stat(plugin_path)
+            except FileNotFoundError:
                 raise SecurityError(f'Plugin file not found: {plugin_path}')
             
-            # Read plugin content
-            with open(plugin_path, 'rb') as f:
-                content = f.read()
-            
-            # Check for dangerous imports
-            dangerous_imports = [
-                'os.system', 'subprocess.', 'eval(', 'exec(',
-                'import socket', 'import requests'
-            ]
+            # Only re-read and re-hash the file when it has changed
+            cache_key = (str(plugin_path), st.st_mtime_ns, st.st_size)
+            cached = self._hash_cache.get(cache_key)
+            if cached is None:
+                cached = self._scan_plugin(plugin_path)
+                self._hash_cache[cache_key] = cached
+            plugin_hash, dangerous = cached
             
-            content_str = content.decode('utf-8')
-            for imp in dangerous_imports:
-                if imp in content_str:
-                    raise SecurityError(
-                        f'Plugin contains potentially dangerous code: {imp}'
-                    )
-            
-                # Calculate plugin hash
-            plugin_hash = hashlib.sha256(content).hexdigest()
+            if dangerous is not None:
+                raise SecurityError(
+                    f'Plugin contains potentially dangerous code: {dangerous}'
+                )
             
             # Check against blacklist
             if plugin_hash in self.blacklist:
@@ -194,6 +247,27 @@ class SecurityManager:
             logger.error(msg)
             raise SecurityError(msg)
     
+    def _scan_plugin(self, plugin_path: Path) -> Tuple[str, Optional[str]]:
+        """Hash a plugin file and look for dangerous code in it
+        
+        Args:
+            plugin_path: Path to plugin file
+            
+        Returns:
+            Tuple[str, Optional[str]]: SHA-256 hex digest and the first
+            dangerous pattern found, or None if the plugin looks safe
+        """
+        # Read plugin content
+        with open(plugin_path, 'rb') as f:
+            content = f.read()
+        
+        # Check for dangerous imports and calls in the code itself, so
+        # mentions in comments and strings don't count
+        tree = ast.parse(content, filename=str(plugin_path))
+        dangerous = _find_dangerous_code(tree)
+        
+        return hashlib.sha256(content).hexdigest(), dangerous
+    
     def sanitize_input(self, data: Any) -> Any:
         """Sanitize user input to prevent injection attacks
         
@@ -208,11 +282,8 @@ class SecurityManager:
         """
         try:
             if isinstance(data, str):
-                # Remove potentially dangerous characters
-                dangerous_chars = ['<', '>', ';', '&', '|', '`']
-                for char in dangerous_chars:
-                    data = data.replace(char, '')
-                return data
+                # Remove potentially dangerous characters in one pass
+                return _DANGEROUS_CHARS.sub('', data)
             elif isinstance(data, dict):
                 return {
                     self.sanitize_input(k): self.sanitize_input(v)
@@ -1,6 +1,7 @@
 import sys
 from typing import Dict, List, Optional
 from datetime import datetime
+import numpy as np
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
                            QProgressBar, QTabWidget, QTableWidget, QTableWidgetItem,
                            QHeaderView, QPushButton, QFrame)
@@ -12,6 +13,11 @@ from ..core.network_mapper import NetworkMapper
 from ..core.plugin_loader import PluginLoader
 from ..core.logging_manager import LoggingManager
 
+def _format_bytes_mb(values) -> List[str]:
+    """Format byte counts as megabyte strings, e.g. '1.5 MB'"""
+    mb = np.asarray(values, dtype=np.float64) / (1024 * 1024)
+    return np.char.add(np.char.mod('%.1f', mb), ' MB').tolist()
+
 class DashboardWidget(QWidget):
     """Main dashboard widget for WiFi Fortress"""
     
@@ -209,17 +215,14 @@ class MetricsWidget(QWidget):
         self.mem_bar.setValue(int(metrics.memory_percent))
         
         # Update network table
-        self.net_table.setRowCount(len(metrics.network_io))
-        for row, (interface, io) in enumerate(metrics.network_io.items()):
+        network_io = metrics.network_io
+        sent = _format_bytes_mb([io['bytes_sent'] for io in network_io.values()])
+        recv = _format_bytes_mb([io['bytes_recv'] for io in network_io.values()])
+        self.net_table.setRowCount(len(network_io))
+        for row, interface in enumerate(network_io):
             self.net_table.setItem(row, 0, QTableWidgetItem(interface))
-            self.net_table.setItem(
-                row, 1,
-                QTableWidgetItem(f"{io['bytes_sent'] / 1024 / 1024:.1f} MB")
-            )
-            self.net_table.setItem(
-                row, 2,
-                QTableWidgetItem(f"{io['bytes_recv'] / 1024 / 1024:.1f} MB")
-            )
+            self.net_table.setItem(row, 1, QTableWidgetItem(sent[row]))
+            self.net_table.setItem(row, 2, QTableWidgetItem(recv[row]))
 
 class NetworkDevicesWidget(QWidget):
     """Widget for displaying network devices"""
@@ -247,18 +250,23 @@ class NetworkDevicesWidget(QWidget):
         
     def update_devices(self, devices: List):
         """Update device list"""
-        self.devices_table.setRowCount(len(devices))
-        for row, device in enumerate(devices):
-            self.devices_table.setItem(row, 0, QTableWidgetItem(device.ip_address))
-            self.devices_table.setItem(row, 1, QTableWidgetItem(device.mac_address))
-            self.devices_table.setItem(
-                row, 2,
-                QTableWidgetItem(device.hostname or "Unknown")
-            )
-            self.devices_table.setItem(
-                row, 3,
-                QTableWidgetItem(device.last_seen.strftime("%Y-%m-%d %H:%M:%S"))
-            )
+        # Fill the whole table before repainting it
+        self.devices_table.setUpdatesEnabled(False)
+        try:
+            self.devices_table.setRowCount(len(devices))
+            for row, device in enumerate(devices):
+                self.devices_table.setItem(row, 0, QTableWidgetItem(device.ip_address))
+                self.devices_table.setItem(row, 1, QTableWidgetItem(device.mac_address))
+                self.devices_table.setItem(
+                    row, 2,
+                    QTableWidgetItem(device.hostname or "Unknown")
+                )
+                self.devices_table.setItem(
+                    row, 3,
+                    QTableWidgetItem(device.last_seen.strftime("%Y-%m-%d %H:%M:%S"))
+                )
+        finally:
+            self.devices_table.setUpdatesEnabled(True)
             
     def scan_network(self):
         """Trigger network scan"""
@@ -301,27 +309,32 @@ class SecurityAlertsWidget(QWidget):
         
     def _update_table(self):
         """Update alerts table"""
-        self.alerts_table.setRowCount(len(self.alerts))
-        for row, alert in enumerate(self.alerts):
-            self.alerts_table.setItem(
-                row, 0,
-                QTableWidgetItem(alert["time"].strftime("%Y-%m-%d %H:%M:%S"))
-            )
-            self.alerts_table.setItem(row, 1, QTableWidgetItem(alert["level"]))
-            self.alerts_table.setItem(row, 2, QTableWidgetItem(alert["source"]))
-            self.alerts_table.setItem(row, 3, QTableWidgetItem(alert["message"]))
-            
-            # Color code by level
-            color = {
-                "LOW": QColor(255, 255, 200),    # Light yellow
-                "MEDIUM": QColor(255, 200, 100),  # Light orange
-                "HIGH": QColor(255, 200, 200)     # Light red
-            }.get(alert["level"])
-            
-            if color:
-                for col in range(4):
-                    item = self.alerts_table.item(row, col)
-                    item.setBackground(color)
+        # Fill the whole table before repainting it
+        self.alerts_table.setUpdatesEnabled(False)
+        try:
+            self.alerts_table.setRowCount(len(self.alerts))
+            for row, alert in enumerate(self.alerts):
+                self.alerts_table.setItem(
+                    row, 0,
+                    QTableWidgetItem(alert["time"].strftime("%Y-%m-%d %H:%M:%S"))
+                )
+                self.alerts_table.setItem(row, 1, QTableWidgetItem(alert["level"]))
+                self.alerts_table.setItem(row, 2, QTableWidgetItem(alert["source"]))
+                self.alerts_table.setItem(row, 3, QTableWidgetItem(alert["message"]))
+                
+                # Color code by level
+                color = {
+                    "LOW": QColor(255, 255, 200),    # Light yellow
+                    "MEDIUM": QColor(255, 200, 100),  # Light orange
+                    "HIGH": QColor(255, 200, 200)     # Light red
+                }.get(alert["level"])
+                
+                if color:
+                    for col in range(4):
+                        item = self.alerts_table.item(row, col)
+                        item.setBackground(color)
+        finally:
+            self.alerts_table.setUpdatesEnabled(True)
 
 class PluginsWidget(QWidget):
     """Widget for managing plugins"""
@@ -1,7 +1,7 @@
 from PyQt5.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
                              QPushButton, QLabel, QTableWidget, QTableWidgetItem,
                              QStatusBar, QMessageBox, QTabWidget)
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QTimer
 from ..core.plugin_loader import PluginLoader
 from .dashboard import DashboardWidget
 
@@ -9,6 +9,7 @@ class MainWindow(QMainWindow):
     def __init__(self, plugin_loader: PluginLoader):
         super().__init__()
         self.plugin_loader = plugin_loader
+        self._refresh_pending = False
         self.init_ui()
         
     def init_ui(self):
@@ -74,23 +75,42 @@ class MainWindow(QMainWindow):
         # Load plugins initially
         self.refresh_plugins()
         
+    def schedule_refresh(self):
+        """Schedule a plugin list refresh on the next event loop iteration
+        
+        Multiple requests made before the refresh runs are coalesced.
+        """
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(0, self.refresh_plugins)
+        
     def refresh_plugins(self):
         """Refresh the plugin list"""
-        self.plugin_table.setRowCount(0)
+        self._refresh_pending = False
         available_plugins = self.plugin_loader.get_available_plugins()
         active_plugins = self.plugin_loader.get_active_plugins()
         
-        self.plugin_table.setRowCount(len(available_plugins))
-        for row, name in enumerate(available_plugins):
-            plugin_class = self.plugin_loader.plugins[name]
-            
-            self.plugin_table.setItem(row, 0, QTableWidgetItem(plugin_class.name))
-            self.plugin_table.setItem(row, 1, QTableWidgetItem(plugin_class.description))
-            self.plugin_table.setItem(row, 2, QTableWidgetItem(plugin_class.version))
-            self.plugin_table.setItem(row, 3, QTableWidgetItem(plugin_class.author))
-            
-            status = 'Active' if name in active_plugins else 'Inactive'
-            self.plugin_table.setItem(row, 4, QTableWidgetItem(status))
+        # Fill the table in one batch so it is laid out and painted once
+        sorting_enabled = self.plugin_table.isSortingEnabled()
+        self.plugin_table.setUpdatesEnabled(False)
+        self.plugin_table.setSortingEnabled(False)
+        try:
+            self.plugin_table.setRowCount(0)
+            self.plugin_table.setRowCount(len(available_plugins))
+            for row, name in enumerate(available_plugins):
+                plugin_class = self.plugin_loader.plugins[name]
+                
+                self.plugin_table.setItem(row, 0, QTableWidgetItem(plugin_class.name))
+                self.plugin_table.setItem(row, 1, QTableWidgetItem(plugin_class.description))
+                self.plugin_table.setItem(row, 2, QTableWidgetItem(plugin_class.version))
+                self.plugin_table.setItem(row, 3, QTableWidgetItem(plugin_class.author))
+                
+                status = 'Active' if name in active_plugins else 'Inactive'
+                self.plugin_table.setItem(row, 4, QTableWidgetItem(status))
+        finally:
+            self.plugin_table.setSortingEnabled(sorting_enabled)
+            self.plugin_table.setUpdatesEnabled(True)
         
         self.status_bar.showMessage(f'Loaded {len(available_plugins)} plugins')
         
@@ -110,7 +130,7 @@ class MainWindow(QMainWindow):
             
         try:
             self.plugin_loader.activate_plugin(plugin_name)
-            self.refresh_plugins()
+            self.schedule_refresh()
             self.status_bar.showMessage(f'Started plugin: {plugin_name}')
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to start plugin: {str(e)}')
@@ -124,7 +144,7 @@ class MainWindow(QMainWindow):
             
         try:
             self.plugin_loader.deactivate_plugin(plugin_name)
-            self.refresh_plugins()
+            self.schedule_refresh()
             self.status_bar.showMessage(f'Stopped plugin: {plugin_name}')
         except Exception as e:
             QMessageBox.critical(self, 'Error', f'Failed to stop plugin: {str(e)}')
@@ -1,12 +1,45 @@
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QFormLayout,
                              QLabel, QProgressBar, QFrame)
 from PyQt5.QtCore import Qt, QTimer
 from PyQt5.QtGui import QColor, QPalette
+import os
+import platform
 import psutil
 import time
-from typing import Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, List, Optional
+from wifi_fortress.core.poller import get_net_stats_poller
 from wifi_fortress.plugins.performance_monitor import PerformanceMonitor
 
+# Progress bar highlight colors by rate bucket
+_BAR_COLORS = {
+    'red': QColor(255, 0, 0),
+    'orange': QColor(255, 165, 0),
+    'green': QColor(0, 255, 0)
+}
+
+# Palettes are built once per bucket on first use (needs a QApplication)
+_PALETTES: Dict[str, QPalette] = {}
+
+@lru_cache(maxsize=None)
+def _list_interfaces() -> List[str]:
+    """List network interface names
+    
+    On Linux this is a single directory read instead of the per-interface
+    ioctls issued by psutil.net_if_stats().
+    """
+    if platform.system() == 'Linux':
+        try:
+            # Skip plain files such as bonding_masters
+            with os.scandir('/sys/class/net') as entries:
+                return sorted(
+                    entry.name for entry in entries
+                    if not entry.is_file(follow_symlinks=False)
+                )
+        except OSError:
+            pass
+    return list(psutil.net_if_stats())
+
 class NetworkStatusWidget(QWidget):
     """Widget displaying real-time network status"""
     
@@ -16,11 +49,25 @@ class NetworkStatusWidget(QWidget):
         self.performance_monitor = performance_monitor
         self._setup_ui()
         
+        # Latest per-interface counters from the shared poller, so each tick
+        # doesn't enumerate every interface again
+        self._io_counters: Dict[str, Any] = {}
+        get_net_stats_poller().subscribe(self._on_net_stats, interval=1.0)
+        
         # Update timer
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_stats)
         self.update_timer.start(1000)  # Update every second
         
+    def _on_net_stats(self, current_time: float, counters: Dict[str, Any]) -> None:
+        """Keep the latest network counter sample from the shared poller
+        
+        Args:
+            current_time: time.monotonic() when the sample was taken
+            counters: Per-interface psutil counters
+        """
+        self._io_counters = counters
+        
     def _setup_ui(self):
         """Setup the widget UI"""
         layout = QVBoxLayout()
@@ -33,59 +80,15 @@ class NetworkStatusWidget(QWidget):
         # Stats frame
         stats_frame = QFrame()
         stats_frame.setFrameStyle(QFrame.StyledPanel | QFrame.Raised)
-        stats_layout = QVBoxLayout()
+        self.stats_layout = QFormLayout()
         
-        # Interface stats
+        # Interface stats, rows are added as interfaces are discovered
         self.interface_widgets: Dict[str, Dict] = {}
         
-        for interface, _ in psutil.net_if_stats().items():
-            # Interface group
-            interface_group = QFrame()
-            interface_layout = QVBoxLayout()
-            
-            # Interface name
-            name_label = QLabel(f'<b>{interface}</b>')
-            interface_layout.addWidget(name_label)
-            
-            # Bandwidth
-            bandwidth_layout = QHBoxLayout()
-            bandwidth_layout.addWidget(QLabel('Bandwidth:'))
-            rx_label = QLabel('RX: 0 Mbps')
-            tx_label = QLabel('TX: 0 Mbps')
-            bandwidth_layout.addWidget(rx_label)
-            bandwidth_layout.addWidget(tx_label)
-            interface_layout.addLayout(bandwidth_layout)
-            
-            # Error rate
-            error_layout = QHBoxLayout()
-            error_layout.addWidget(QLabel('Error Rate:'))
-            error_bar = QProgressBar()
-            error_bar.setRange(0, 100)
-            error_bar.setValue(0)
-            error_layout.addWidget(error_bar)
-            interface_layout.addLayout(error_layout)
+        for interface in _list_interfaces():
+            self._add_interface_row(interface)
             
-            # Drop rate
-            drop_layout = QHBoxLayout()
-            drop_layout.addWidget(QLabel('Drop Rate:'))
-            drop_bar = QProgressBar()
-            drop_bar.setRange(0, 100)
-            drop_bar.setValue(0)
-            drop_layout.addWidget(drop_bar)
-            interface_layout.addLayout(drop_layout)
-            
-            interface_group.setLayout(interface_layout)
-            stats_layout.addWidget(interface_group)
-            
-            # Store widgets for updates
-            self.interface_widgets[interface] = {
-                'rx_label': rx_label,
-                'tx_label': tx_label,
-                'error_bar': error_bar,
-                'drop_bar': drop_bar
-            }
-            
-        stats_frame.setLayout(stats_layout)
+        stats_frame.setLayout(self.stats_layout)
         layout.addWidget(stats_frame)
         
         # Status message
@@ -95,23 +98,56 @@ class NetworkStatusWidget(QWidget):
         
         self.setLayout(layout)
         
+    def _add_interface_row(self, interface: str):
+        """Add the display rows for a newly discovered interface"""
+        bandwidth_label = QLabel('RX: 0 Mbps  TX: 0 Mbps')
+        self.stats_layout.addRow(f'<b>{interface}</b>', bandwidth_label)
+        
+        error_bar = QProgressBar()
+        error_bar.setRange(0, 100)
+        error_bar.setValue(0)
+        self.stats_layout.addRow('Error Rate:', error_bar)
+        
+        drop_bar = QProgressBar()
+        drop_bar.setRange(0, 100)
+        drop_bar.setValue(0)
+        self.stats_layout.addRow('Drop Rate:', drop_bar)
+        
+        # Store widgets for updates
+        self.interface_widgets[interface] = {
+            'bandwidth_label': bandwidth_label,
+            'error_bar': error_bar,
+            'drop_bar': drop_bar
+        }
+        
     def update_stats(self):
         """Update network statistics"""
         try:
+            io_counters = self._io_counters
+            
+            # Pick up interfaces added since the last update (hotplug, VPN)
+            for interface in io_counters.keys() - self.interface_widgets.keys():
+                self._add_interface_row(interface)
+                
             for interface, widgets in self.interface_widgets.items():
                 if self.performance_monitor:
                     # Get stats from performance monitor
                     bandwidth = self.performance_monitor.get_current_bandwidth(interface)
-                    widgets['rx_label'].setText(f'RX: {bandwidth["rx_mbps"]:.1f} Mbps')
-                    widgets['tx_label'].setText(f'TX: {bandwidth["tx_mbps"]:.1f} Mbps')
+                    widgets['bandwidth_label'].setText(
+                        f'RX: {bandwidth["rx_mbps"]:.1f} Mbps  '
+                        f'TX: {bandwidth["tx_mbps"]:.1f} Mbps'
+                    )
                     
                     # Get recent stats for error and drop rates
-                    stats = self.performance_monitor.get_interface_stats(interface, 60)
-                    if stats:
-                        total_packets = sum(s.packets_sent + s.packets_recv for s in stats)
+                    history = self.performance_monitor.get_interface_history(interface, 60)
+                    if history:
+                        total_packets = float(history['packets_sent'].sum() +
+                                              history['packets_recv'].sum())
                         if total_packets > 0:
-                            error_rate = sum(s.errin + s.errout for s in stats) / total_packets
-                            drop_rate = sum(s.dropin + s.dropout for s in stats) / total_packets
+                            error_rate = float(history['errin'].sum() +
+                                               history['errout'].sum()) / total_packets
+                            drop_rate = float(history['dropin'].sum() +
+                                              history['dropout'].sum()) / total_packets
                             
                             widgets['error_bar'].setValue(int(error_rate * 100))
                             widgets['drop_bar'].setValue(int(drop_rate * 100))
@@ -121,12 +157,10 @@ class NetworkStatusWidget(QWidget):
                             self._update_bar_color(widgets['drop_bar'], drop_rate)
                 else:
                     # Fallback to basic psutil stats
-                    stats = psutil.net_io_counters(pernic=True).get(interface)
+                    stats = io_counters.get(interface)
                     if stats:
-                        widgets['rx_label'].setText(
-                            f'RX: {stats.bytes_recv / 1_000_000:.1f} MB'
-                        )
-                        widgets['tx_label'].setText(
+                        widgets['bandwidth_label'].setText(
+                            f'RX: {stats.bytes_recv / 1_000_000:.1f} MB  '
                             f'TX: {stats.bytes_sent / 1_000_000:.1f} MB'
                         )
                         
@@ -140,22 +174,32 @@ class NetworkStatusWidget(QWidget):
     def _update_bar_color(self, bar: QProgressBar, rate: float):
         """Update progress bar color based on rate"""
         if rate > 0.1:  # > 10%
-            color = QColor(255, 0, 0)  # Red
+            bucket = 'red'
         elif rate > 0.05:  # > 5%
-            color = QColor(255, 165, 0)  # Orange
+            bucket = 'orange'
         else:
-            color = QColor(0, 255, 0)  # Green
+            bucket = 'green'
+            
+        if bar.property('color_bucket') == bucket:
+            return
             
-        palette = bar.palette()
-        palette.setColor(QPalette.Highlight, color)
+        palette = _PALETTES.get(bucket)
+        if palette is None:
+            palette = QPalette(bar.palette())
+            palette.setColor(QPalette.Highlight, _BAR_COLORS[bucket])
+            _PALETTES[bucket] = palette
         bar.setPalette(palette)
+        bar.setProperty('color_bucket', bucket)
         
     def showEvent(self, event):
         """Start updates when widget is shown"""
         super().showEvent(event)
+        get_net_stats_poller().subscribe(self._on_net_stats, interval=1.0)
         self.update_timer.start()
         
     def hideEvent(self, event):
         """Stop updates when widget is hidden"""
         super().hideEvent(event)
         self.update_timer.stop()
+        # Don't block the GUI thread waiting for the poller thread to exit
+        get_net_stats_poller().unsubscribe(self._on_net_stats, timeout=0)
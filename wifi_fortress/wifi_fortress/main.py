@@ -3,8 +3,12 @@ import os
 from PyQt5.QtWidgets import QApplication
 from wifi_fortress.gui.main_window import MainWindow
 from wifi_fortress.core.plugin_loader import PluginLoader
+from wifi_fortress.core.logging_config import setup_logging
 
 def main():
+    # Configure logging
+    setup_logging()
+    
     # Create Qt application
     app = QApplication(sys.argv)
     
@@ -20,8 +24,7 @@ def main():
     exit_code = app.exec_()
     
     # Cleanup
-    for plugin_name in plugin_loader.get_active_plugins():
-        plugin_loader.deactivate_plugin(plugin_name)
+    plugin_loader.deactivate_all(timeout=5)
     sys.exit(exit_code)
 
 if __name__ == '__main__':
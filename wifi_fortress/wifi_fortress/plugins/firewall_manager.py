@@ -1,12 +1,25 @@
 from wifi_fortress.core.plugin_loader import Plugin
+import asyncio
+import logging
 import subprocess
 import platform
-import re
-from typing import List, Dict
+from typing import List, Dict, Tuple
 import json
 import os
-from threading import Thread
-import time
+import orjson
+from threading import Timer, Lock
+from PyQt5.QtCore import QCoreApplication, QThread, QTimer
+from wifi_fortress.core.event_loop import get_background_loop
+
+logger = logging.getLogger(__name__)
+
+# Children never read our stdin or need their stderr, and must not inherit
+# the GUI's stdio (a blocked stdout pipe would stall them)
+_RUN_KW = dict(
+    stdin=subprocess.DEVNULL,
+    stderr=subprocess.DEVNULL,
+    close_fds=True
+)
 
 class FirewallManager(Plugin):
     name = 'Firewall Manager'
@@ -17,10 +30,15 @@ class FirewallManager(Plugin):
     def __init__(self):
         super().__init__()
         self.os_type = platform.system().lower()
-        self.monitor_thread = None
+        self.monitor_task = None
         self.rules: List[Dict] = []
         self.blocked_ips: set = set()
         self.config_file = 'firewall_config.json'
+        self._dirty = False
+        self._save_delay_ms = 500  # Coalesce config writes to at most 2/second
+        self._save_timer = None
+        self._save_fallback_timer = None
+        self._save_lock = Lock()
         
     def initialize(self) -> bool:
         """Initialize the firewall manager"""
@@ -35,66 +53,107 @@ class FirewallManager(Plugin):
             # Verify firewall access
             if self.os_type == 'windows':
                 subprocess.run(['netsh', 'advfirewall', 'show', 'currentprofile'],
-                             check=True, capture_output=True)
+                             check=True, stdout=subprocess.DEVNULL, **_RUN_KW)
             else:
                 subprocess.run(['sudo', 'iptables', '-L'],
-                             check=True, capture_output=True)
+                             check=True, stdout=subprocess.DEVNULL, **_RUN_KW)
             return True
         except Exception as e:
-            print(f"Failed to initialize firewall manager: {str(e)}")
+            logger.error('Failed to initialize firewall manager: %s', e)
             return False
     
     def start_monitoring(self):
         """Start firewall monitoring"""
-        if not self.enabled:
+        if not self.enabled or self.monitor_task:
             return
             
-        def monitor_worker():
-            while self.enabled:
-                try:
-                    self.check_firewall_status()
-                    self.update_rules()
-                    time.sleep(60)  # Check every minute
-                except Exception as e:
-                    print(f"Error in firewall monitoring: {str(e)}")
-                    time.sleep(300)  # Wait 5 minutes on error
-                    
-        self.monitor_thread = Thread(target=monitor_worker)
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
+        self.monitor_task = asyncio.run_coroutine_threadsafe(
+            self._monitor(), get_background_loop()
+        )
+    
+    async def _monitor(self):
+        """Periodically check firewall status and rules"""
+        while self.enabled:
+            try:
+                await self._check_firewall_status()
+                await self._update_rules()
+                await asyncio.sleep(60)  # Check every minute
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error('Error in firewall monitoring: %s', e)
+                await asyncio.sleep(300)  # Wait 5 minutes on error
+    
+    async def _run_command(self, cmd: List[str]) -> str:
+        """Run a command without blocking the event loop and return its output"""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            **_RUN_KW
+        )
+        stdout, _ = await proc.communicate()
+        if proc.returncode != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        return stdout.decode(errors='replace')
+    
+    async def _count_lines(self, cmd: List[str], prefix: bytes) -> Tuple[int, int]:
+        """Stream a command's output and count lines as they arrive
+        
+        Returns:
+            Tuple of (lines starting with prefix, non-empty lines)
+        """
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            **_RUN_KW,
+            limit=1 << 16
+        )
+        matches = non_empty = 0
+        async for line in proc.stdout:
+            if line.startswith(prefix):
+                matches += 1
+            if line.strip():
+                non_empty += 1
+        returncode = await proc.wait()
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        return matches, non_empty
     
     def check_firewall_status(self) -> Dict:
+        """Check firewall status and active rules"""
+        return asyncio.run_coroutine_threadsafe(
+            self._check_firewall_status(), get_background_loop()
+        ).result()
+    
+    async def _check_firewall_status(self) -> Dict:
         """Check firewall status and active rules"""
         status = {'enabled': False, 'active_rules': 0}
         
         try:
             if self.os_type == 'windows':
-                output = subprocess.check_output(
-                    ['netsh', 'advfirewall', 'show', 'allprofiles'],
-                    universal_newlines=True
+                output = await self._run_command(
+                    ['netsh', 'advfirewall', 'show', 'allprofiles']
                 )
                 status['enabled'] = 'ON' in output
                 
                 # Count active rules
-                rule_output = subprocess.check_output(
+                status['active_rules'], _ = await self._count_lines(
                     ['netsh', 'advfirewall', 'firewall', 'show', 'rule', 'name=all'],
-                    universal_newlines=True
+                    b'Rule Name:'
                 )
-                status['active_rules'] = len(re.findall(r'Rule Name:', rule_output))
                 
             else:  # Linux
-                output = subprocess.check_output(
-                    ['sudo', 'iptables', '-L'],
-                    universal_newlines=True
+                chains, non_empty = await self._count_lines(
+                    ['sudo', 'iptables', '-L'], b'Chain'
                 )
-                status['enabled'] = len(output.strip()) > 0
-                status['active_rules'] = len(re.findall(r'^Chain', output, re.M))
+                status['enabled'] = non_empty > 0
+                status['active_rules'] = chains
                 
-            print(f"Firewall Status: {json.dumps(status, indent=2)}")
+            logger.info('Firewall Status: %s', json.dumps(status))
             return status
             
         except Exception as e:
-            print(f"Error checking firewall status: {str(e)}")
+            logger.error('Error checking firewall status: %s', e)
             return status
     
     def add_rule(self, rule: Dict) -> bool:
@@ -111,7 +170,7 @@ class FirewallManager(Plugin):
                 if 'protocol' in rule:
                     cmd.extend(['protocol=' + rule['protocol']])
                 
-                subprocess.run(cmd, check=True)
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, **_RUN_KW)
                 
             else:  # Linux
                 cmd = ['sudo', 'iptables']
@@ -127,14 +186,15 @@ class FirewallManager(Plugin):
                 if 'protocol' in rule:
                     cmd.extend(['-p', rule['protocol']])
                 
-                subprocess.run(cmd, check=True)
+                subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, **_RUN_KW)
             
             self.rules.append(rule)
+            self._dirty = True
             self.save_config()
             return True
             
         except Exception as e:
-            print(f"Error adding firewall rule: {str(e)}")
+            logger.error('Error adding firewall rule: %s', e)
             return False
     
     def block_ip(self, ip: str) -> bool:
@@ -156,14 +216,16 @@ class FirewallManager(Plugin):
                     '-j', 'DROP'
                 ]
             
-            subprocess.run(cmd, check=True)
-            self.blocked_ips.add(ip)
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, **_RUN_KW)
+            if ip not in self.blocked_ips:
+                self.blocked_ips.add(ip)
+                self._dirty = True
             self.save_config()
-            print(f"Blocked IP: {ip}")
+            logger.info('Blocked IP: %s', ip)
             return True
             
         except Exception as e:
-            print(f"Error blocking IP {ip}: {str(e)}")
+            logger.error('Error blocking IP %s: %s', ip, e)
             return False
     
     def unblock_ip(self, ip: str) -> bool:
@@ -182,47 +244,110 @@ class FirewallManager(Plugin):
                     '-j', 'DROP'
                 ]
             
-            subprocess.run(cmd, check=True)
-            self.blocked_ips.discard(ip)
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, **_RUN_KW)
+            if ip in self.blocked_ips:
+                self.blocked_ips.discard(ip)
+                self._dirty = True
             self.save_config()
-            print(f"Unblocked IP: {ip}")
+            logger.info('Unblocked IP: %s', ip)
             return True
             
         except Exception as e:
-            print(f"Error unblocking IP {ip}: {str(e)}")
+            logger.error('Error unblocking IP %s: %s', ip, e)
             return False
     
     def save_config(self):
-        """Save current configuration to file"""
-        try:
-            config = {
-                'rules': self.rules,
-                'blocked_ips': list(self.blocked_ips)
-            }
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
-        except Exception as e:
-            print(f"Error saving firewall configuration: {str(e)}")
+        """Schedule a write of the current configuration
+        
+        Writes are debounced so that bursts of changes (e.g. bulk IP blocks)
+        result in a single write once the save delay has elapsed.
+        """
+        if not self._dirty:
+            return
+            
+        app = QCoreApplication.instance()
+        if app is not None and QThread.currentThread() is app.thread():
+            if self._save_timer is None:
+                self._save_timer = QTimer()
+                self._save_timer.setSingleShot(True)
+                self._save_timer.setInterval(self._save_delay_ms)
+                self._save_timer.timeout.connect(self._do_save)
+            if not self._save_timer.isActive():
+                self._save_timer.start()
+        else:
+            # Not on the Qt main thread, fall back to a plain timer thread
+            with self._save_lock:
+                if self._save_fallback_timer is None:
+                    self._save_fallback_timer = Timer(
+                        self._save_delay_ms / 1000, self._do_save
+                    )
+                    self._save_fallback_timer.daemon = True
+                    self._save_fallback_timer.start()
+    
+    def _do_save(self):
+        """Save current configuration to file if it has changed"""
+        with self._save_lock:
+            self._save_fallback_timer = None
+            if not self._dirty:
+                return
+            try:
+                data = orjson.dumps({
+                    'rules': self.rules,
+                    'blocked_ips': list(self.blocked_ips)
+                }, option=orjson.OPT_INDENT_2)
+                
+                # Write to a temporary file and swap it in so a crash never
+                # leaves a truncated config behind
+                tmp_file = self.config_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.config_file)
+                self._dirty = False
+            except Exception as e:
+                logger.error('Error saving firewall configuration: %s', e)
     
     def update_rules(self):
         """Update and verify all firewall rules"""
-        for rule in self.rules:
+        asyncio.run_coroutine_threadsafe(
+            self._update_rules(), get_background_loop()
+        ).result()
+    
+    async def _update_rules(self):
+        """Update and verify all firewall rules"""
+        loop = asyncio.get_running_loop()
+        for rule in list(self.rules):
             try:
                 # Verify rule exists and is active
                 if self.os_type == 'windows':
                     cmd = ['netsh', 'advfirewall', 'firewall', 'show', 'rule',
                           f'name={rule["name"]}']
-                    result = subprocess.run(cmd, capture_output=True, text=True)
-                    if 'No rules match the specified criteria' in result.stdout:
-                        print(f"Reinstating rule: {rule['name']}")
-                        self.add_rule(rule)
+                    proc = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        stdout=asyncio.subprocess.PIPE,
+                        **_RUN_KW
+                    )
+                    stdout, _ = await proc.communicate()
+                    if b'No rules match the specified criteria' in stdout:
+                        logger.warning('Reinstating rule: %s', rule['name'])
+                        await loop.run_in_executor(None, self.add_rule, rule)
             except Exception as e:
-                print(f"Error updating rule {rule.get('name', '')}: {str(e)}")
+                logger.error('Error updating rule %s: %s', rule.get('name', ''), e)
     
     def cleanup(self) -> bool:
         """Stop monitoring and cleanup"""
         self.enabled = False
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=2)
-        self.save_config()
+        if self.monitor_task:
+            self.monitor_task.cancel()
+            self.monitor_task = None
+            
+        # Flush any pending write synchronously. Cleanup can run off the Qt
+        # main thread, where the save timer can't be touched; if it still
+        # fires it finds nothing dirty
+        if (self._save_timer is not None
+                and QThread.currentThread() is self._save_timer.thread()):
+            self._save_timer.stop()
+        with self._save_lock:
+            if self._save_fallback_timer is not None:
+                self._save_fallback_timer.cancel()
+        self._do_save()
         return True
@@ -1,8 +1,10 @@
 import logging
+import os
 import threading
-from typing import Dict, List, Set, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+import time
+from typing import Deque, Dict, FrozenSet, List, Optional, Union
+from collections import defaultdict, deque
+from pathlib import Path
 from wifi_fortress.core.plugin_loader import Plugin
 
 logger = logging.getLogger(__name__)
@@ -12,7 +14,7 @@ class IntrusionEvent:
         self.event_type = event_type
         self.source = source
         self.details = details
-        self.timestamp = datetime.now()
+        self.timestamp = time.monotonic()
 
 class IntrusionDetector(Plugin):
     """Intrusion Detection System plugin for WiFi Fortress"""
@@ -22,18 +24,35 @@ class IntrusionDetector(Plugin):
     version = '1.0.0'
     author = 'WiFi Fortress Team'
     
-    def __init__(self):
+    _STRIPE_COUNT = 32  # Power of two, see _stripe
+    
+    def __init__(self, data_dir: Optional[Union[str, Path]] = None):
+        """Initialize the intrusion detector
+        
+        Args:
+            data_dir: Directory for the known device and blacklist files,
+                defaults to ~/.wifi_fortress
+        """
         super().__init__()
-        self._events: List[IntrusionEvent] = []
-        self._known_devices: Set[str] = set()
-        self._connection_attempts: Dict[str, List[datetime]] = defaultdict(list)
-        self._blacklist: Set[str] = set()
-        self._lock = threading.Lock()
+        if data_dir is None:
+            data_dir = os.path.expanduser('~/.wifi_fortress')
+        self._known_devices_file = Path(data_dir) / 'known_devices.txt'
+        self._blacklist_file = Path(data_dir) / 'blacklist.txt'
+        self._max_events_stored = 1000     # Maximum events to keep in memory
+        self._events: Deque[IntrusionEvent] = deque(maxlen=self._max_events_stored)
+        # Device sets are immutable and replaced on change, so hot-path
+        # membership checks can read them without taking the lock
+        self._known_devices: FrozenSet[str] = frozenset()
+        self._connection_attempts: Dict[str, Deque[float]] = defaultdict(deque)
+        self._blacklist: FrozenSet[str] = frozenset()
+        self._lock = threading.RLock()  # Guards events and device set updates
+        # Connection attempts are guarded per MAC by one of a fixed set of
+        # striped locks, so unrelated devices don't contend with each other
+        self._stripes = [threading.Lock() for _ in range(self._STRIPE_COUNT)]
         
         # Detection thresholds
         self._max_connection_attempts = 5  # Max attempts in time window
         self._connection_window = 300      # 5 minutes
-        self._max_events_stored = 1000     # Maximum events to keep in memory
         
     def initialize(self) -> bool:
         """Initialize the intrusion detector"""
@@ -43,7 +62,7 @@ class IntrusionDetector(Plugin):
             self._load_blacklist()
             return True
         except Exception as e:
-            logger.error(f'Failed to initialize intrusion detector: {e}')
+            logger.error('Failed to initialize intrusion detector: %s', e)
             return False
             
     def cleanup(self) -> bool:
@@ -53,7 +72,7 @@ class IntrusionDetector(Plugin):
             self._save_blacklist()
             return True
         except Exception as e:
-            logger.error(f'Error during cleanup: {e}')
+            logger.error('Error during cleanup: %s', e)
             return False
             
     def analyze_connection(self, mac_address: str, ip_address: str,
@@ -65,39 +84,44 @@ class IntrusionDetector(Plugin):
             ip_address: Device IP address
             rssi: Received Signal Strength Indicator (optional)
         """
-        with self._lock:
-            # Check if device is blacklisted
-            if mac_address in self._blacklist:
-                self._log_event('BlacklistedDeviceAttempt', mac_address, {
-                    'ip_address': ip_address,
-                    'rssi': rssi
-                })
-                return
-                
+        # Check if device is blacklisted
+        if mac_address in self._blacklist:
+            self._log_event('BlacklistedDeviceAttempt', mac_address, {
+                'ip_address': ip_address,
+                'rssi': rssi
+            })
+            return
+            
+        with self._stripe(mac_address):
             # Record connection attempt
-            now = datetime.now()
-            self._connection_attempts[mac_address].append(now)
+            now = time.monotonic()
+            attempts = self._connection_attempts[mac_address]
+            attempts.append(now)
             
             # Clean old attempts
-            cutoff = now - timedelta(seconds=self._connection_window)
-            self._connection_attempts[mac_address] = [
-                attempt for attempt in self._connection_attempts[mac_address]
-                if attempt > cutoff
-            ]
-            
-            # Check for excessive attempts
-            if len(self._connection_attempts[mac_address]) > self._max_connection_attempts:
-                self._log_event('ExcessiveConnectionAttempts', mac_address, {
-                    'ip_address': ip_address,
-                    'attempt_count': len(self._connection_attempts[mac_address]),
-                    'window_seconds': self._connection_window
-                })
-                self.blacklist_device(mac_address, 'Excessive connection attempts')
-                
-            # Check for suspicious behavior
-            if mac_address not in self._known_devices:
-                self._check_suspicious_behavior(mac_address, ip_address, rssi)
+            cutoff = now - self._connection_window
+            while attempts and attempts[0] <= cutoff:
+                attempts.popleft()
+            
+            attempt_count = len(attempts)
+            
+        # Check for excessive attempts
+        if attempt_count > self._max_connection_attempts:
+            self._log_event('ExcessiveConnectionAttempts', mac_address, {
+                'ip_address': ip_address,
+                'attempt_count': attempt_count,
+                'window_seconds': self._connection_window
+            })
+            self.blacklist_device(mac_address, 'Excessive connection attempts')
+            
+        # Check for suspicious behavior
+        if mac_address not in self._known_devices:
+            self._check_suspicious_behavior(mac_address, ip_address, rssi)
                 
+    def _stripe(self, mac_address: str) -> threading.Lock:
+        """Get the lock guarding a device's connection attempts"""
+        return self._stripes[hash(mac_address) & (self._STRIPE_COUNT - 1)]
+        
     def _check_suspicious_behavior(self, mac_address: str, ip_address: str,
                                  rssi: Optional[int]) -> None:
         """Check for suspicious behavior patterns
@@ -139,11 +163,13 @@ class IntrusionDetector(Plugin):
             reason: Reason for blacklisting
         """
         with self._lock:
-            if mac_address not in self._blacklist:
-                self._blacklist.add(mac_address)
-                self._log_event('DeviceBlacklisted', mac_address, {
-                    'reason': reason
-                })
+            if mac_address in self._blacklist:
+                return
+            self._blacklist = self._blacklist | {mac_address}
+            
+        self._log_event('DeviceBlacklisted', mac_address, {
+            'reason': reason
+        })
                 
     def whitelist_device(self, mac_address: str) -> None:
         """Remove device from blacklist and add to known devices
@@ -152,9 +178,10 @@ class IntrusionDetector(Plugin):
             mac_address: Device MAC address
         """
         with self._lock:
-            self._blacklist.discard(mac_address)
-            self._known_devices.add(mac_address)
-            self._log_event('DeviceWhitelisted', mac_address, {})
+            self._blacklist = self._blacklist - {mac_address}
+            self._known_devices = self._known_devices | {mac_address}
+            
+        self._log_event('DeviceWhitelisted', mac_address, {})
             
     def _log_event(self, event_type: str, source: str, details: Dict) -> None:
         """Log an intrusion detection event
@@ -164,18 +191,15 @@ class IntrusionDetector(Plugin):
             source: Source of the event (usually MAC address)
             details: Additional event details
         """
+        event = IntrusionEvent(event_type, source, details)
         with self._lock:
-            event = IntrusionEvent(event_type, source, details)
             self._events.append(event)
             
-            # Trim old events if needed
-            if len(self._events) > self._max_events_stored:
-                self._events = self._events[-self._max_events_stored:]
-                
-            logger.warning(
-                f'Intrusion Detection Event: {event_type} from {source}'
-                f' - Details: {details}'
-            )
+        # Log outside the lock so a slow handler can't stall other callers
+        logger.warning(
+            'Intrusion Detection Event: %s from %s - Details: %s',
+            event_type, source, details
+        )
             
     def get_recent_events(self, minutes: int = 60) -> List[IntrusionEvent]:
         """Get recent intrusion events
@@ -186,29 +210,64 @@ class IntrusionDetector(Plugin):
         Returns:
             List of recent IntrusionEvent objects
         """
+        cutoff = time.monotonic() - minutes * 60
+        recent = []
         with self._lock:
-            cutoff = datetime.now() - timedelta(minutes=minutes)
-            return [
-                event for event in self._events
-                if event.timestamp > cutoff
-            ]
+            # Events are appended in time order, so walk back from the newest
+            # and stop at the cutoff instead of copying the whole history
+            for event in reversed(self._events):
+                if event.timestamp <= cutoff:
+                    break
+                recent.append(event)
+                
+        recent.reverse()
+        return recent
             
     def _load_known_devices(self) -> None:
         """Load known devices from storage"""
-        # Implementation would load from persistent storage
-        pass
+        self._known_devices = self._load_mac_set(self._known_devices_file)
         
     def _save_known_devices(self) -> None:
         """Save known devices to storage"""
-        # Implementation would save to persistent storage
-        pass
+        self._save_mac_set(self._known_devices_file, self._known_devices)
         
     def _load_blacklist(self) -> None:
         """Load blacklist from storage"""
-        # Implementation would load from persistent storage
-        pass
+        self._blacklist = self._load_mac_set(self._blacklist_file)
         
     def _save_blacklist(self) -> None:
         """Save blacklist to storage"""
-        # Implementation would save to persistent storage
-        pass
+        self._save_mac_set(self._blacklist_file, self._blacklist)
+        
+    @staticmethod
+    def _load_mac_set(path: Path) -> FrozenSet[str]:
+        """Read a newline-delimited MAC address file in a single read
+        
+        Args:
+            path: File to read
+            
+        Returns:
+            Set of MAC addresses, empty if the file doesn't exist
+        """
+        try:
+            with open(path, 'r') as f:
+                return frozenset(f.read().split())
+        except FileNotFoundError:
+            return frozenset()
+            
+    @staticmethod
+    def _save_mac_set(path: Path, macs: FrozenSet[str]) -> None:
+        """Write a MAC address set as one address per line
+        
+        The set is written to a temporary file and renamed into place so a
+        crash mid-save can't leave a truncated list behind.
+        
+        Args:
+            path: File to write
+            macs: MAC addresses to save
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            f.write(''.join(mac + '\n' for mac in sorted(macs)))
+        os.replace(tmp_path, path)
@@ -2,14 +2,15 @@ from ..core.plugin_loader import Plugin
 from ..utils.network_utils import (
     get_network_interfaces,
     get_wifi_signal_strength,
-    get_network_usage,
     format_bytes
 )
 from ..gui.dashboard import SecurityAlertsWidget, DashboardWidget
+from ..core.poller import get_net_stats_poller
+from ..core.event_loop import get_background_loop
 from PyQt5.QtWidgets import QApplication, QMainWindow
-from threading import Thread, Event
-import time
-from typing import Dict, List
+from concurrent.futures import Future
+from typing import Dict, List, Optional
+import asyncio
 import logging
 import json
 
@@ -22,9 +23,9 @@ class NetworkMonitor(Plugin):
     def __init__(self):
         super().__init__()
         self.interfaces: List[Dict] = []
-        self.monitor_thread = None
-        self.stop_event = Event()
         self.interface_stats: Dict[str, Dict] = {}
+        self._signal_strength: Dict[str, Optional[int]] = {}  # Interface -> last signal read
+        self._signal_refresh: Optional[Future] = None  # In-flight signal read
         self.alert_thresholds = {
             'signal_strength': 30,  # Alert if signal strength below 30%
             'error_rate': 0.01,    # Alert if error rate above 1%
@@ -56,62 +57,85 @@ class NetworkMonitor(Plugin):
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to initialize network monitor: {str(e)}")
+            self.logger.error('Failed to initialize network monitor: %s', e)
             return False
             
     def start_monitoring(self):
         """Start monitoring network interfaces"""
-        if not self.enabled or self.monitor_thread:
+        if not self.enabled:
             return
             
-        def monitor_worker():
-            while not self.stop_event.is_set():
-                try:
-                    for interface in self.interfaces:
-                        iface_name = interface['name']
-                        
-                        # Get current stats
-                        usage = get_network_usage(iface_name)
-                        signal = get_wifi_signal_strength(iface_name)
-                        
-                        # Calculate rates and store stats
-                        if iface_name in self.interface_stats:
-                            prev_stats = self.interface_stats[iface_name]
-                            total_packets = (usage['packets_sent'] + usage['packets_recv'] - 
-                                          prev_stats['packets_sent'] - prev_stats['packets_recv'])
-                            
-                            if total_packets > 0:
-                                error_rate = (usage['errin'] + usage['errout'] - 
-                                            prev_stats['errin'] - prev_stats['errout']) / total_packets
-                                dropout_rate = (usage['dropin'] + usage['dropout'] - 
-                                              prev_stats['dropin'] - prev_stats['dropout']) / total_packets
-                                
-                                # Check thresholds and generate alerts
-                                self.check_thresholds(iface_name, {
-                                    'signal_strength': signal,
-                                    'error_rate': error_rate,
-                                    'dropout_rate': dropout_rate
-                                })
-                        
-                        # Update stats
-                        self.interface_stats[iface_name] = {
-                            'timestamp': time.time(),
-                            'signal_strength': signal,
-                            **usage
-                        }
-                        
-                        # Log current status
-                        self.log_interface_status(iface_name)
-                        
-                    time.sleep(5)  # Update every 5 seconds
-                except Exception as e:
-                    self.logger.error(f"Error in monitor worker: {str(e)}")
-                    time.sleep(10)  # Wait longer on error
+        # Sample every 5 seconds on the shared poller
+        get_net_stats_poller().subscribe(self._on_net_stats, interval=5.0)
+        
+    def _on_net_stats(self, timestamp: float, all_stats: Dict) -> None:
+        """Update interface stats from a shared poller sample
+        
+        Args:
+            timestamp: time.monotonic() when the sample was taken
+            all_stats: Per-interface psutil counters
+        """
+        self._schedule_signal_refresh()
+        for interface in self.interfaces:
+            iface_name = interface['name']
+            
+            # Get current stats
+            counters = all_stats.get(iface_name)
+            if counters is None:
+                continue
+            usage = counters._asdict()
+            signal = self._signal_strength.get(iface_name)
+            
+            # Calculate rates and store stats
+            if iface_name in self.interface_stats:
+                prev_stats = self.interface_stats[iface_name]
+                total_packets = (usage['packets_sent'] + usage['packets_recv'] - 
+                              prev_stats['packets_sent'] - prev_stats['packets_recv'])
+                
+                if total_packets > 0:
+                    error_rate = (usage['errin'] + usage['errout'] - 
+                                prev_stats['errin'] - prev_stats['errout']) / total_packets
+                    dropout_rate = (usage['dropin'] + usage['dropout'] - 
+                                  prev_stats['dropin'] - prev_stats['dropout']) / total_packets
                     
-        self.monitor_thread = Thread(target=monitor_worker)
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
+                    # Check thresholds and generate alerts
+                    self.check_thresholds(iface_name, {
+                        'signal_strength': signal,
+                        'error_rate': error_rate,
+                        'dropout_rate': dropout_rate
+                    })
+            
+            # Update stats
+            self.interface_stats[iface_name] = {
+                'timestamp': timestamp,
+                'signal_strength': signal,
+                **usage
+            }
+            
+            # Log current status
+            self.log_interface_status(iface_name)
+        
+    def _schedule_signal_refresh(self) -> None:
+        """Read signal strengths on the background loop
+        
+        get_wifi_signal_strength can fall back to running iwconfig, so it is
+        kept off the shared poller thread. Samples use the last values read.
+        """
+        if self._signal_refresh is not None and not self._signal_refresh.done():
+            return
+        self._signal_refresh = asyncio.run_coroutine_threadsafe(
+            self._read_signal_strengths(), get_background_loop()
+        )
         
+    async def _read_signal_strengths(self) -> None:
+        """Read the signal strength of every monitored interface"""
+        loop = asyncio.get_running_loop()
+        for interface in self.interfaces:
+            iface_name = interface['name']
+            self._signal_strength[iface_name] = await loop.run_in_executor(
+                None, get_wifi_signal_strength, iface_name
+            )
+            
     def check_thresholds(self, interface: str, metrics: Dict):
         """Check if any metrics exceed their thresholds"""
         if not metrics:
@@ -145,10 +169,13 @@ class NetworkMonitor(Plugin):
         """Add alert to dashboard"""
         if self.alerts_widget:
             self.alerts_widget.add_alert(level, self.name, message)
-        self.logger.warning(f"{level} alert: {message}")
+        self.logger.warning('%s alert: %s', level, message)
         
     def log_interface_status(self, interface: str):
         """Log current interface status"""
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+            
         stats = self.interface_stats[interface]
         status = {
             'interface': interface,
@@ -158,13 +185,13 @@ class NetworkMonitor(Plugin):
             'errors': stats['errin'] + stats['errout'],
             'drops': stats['dropin'] + stats['dropout']
         }
-        self.logger.info(json.dumps(status, indent=2))
+        self.logger.info(json.dumps(status, separators=(',', ':')))
 
     def cleanup(self) -> bool:
         """Stop monitoring and cleanup"""
         self.enabled = False
-        self.stop_event.set()
-        if self.monitor_thread:
-            self.monitor_thread.join(timeout=5)
-            self.monitor_thread = None
+        get_net_stats_poller().unsubscribe(self._on_net_stats)
+        if self._signal_refresh is not None:
+            self._signal_refresh.cancel()
+            self._signal_refresh = None
         return True
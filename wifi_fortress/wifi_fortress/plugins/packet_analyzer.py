@@ -1,12 +1,50 @@
 from wifi_fortress.core.plugin_loader import Plugin
 import scapy.all as scapy
-from threading import Thread
-from typing import Dict, List, Set
+import queue
+from collections import OrderedDict, deque
+from threading import Lock, Thread
+from typing import Deque, Dict, List, Optional, Set, Tuple
 import time
 from datetime import datetime
 import json
-from cryptography.fernet import Fernet
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 import os
+import logging
+
+# Layer classes bound once to skip module attribute lookups per packet
+_Dot11 = scapy.Dot11
+_Dot11Deauth = scapy.Dot11Deauth
+_Dot11Beacon = scapy.Dot11Beacon
+_Dot11Elt = scapy.Dot11Elt
+_ARP = scapy.ARP
+
+# Kernel-side capture filters. libpcap only accepts 802.11 frame types on
+# 802.11 links, so other links (Ethernet, managed-mode Wi-Fi) only get ARP
+_ARP_FILTER = 'arp'
+_DOT11_FILTER = 'arp or (type mgt and (subtype deauth or subtype beacon))'
+
+# ARPHRD_IEEE80211, ARPHRD_IEEE80211_PRISM and ARPHRD_IEEE80211_RADIOTAP
+_DOT11_LINK_TYPES = frozenset({801, 802, 803})
+_SYS_CLASS_NET_TYPE = '/sys/class/net/{}/type'
+
+def _capture_filter(iface: str) -> str:
+    """Get the capture filter for an interface's link type
+    
+    Args:
+        iface: Interface name
+        
+    Returns:
+        Filter with the 802.11 management clause on monitor-mode links,
+        ARP only elsewhere or when the link type can't be read
+    """
+    try:
+        with open(_SYS_CLASS_NET_TYPE.format(iface)) as f:
+            link_type = int(f.read())
+    except (OSError, ValueError):
+        return _ARP_FILTER
+    return _DOT11_FILTER if link_type in _DOT11_LINK_TYPES else _ARP_FILTER
+
+logger = logging.getLogger(__name__)
 
 class PacketAnalyzer(Plugin):
     name = 'Packet Analyzer'
@@ -16,9 +54,13 @@ class PacketAnalyzer(Plugin):
     
     def __init__(self):
         super().__init__()
-        self.analyzer_thread = None
+        self.sniffer = None
         self.suspicious_ips: Set[str] = set()
         self.packet_stats: Dict[str, Dict] = {}
+        self._expiry: Deque[Tuple[float, str]] = deque()  # (queued at, BSSID), oldest first
+        self._stats_ttl = 300  # seconds
+        self._expiry_granularity = 10  # seconds between expiry records for a BSSID
+        self._max_ssids_per_bssid = 64
         self.attack_patterns = {
             'deauth': 0,
             'beacon_flood': 0,
@@ -26,6 +68,14 @@ class PacketAnalyzer(Plugin):
         }
         self.log_file = 'packet_analysis.log'
         self.encryption_key = None
+        self._aead = None
+        self._mac_cache: Dict[str, Tuple[Optional[str], float]] = {}  # IP -> (MAC, lookup time)
+        self._mac_cache_ttl = 60  # seconds
+        self._mac_cache_lock = Lock()
+        self._log_queue: queue.Queue = queue.Queue(maxsize=10000)
+        self._log_batch_size = 64
+        self._log_thread = None
+        self._log_fd = None
         
     def initialize(self) -> bool:
         """Initialize the packet analyzer"""
@@ -35,132 +85,250 @@ class PacketAnalyzer(Plugin):
             if os.path.exists(key_file):
                 with open(key_file, 'rb') as f:
                     self.encryption_key = f.read()
-            else:
-                self.encryption_key = Fernet.generate_key()
+                if len(self.encryption_key) != 32:
+                    # Key left over from the old Fernet log format; move it
+                    # and the log it wrote aside together so the old log
+                    # stays readable and new records start a fresh file
+                    os.replace(key_file, key_file + '.old')
+                    if os.path.exists(self.log_file):
+                        os.replace(self.log_file, self.log_file + '.old')
+                    logger.info('Rotated Fernet-encrypted packet analysis log to %s.old',
+                                self.log_file)
+                    self.encryption_key = None
+            if not self.encryption_key:
+                self.encryption_key = AESGCM.generate_key(bit_length=256)
                 with open(key_file, 'wb') as f:
                     f.write(self.encryption_key)
             
-            self.cipher_suite = Fernet(self.encryption_key)
+            self._aead = AESGCM(self.encryption_key)
+            
+            # Keep the log open for the plugin's lifetime, only the writer
+            # thread appends to it
+            if not self._log_fd:
+                self._log_fd = open(self.log_file, 'ab', buffering=0)
+            
+            # Encrypt and write security events off the capture thread
+            if not self._log_thread:
+                self._log_thread = Thread(target=self._log_worker, name='packet_analyzer_log')
+                self._log_thread.daemon = True
+                self._log_thread.start()
             return True
         except Exception as e:
-            print(f"Failed to initialize packet analyzer: {str(e)}")
+            logger.error('Failed to initialize packet analyzer: %s', e)
             return False
     
     def start_analysis(self):
         """Start packet analysis"""
-        if not self.enabled:
+        if not self.enabled or self.sniffer:
             return
             
-        def analyze_worker():
-            while self.enabled:
-                try:
-                    # Sniff packets
-                    packets = scapy.sniff(count=100, timeout=5)
-                    self.analyze_packets(packets)
-                except Exception as e:
-                    print(f"Error in packet analysis: {str(e)}")
-                    time.sleep(5)
-                    
-        self.analyzer_thread = Thread(target=analyze_worker)
-        self.analyzer_thread.daemon = True
-        self.analyzer_thread.start()
+        # Let the kernel drop everything the detectors don't look at and
+        # handle each packet as it arrives instead of buffering batches
+        iface = str(scapy.conf.iface)
+        self.sniffer = scapy.AsyncSniffer(
+            iface=iface,
+            filter=_capture_filter(iface),
+            store=False,
+            prn=self.analyze_packet
+        )
+        self.sniffer.start()
         
     def analyze_packets(self, packets: List[scapy.Packet]):
         """Analyze captured packets for security threats"""
         for packet in packets:
-            try:
-                # Check for deauthentication attacks
-                if packet.haslayer(scapy.Dot11Deauth):
-                    self.attack_patterns['deauth'] += 1
-                    self.log_security_event('Potential deauthentication attack detected')
-                
-                # Check for beacon frame flooding
-                elif packet.haslayer(scapy.Dot11Beacon):
-                    if self.detect_beacon_flood(packet):
-                        self.attack_patterns['beacon_flood'] += 1
-                        self.log_security_event('Potential beacon flooding attack detected')
-                
-                # Check for ARP spoofing
-                elif packet.haslayer(scapy.ARP):
-                    if self.detect_arp_spoof(packet):
-                        self.attack_patterns['arp_spoof'] += 1
-                        self.log_security_event('Potential ARP spoofing attack detected')
-                
-                # Update packet statistics
-                self.update_packet_stats(packet)
-                
-            except Exception as e:
-                print(f"Error analyzing packet: {str(e)}")
-    
-    def detect_beacon_flood(self, packet: scapy.Packet) -> bool:
-        """Detect beacon frame flooding attacks"""
+            self.analyze_packet(packet)
+            
+    def analyze_packet(self, packet: scapy.Packet):
+        """Analyze a single packet for security threats"""
         try:
-            ssid = packet[scapy.Dot11Elt].info.decode()
-            bssid = packet[scapy.Dot11].addr3
+            # Check for deauthentication attacks
+            if packet.getlayer(_Dot11Deauth) is not None:
+                self.attack_patterns['deauth'] += 1
+                self.log_security_event('Potential deauthentication attack detected')
             
-            # Check for suspicious number of different SSIDs from same BSSID
-            if bssid not in self.packet_stats:
-                self.packet_stats[bssid] = {'ssids': set(), 'last_seen': time.time()}
+            # Check for beacon frame flooding
+            elif packet.getlayer(_Dot11Beacon) is not None:
+                if self.detect_beacon_flood(packet, packet.getlayer(_Dot11)):
+                    self.attack_patterns['beacon_flood'] += 1
+                    self.log_security_event('Potential beacon flooding attack detected')
             
-            self.packet_stats[bssid]['ssids'].add(ssid)
+            # Check for ARP spoofing
+            else:
+                arp = packet.getlayer(_ARP)
+                if arp is not None and self.detect_arp_spoof(packet, arp):
+                    self.attack_patterns['arp_spoof'] += 1
+                    self.log_security_event('Potential ARP spoofing attack detected')
             
-            # If more than 10 different SSIDs from same BSSID in short time, flag as suspicious
-            if len(self.packet_stats[bssid]['ssids']) > 10:
-                return True
-        except Exception:
-            pass
-        return False
+            # Update packet statistics
+            self.update_packet_stats(packet)
+            
+        except Exception as e:
+            logger.error('Error analyzing packet: %s', e)
+    
+    def detect_beacon_flood(self, packet: scapy.Packet,
+                            dot11: Optional[scapy.Packet] = None) -> bool:
+        """Detect beacon frame flooding attacks"""
+        if dot11 is None:
+            dot11 = packet.getlayer(_Dot11)
+        elt = packet.getlayer(_Dot11Elt)
+        if dot11 is None or elt is None:
+            return False
+            
+        # Compare raw SSID bytes, radio data often isn't valid UTF-8
+        ssid = elt.info
+        bssid = dot11.addr3
+        
+        # Check for suspicious number of different SSIDs from same BSSID
+        now = time.monotonic()
+        stats = self.packet_stats.get(bssid)
+        if stats is None:
+            stats = self.packet_stats[bssid] = {
+                'ssids': OrderedDict(), 'last_seen': now, 'queued': now
+            }
+            self._expiry.append((now, bssid))
+        else:
+            stats['last_seen'] = now
+            # Queue a newer expiry record now and then rather than per beacon;
+            # records are always appended with the current time, so the
+            # queue stays in time order
+            if now - stats['queued'] >= self._expiry_granularity:
+                stats['queued'] = now
+                self._expiry.append((now, bssid))
+        
+        # Keep the most recently seen SSIDs so a flood can't grow this without bound
+        ssids = stats['ssids']
+        if ssid in ssids:
+            ssids.move_to_end(ssid)
+        else:
+            ssids[ssid] = None
+            if len(ssids) > self._max_ssids_per_bssid:
+                ssids.popitem(last=False)
+        
+        # If more than 10 different SSIDs from same BSSID in short time, flag as suspicious
+        return len(ssids) > 10
     
-    def detect_arp_spoof(self, packet: scapy.Packet) -> bool:
+    def detect_arp_spoof(self, packet: scapy.Packet,
+                         arp: Optional[scapy.Packet] = None) -> bool:
         """Detect ARP spoofing attacks"""
-        if packet[scapy.ARP].op == 2:  # ARP Reply
+        if arp is None:
+            arp = packet.getlayer(_ARP)
+        if arp.op == 2:  # ARP Reply
             try:
-                real_mac = scapy.getmacbyip(packet[scapy.ARP].psrc)
-                response_mac = packet[scapy.ARP].hwsrc
+                real_mac = self._cached_getmacbyip(arp.psrc)
+                response_mac = arp.hwsrc
                 
                 if real_mac and real_mac != response_mac:
-                    self.suspicious_ips.add(packet[scapy.ARP].psrc)
+                    self.suspicious_ips.add(arp.psrc)
                     return True
             except Exception:
                 pass
         return False
     
+    def _cached_getmacbyip(self, ip: str) -> Optional[str]:
+        """Resolve the MAC address for an IP, caching results for a short time
+        
+        scapy.getmacbyip sends an ARP request on the wire, which is far too
+        slow to do for every ARP reply seen.
+        """
+        now = time.monotonic()
+        cached = self._mac_cache.get(ip)
+        if cached is not None and now - cached[1] < self._mac_cache_ttl:
+            return cached[0]
+            
+        mac = scapy.getmacbyip(ip)
+        with self._mac_cache_lock:
+            self._mac_cache[ip] = (mac, now)
+        return mac
+    
     def update_packet_stats(self, packet: scapy.Packet):
         """Update packet statistics"""
-        timestamp = time.time()
+        timestamp = time.monotonic()
         
-        # Clean old entries
-        for addr in list(self.packet_stats.keys()):
-            if timestamp - self.packet_stats[addr]['last_seen'] > 300:  # 5 minutes
+        # Clean old entries, only looking at the ones queued longest ago.
+        # Only an entry's newest record counts, older ones are skipped. A
+        # sighting more than the granularity after that record would have
+        # queued a newer one, so once the newest record is older than the
+        # TTL plus the granularity the entry has expired.
+        expiry = self._expiry
+        horizon = self._stats_ttl + self._expiry_granularity
+        while expiry and timestamp - expiry[0][0] > horizon:
+            queued, addr = expiry.popleft()
+            stats = self.packet_stats.get(addr)
+            if stats is not None and stats['queued'] == queued:
                 del self.packet_stats[addr]
     
     def log_security_event(self, event: str):
-        """Log security events with encryption"""
+        """Queue a security event to be encrypted and logged"""
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        log_entry = {
+            'timestamp': timestamp,
+            'event': event,
+            'attack_patterns': self.attack_patterns.copy(),
+            'suspicious_ips': list(self.suspicious_ips)
+        }
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            log_entry = {
-                'timestamp': timestamp,
-                'event': event,
-                'attack_patterns': self.attack_patterns.copy(),
-                'suspicious_ips': list(self.suspicious_ips)
-            }
-            
-            # Encrypt the log entry
-            encrypted_data = self.cipher_suite.encrypt(
-                json.dumps(log_entry).encode()
+            self._log_queue.put_nowait(log_entry)
+        except queue.Full:
+            # Drop rather than stall packet capture when the writer falls behind
+            pass
+        logger.warning('Security Event: %s', event)
+    
+    def _log_worker(self):
+        """Drain queued events, writing them in encrypted batches"""
+        running = True
+        while running:
+            entry = self._log_queue.get()
+            if entry is None:
+                break
+            batch = [entry]
+            while len(batch) < self._log_batch_size:
+                try:
+                    entry = self._log_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is None:
+                    running = False
+                    break
+                batch.append(entry)
+            self._write_log_batch(batch)
+    
+    def _write_log_batch(self, batch: List[Dict]):
+        """Encrypt a batch of events as one record and append it to the log
+        
+        Records are binary: a 4-byte big-endian ciphertext length, the
+        12-byte AES-GCM nonce, then the ciphertext. Decrypted, a record
+        holds one JSON event per line.
+        """
+        try:
+            nonce = os.urandom(12)
+            ciphertext = self._aead.encrypt(
+                nonce,
+                '\n'.join(json.dumps(entry) for entry in batch).encode(),
+                None
             )
-            
-            # Write encrypted log
-            with open(self.log_file, 'ab') as f:
-                f.write(encrypted_data + b'\n')
-                
-            print(f"Security Event: {event}")
+            self._log_fd.write(len(ciphertext).to_bytes(4, 'big') + nonce + ciphertext)
         except Exception as e:
-            print(f"Error logging security event: {str(e)}")
+            logger.error('Error logging security event: %s', e)
     
     def cleanup(self) -> bool:
         """Stop analysis and cleanup"""
         self.enabled = False
-        if self.analyzer_thread:
-            self.analyzer_thread.join(timeout=2)
+        if self.sniffer:
+            try:
+                self.sniffer.stop()
+            except Exception as e:
+                logger.error('Error stopping packet capture: %s', e)
+            self.sniffer = None
+            
+        # Flush queued events and stop the writer
+        if self._log_thread:
+            try:
+                self._log_queue.put(None, timeout=2)
+            except queue.Full:
+                pass
+            self._log_thread.join(timeout=2)
+            self._log_thread = None
+        if self._log_fd:
+            self._log_fd.close()
+            self._log_fd = None
         return True
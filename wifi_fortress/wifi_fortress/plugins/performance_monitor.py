@@ -1,17 +1,17 @@
 import psutil
 import time
 import logging
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
-from collections import deque
-from threading import Lock, Thread, Event
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from threading import Lock
 from wifi_fortress.core.plugin_loader import Plugin
+from wifi_fortress.core.poller import get_net_stats_poller
 
 logger = logging.getLogger(__name__)
 
 class NetworkStats:
     def __init__(self):
-        self.timestamp = datetime.now()
+        self.timestamp = time.monotonic()
         self.bytes_sent = 0
         self.bytes_recv = 0
         self.packets_sent = 0
@@ -21,6 +21,68 @@ class NetworkStats:
         self.dropin = 0
         self.dropout = 0
 
+class NetworkStatsHistory:
+    """Fixed-size ring of NetworkStats samples stored one array per field
+    
+    Samples are written in place, so the history never allocates after
+    construction and queries over it are vectorized NumPy operations.
+    Queries return copies, so the poller can keep writing while callers
+    hold on to their results.
+    """
+    
+    FIELDS = ('bytes_sent', 'bytes_recv', 'packets_sent', 'packets_recv',
+              'errin', 'errout', 'dropin', 'dropout')
+    
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.write_idx = 0  # Total samples written, next slot is write_idx % capacity
+        self._lock = Lock()
+        self.timestamp = np.zeros(capacity, dtype=np.float64)
+        self.columns: Dict[str, np.ndarray] = {
+            field: np.zeros(capacity, dtype=np.float32) for field in self.FIELDS
+        }
+        
+    def __len__(self) -> int:
+        return min(self.write_idx, self.capacity)
+        
+    def append(self, stats: NetworkStats) -> None:
+        """Store a sample, overwriting the oldest one when full"""
+        with self._lock:
+            idx = self.write_idx % self.capacity
+            self.timestamp[idx] = stats.timestamp
+            for field, column in self.columns.items():
+                column[idx] = getattr(stats, field)
+            self.write_idx += 1
+        
+    def latest(self, field: str) -> float:
+        """Get the most recent value of a field"""
+        with self._lock:
+            return float(self.columns[field][(self.write_idx - 1) % self.capacity])
+        
+    def _ordered(self, column: np.ndarray) -> np.ndarray:
+        """Get a copy of a column's samples oldest first"""
+        if self.write_idx <= self.capacity:
+            return column[:self.write_idx].copy()
+        idx = self.write_idx % self.capacity
+        return np.concatenate((column[idx:], column[:idx]))
+        
+    def since(self, cutoff: float) -> Dict[str, np.ndarray]:
+        """Get samples taken at or after a monotonic time
+        
+        Args:
+            cutoff: time.monotonic() value of the oldest sample to include
+            
+        Returns:
+            Dict of field name (plus 'timestamp') to array, oldest first
+        """
+        with self._lock:
+            timestamps = self._ordered(self.timestamp)
+            start = int(np.searchsorted(timestamps, cutoff, side='left'))
+            history = {'timestamp': timestamps[start:]}
+            for field, column in self.columns.items():
+                history[field] = self._ordered(column)[start:]
+        return history
+
 class PerformanceMonitor(Plugin):
     """Network performance monitoring plugin"""
     
@@ -31,10 +93,9 @@ class PerformanceMonitor(Plugin):
     
     def __init__(self):
         super().__init__()
-        self._stats_history: Dict[str, deque] = {}  # Interface -> stats history
+        self._stats_history: Dict[str, NetworkStatsHistory] = {}  # Interface -> stats history
         self._lock = Lock()
-        self._stop_monitoring = Event()
-        self._monitor_thread: Optional[Thread] = None
+        self._last_check: Dict[str, Tuple] = {}  # Interface -> (sample time, counters)
         self._history_length = 3600  # Keep 1 hour of history (1 sample per second)
         self._alert_thresholds = {
             'error_rate': 0.01,  # 1% error rate
@@ -47,105 +108,114 @@ class PerformanceMonitor(Plugin):
         try:
             # Initialize stats for all network interfaces
             for interface in psutil.net_if_stats().keys():
-                self._stats_history[interface] = deque(maxlen=self._history_length)
+                self._stats_history[interface] = NetworkStatsHistory(self._history_length)
             
-            # Start monitoring thread
-            self._stop_monitoring.clear()
-            self._monitor_thread = Thread(
-                target=self._monitor_loop,
-                name='performance_monitor'
-            )
-            self._monitor_thread.daemon = True
-            self._monitor_thread.start()
+            # Sample on the shared poller alongside the other network monitors
+            self._last_check.clear()
+            get_net_stats_poller().subscribe(self._on_net_stats, interval=1.0)
             
             logger.info('Performance monitoring initialized')
             return True
         except Exception as e:
-            logger.error(f'Failed to initialize performance monitoring: {e}')
+            logger.error('Failed to initialize performance monitoring: %s', e)
             return False
             
     def cleanup(self) -> bool:
         """Stop monitoring and cleanup"""
         try:
-            if self._monitor_thread and self._monitor_thread.is_alive():
-                self._stop_monitoring.set()
-                self._monitor_thread.join(timeout=5)
+            get_net_stats_poller().unsubscribe(self._on_net_stats)
             return True
         except Exception as e:
-            logger.error(f'Error during cleanup: {e}')
+            logger.error('Error during cleanup: %s', e)
             return False
             
-    def _monitor_loop(self) -> None:
-        """Main monitoring loop"""
-        last_check = {}
-        while not self._stop_monitoring.is_set():
-            try:
-                current_stats = psutil.net_io_counters(pernic=True)
-                current_time = datetime.now()
-                
-                for interface, stats in current_stats.items():
-                    if interface not in self._stats_history:
-                        continue
-                        
-                    # Calculate rates if we have previous measurements
-                    if interface in last_check:
-                        last_time, last_stats = last_check[interface]
-                        time_diff = (current_time - last_time).total_seconds()
-                        
-                        if time_diff > 0:
-                            network_stats = NetworkStats()
-                            network_stats.timestamp = current_time
-                            network_stats.bytes_sent = (stats.bytes_sent - last_stats.bytes_sent) / time_diff
-                            network_stats.bytes_recv = (stats.bytes_recv - last_stats.bytes_recv) / time_diff
-                            network_stats.packets_sent = (stats.packets_sent - last_stats.packets_sent) / time_diff
-                            network_stats.packets_recv = (stats.packets_recv - last_stats.packets_recv) / time_diff
-                            network_stats.errin = stats.errin - last_stats.errin
-                            network_stats.errout = stats.errout - last_stats.errout
-                            network_stats.dropin = stats.dropin - last_stats.dropin
-                            network_stats.dropout = stats.dropout - last_stats.dropout
-                            
-                            with self._lock:
-                                self._stats_history[interface].append(network_stats)
-                            
-                            # Check for alerts
-                            self._check_alerts(interface, network_stats)
-                    
-                    # Update last check
-                    last_check[interface] = (current_time, stats)
+    def _on_net_stats(self, current_time: float, current_stats: Dict) -> None:
+        """Record a network counter sample from the shared poller
+        
+        Args:
+            current_time: time.monotonic() when the sample was taken
+            current_stats: Per-interface psutil counters
+        """
+        error_threshold = self._alert_thresholds['error_rate']
+        drop_threshold = self._alert_thresholds['drop_rate']
+        last_check = self._last_check
+        
+        for interface, stats in current_stats.items():
+            if interface not in self._stats_history:
+                continue
                 
-                time.sleep(1)  # Check every second
+            # Calculate rates if we have previous measurements
+            if interface in last_check:
+                last_time, last_stats = last_check[interface]
+                time_diff = current_time - last_time
                 
-            except Exception as e:
-                logger.error(f'Error in performance monitoring: {e}')
-                time.sleep(5)  # Wait before retrying
+                if time_diff > 0:
+                    network_stats = NetworkStats()
+                    network_stats.timestamp = current_time
+                    network_stats.bytes_sent = (stats.bytes_sent - last_stats.bytes_sent) / time_diff
+                    network_stats.bytes_recv = (stats.bytes_recv - last_stats.bytes_recv) / time_diff
+                    network_stats.packets_sent = (stats.packets_sent - last_stats.packets_sent) / time_diff
+                    network_stats.packets_recv = (stats.packets_recv - last_stats.packets_recv) / time_diff
+                    network_stats.errin = stats.errin - last_stats.errin
+                    network_stats.errout = stats.errout - last_stats.errout
+                    network_stats.dropin = stats.dropin - last_stats.dropin
+                    network_stats.dropout = stats.dropout - last_stats.dropout
+                    
+                    with self._lock:
+                        self._stats_history[interface].append(network_stats)
+                    
+                    # Check for alerts
+                    self._check_alerts(interface, network_stats,
+                                       error_threshold, drop_threshold)
+            
+            # Update last check
+            last_check[interface] = (current_time, stats)
                 
-    def _check_alerts(self, interface: str, stats: NetworkStats) -> None:
-        """Check performance metrics against thresholds"""
+    def _check_alerts(self, interface: str, stats: NetworkStats,
+                      error_threshold: Optional[float] = None,
+                      drop_threshold: Optional[float] = None) -> None:
+        """Check performance metrics against thresholds
+        
+        Args:
+            interface: Network interface name
+            stats: Latest stats sample for the interface
+            error_threshold: Error rate threshold, defaults to the configured one
+            drop_threshold: Drop rate threshold, defaults to the configured one
+        """
         try:
-            # Calculate error rate
             total_packets = stats.packets_sent + stats.packets_recv
-            if total_packets > 0:
-                error_rate = (stats.errin + stats.errout) / total_packets
-                if error_rate > self._alert_thresholds['error_rate']:
-                    logger.warning(
-                        f'High error rate on {interface}: {error_rate:.2%}'
-                    )
+            if total_packets <= 0:
+                return
+                
+            if error_threshold is None:
+                error_threshold = self._alert_thresholds['error_rate']
+            if drop_threshold is None:
+                drop_threshold = self._alert_thresholds['drop_rate']
+                
+            # Calculate error and drop rates
+            inv_total = 1.0 / total_packets
+            error_rate = (stats.errin + stats.errout) * inv_total
+            drop_rate = (stats.dropin + stats.dropout) * inv_total
             
-            # Calculate drop rate
-            if total_packets > 0:
-                drop_rate = (stats.dropin + stats.dropout) / total_packets
-                if drop_rate > self._alert_thresholds['drop_rate']:
-                    logger.warning(
-                        f'High packet drop rate on {interface}: {drop_rate:.2%}'
-                    )
-                    
+            if error_rate > error_threshold:
+                logger.warning(
+                    'High error rate on %s: %.2f%%', interface, error_rate * 100
+                )
+            if drop_rate > drop_threshold:
+                logger.warning(
+                    'High packet drop rate on %s: %.2f%%', interface, drop_rate * 100
+                )
+
         except Exception as e:
-            logger.error(f'Error checking alerts: {e}')
+            logger.error('Error checking alerts: %s', e)
             
     def get_interface_stats(self, interface: str, 
                            duration: int = 300) -> List[NetworkStats]:
         """Get interface statistics for the specified duration
         
+        Builds one object per sample, so periodic callers should use
+        get_interface_history and work on the arrays instead.
+        
         Args:
             interface: Network interface name
             duration: Duration in seconds (default: 5 minutes)
@@ -153,15 +223,35 @@ class PerformanceMonitor(Plugin):
         Returns:
             List of NetworkStats objects
         """
+        history = self.get_interface_history(interface, duration)
+        if not history:
+            return []
+            
+        fields = ('timestamp',) + NetworkStatsHistory.FIELDS
+        stats_list = []
+        for values in zip(*(history[field].tolist() for field in fields)):
+            stats = NetworkStats()
+            stats.__dict__.update(zip(fields, values))
+            stats_list.append(stats)
+        return stats_list
+        
+    def get_interface_history(self, interface: str,
+                              duration: int = 300) -> Dict[str, np.ndarray]:
+        """Get interface statistics for the specified duration as arrays
+        
+        Args:
+            interface: Network interface name
+            duration: Duration in seconds (default: 5 minutes)
+            
+        Returns:
+            Dict of NetworkStats field name to array of samples, oldest
+            first, or an empty dict for an unknown interface
+        """
         with self._lock:
             if interface not in self._stats_history:
-                return []
+                return {}
                 
-            cutoff_time = datetime.now() - timedelta(seconds=duration)
-            return [
-                stat for stat in self._stats_history[interface]
-                if stat.timestamp >= cutoff_time
-            ]
+            return self._stats_history[interface].since(time.monotonic() - duration)
             
     def get_current_bandwidth(self, interface: str) -> Dict[str, float]:
         """Get current bandwidth usage for interface
@@ -176,10 +266,10 @@ class PerformanceMonitor(Plugin):
             if interface not in self._stats_history or not self._stats_history[interface]:
                 return {'rx_mbps': 0.0, 'tx_mbps': 0.0}
                 
-            latest = self._stats_history[interface][-1]
+            history = self._stats_history[interface]
             return {
-                'rx_mbps': (latest.bytes_recv * 8) / 1_000_000,  # Convert to Mbps
-                'tx_mbps': (latest.bytes_sent * 8) / 1_000_000
+                'rx_mbps': history.latest('bytes_recv') * 8e-6,  # Convert to Mbps
+                'tx_mbps': history.latest('bytes_sent') * 8e-6
             }
             
     def set_alert_threshold(self, metric: str, value: float) -> bool:
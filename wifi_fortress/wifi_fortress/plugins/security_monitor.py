@@ -1,10 +1,74 @@
-from typing import Dict, List, Optional
-from datetime import datetime, timedelta
+from typing import Deque, Dict, Optional, Union
+from datetime import datetime
+from collections import deque
+from functools import lru_cache
+from ipaddress import IPv4Address
 import logging
+import time
+import numpy as np
+from scapy.config import conf as scapy_conf
 from wifi_fortress.core.plugin_loader import Plugin
 
 logger = logging.getLogger(__name__)
 
+_EVENT_RETENTION_NS = 60 * 60 * 1_000_000_000  # 1 hour
+
+# Separator positions of 'aa:bb:cc:dd:ee:ff' read as two little-endian
+# uint64s: bytes 2 and 5 of the first word, bytes 0, 3 and 6 of the second
+_MAC_SEP_MASK_LO = 0x0000ff0000ff0000
+_MAC_SEP_LO = 0x00003a00003a0000
+_MAC_SEP_MASK_HI = 0x00ff0000ff0000ff
+_MAC_SEP_HI = 0x003a00003a00003a
+
+def _validate_mac(mac: str) -> bool:
+    """Check a MAC address has the colon-separated 'aa:bb:cc:dd:ee:ff' shape
+    
+    Only the length and separators are checked, with two masked integer
+    compares; the hex digits are checked when the address is parsed.
+    """
+    if len(mac) != 17:
+        return False
+    b = mac.encode('ascii', 'replace')
+    lo = int.from_bytes(b[:8], 'little')
+    hi = int.from_bytes(b[8:16], 'little')
+    return (lo & _MAC_SEP_MASK_LO == _MAC_SEP_LO
+            and hi & _MAC_SEP_MASK_HI == _MAC_SEP_HI)
+
+@lru_cache(maxsize=4096)
+def _normalize_mac(mac: str) -> str:
+    """Normalize a MAC address to lowercase, colon-separated form"""
+    return mac.lower().replace('-', ':')
+
+@lru_cache(maxsize=4096)
+def _mac_key(mac: str) -> Union[int, str]:
+    """Get the 48-bit integer form of a normalized MAC address
+    
+    Falls back to the string itself for malformed addresses.
+    """
+    if not _validate_mac(mac):
+        return mac
+    try:
+        return int.from_bytes(bytes.fromhex(mac.replace(':', '')), 'big')
+    except ValueError:
+        return mac
+
+@lru_cache(maxsize=4096)
+def _oui_lookup(oui: str) -> Optional[str]:
+    """Look up the vendor registered for an OUI
+    
+    Args:
+        oui: First three octets of a normalized MAC address ('aa:bb:cc')
+        
+    Returns:
+        Vendor name, or None if the OUI isn't in the manufacturer database
+    """
+    try:
+        # lookup gives (short name, long name), or the OUI twice if unknown
+        vendor = scapy_conf.manufdb.lookup(oui)[1]
+    except Exception:
+        return None
+    return vendor if vendor and vendor != oui else None
+
 class SecurityMonitor(Plugin):
     """Security monitoring plugin for WiFi Fortress"""
     
@@ -15,9 +79,14 @@ class SecurityMonitor(Plugin):
     
     def __init__(self):
         super().__init__()
-        self._known_devices: Dict[str, datetime] = {}
-        self._suspicious_activity: List[Dict] = []
+        self._known_devices: Dict[Union[int, str], datetime] = {}  # MAC as int -> first seen
+        self._known_mac_arr: Optional[np.ndarray] = None  # Integer keys of _known_devices, built on demand
         self._alert_threshold = 5  # Number of suspicious events before alerting
+        # Only the last few windows' worth of events matter for alerting, so
+        # bound the buffer and let the deque evict the oldest on append
+        self._max_events = max(self._alert_threshold * 4, 64)
+        self._suspicious_activity: Deque[Dict] = deque(maxlen=self._max_events)
+        self._retention_ns = _EVENT_RETENTION_NS
         
     def initialize(self) -> bool:
         """Initialize the security monitor"""
@@ -32,15 +101,20 @@ class SecurityMonitor(Plugin):
             ip_address: Device IP address
         """
         now = datetime.now()
+        now_ns = time.monotonic_ns()
+        mac_address = _normalize_mac(mac_address)
+        mac_key = _mac_key(mac_address)
         
         # Check for new devices
-        if mac_address not in self._known_devices:
-            self._known_devices[mac_address] = now
+        if mac_key not in self._known_devices:
+            self._known_devices[mac_key] = now
+            self._known_mac_arr = None
             self._log_security_event('New device detected', {
                 'mac_address': mac_address,
                 'ip_address': ip_address,
+                'vendor': _oui_lookup(mac_address[:8]),
                 'timestamp': now
-            })
+            }, now_ns=now_ns)
             
         # Check for IP changes
         elif self._has_ip_changed(mac_address, ip_address):
@@ -48,35 +122,86 @@ class SecurityMonitor(Plugin):
                 'mac_address': mac_address,
                 'new_ip': ip_address,
                 'timestamp': now
-            })
+            }, now_ns=now_ns)
             
-    def _log_security_event(self, event_type: str, details: Dict) -> None:
+    def analyze_devices(self, macs: np.ndarray, ips: np.ndarray) -> None:
+        """Analyze a whole scan's worth of devices at once
+        
+        New devices are found with one vectorized membership test against
+        the known MACs, so only they go through Python-level event logging.
+        IP changes of known devices are only checked by analyze_device.
+        
+        Args:
+            macs: Device MAC addresses as 48-bit integers (uint64)
+            ips: Device IPv4 addresses as integers (uint32), same order
+        """
+        macs = np.asarray(macs, dtype=np.uint64)
+        ips = np.asarray(ips, dtype=np.uint32)
+        if self._known_mac_arr is None:
+            self._known_mac_arr = np.fromiter(
+                (key for key in self._known_devices if isinstance(key, int)),
+                dtype=np.uint64
+            )
+        
+        # First sighting of each MAC in the batch that isn't known yet
+        new_macs, first_idx = np.unique(macs, return_index=True)
+        new_mask = ~np.isin(new_macs, self._known_mac_arr)
+        if not new_mask.any():
+            return
+        first_idx = np.sort(first_idx[new_mask])
+        self._known_mac_arr = np.concatenate((self._known_mac_arr, macs[first_idx]))
+        
+        now = datetime.now()
+        now_ns = time.monotonic_ns()
+        for idx in first_idx:
+            mac_key = int(macs[idx])
+            mac_address = ':'.join(f'{b:02x}' for b in mac_key.to_bytes(6, 'big'))
+            self._known_devices[mac_key] = now
+            self._log_security_event('New device detected', {
+                'mac_address': mac_address,
+                'ip_address': str(IPv4Address(int(ips[idx]))),
+                'vendor': _oui_lookup(mac_address[:8]),
+                'timestamp': now
+            }, now_ns)
+            
+    def _log_security_event(self, event_type: str, details: Dict,
+                            now_ns: Optional[int] = None) -> None:
         """Log security event and check alert threshold
         
         Args:
             event_type: Type of security event
             details: Event details
+            now_ns: Event time as time.monotonic_ns(), defaults to the current time
         """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
         self._suspicious_activity.append({
             'type': event_type,
             'details': details,
-            'timestamp': datetime.now()
+            'timestamp': now_ns
         })
         
         # Clean old events
-        self._clean_old_events()
+        self._clean_old_events(now_ns)
         
         # Check if we need to raise an alert
         if len(self._suspicious_activity) >= self._alert_threshold:
             self._raise_security_alert()
             
-    def _clean_old_events(self) -> None:
-        """Remove events older than 1 hour"""
-        cutoff = datetime.now() - timedelta(hours=1)
-        self._suspicious_activity = [
-            event for event in self._suspicious_activity
-            if event['timestamp'] > cutoff
-        ]
+    def _clean_old_events(self, now_ns: Optional[int] = None) -> None:
+        """Remove events older than 1 hour
+        
+        Args:
+            now_ns: Current time as time.monotonic_ns(), read from the
+                clock if not given
+        """
+        if now_ns is None:
+            now_ns = time.monotonic_ns()
+        cutoff = now_ns - self._retention_ns
+        # Events are appended in time order, so expired ones are at the front
+        activity = self._suspicious_activity
+        while activity and activity[0]['timestamp'] <= cutoff:
+            activity.popleft()
         
     def _raise_security_alert(self) -> None:
         """Raise security alert for suspicious activity"""
@@ -93,5 +218,6 @@ class SecurityMonitor(Plugin):
     def cleanup(self) -> bool:
         """Cleanup plugin resources"""
         self._known_devices.clear()
+        self._known_mac_arr = None
         self._suspicious_activity.clear()
         return True
@@ -1,7 +1,75 @@
 from wifi_fortress.core.plugin_loader import Plugin
 import scapy.all as scapy
-from threading import Thread
-import time
+from threading import Lock
+from typing import Optional, Tuple
+
+# Let libpcap drop non-beacon frames before scapy dissects them
+_BEACON_FILTER = 'type mgt subtype beacon'
+
+_RadioTap = scapy.RadioTap
+
+# Beacon frame layout after any radiotap header
+_DOT11_ADDR2 = 10         # Transmitter address offset in the 802.11 header
+_BEACON_IES = 24 + 12     # 802.11 management header + beacon fixed fields
+
+def _is_beacon(packet) -> bool:
+    """Fallback check for drivers that ignore 802.11 BPF filters"""
+    return packet.haslayer(scapy.Dot11Beacon)
+
+def _scan_beacon_ies(buf, start):
+    """Find the SSID and DS channel among a beacon's information elements
+    
+    Args:
+        buf: Frame bytes, as a memoryview
+        start: Offset of the first information element
+        
+    Returns:
+        (ssid_start, ssid_len, channel), -1 for any element not found
+    """
+    ssid_start = -1
+    ssid_len = -1
+    channel = -1
+    
+    i = start
+    end = len(buf)
+    while i + 2 <= end and (ssid_start < 0 or channel < 0):
+        tag = buf[i]
+        length = buf[i + 1]
+        if tag == 0 and ssid_start < 0:  # SSID
+            ssid_start = i + 2
+            ssid_len = min(length, end - ssid_start)
+        elif tag == 3 and length >= 1 and i + 2 < end and channel < 0:  # DS parameter set
+            channel = buf[i + 2]
+        i += 2 + length
+        
+    return ssid_start, ssid_len, channel
+
+def _parse_beacon(raw: bytes, radiotap: bool) -> Optional[Tuple[str, str, Optional[int]]]:
+    """Pull the BSSID, SSID and channel straight out of a beacon's bytes
+    
+    Walks the information elements as plain TLVs instead of having scapy
+    dissect every element.
+    
+    Args:
+        raw: Captured frame
+        radiotap: Whether the frame starts with a radiotap header
+        
+    Returns:
+        (bssid, ssid, channel), channel None if the beacon has no DS
+        parameter set, or None if the frame is truncated
+    """
+    buf = memoryview(raw)
+    offset = int.from_bytes(buf[2:4], 'little') if radiotap else 0
+    if len(buf) < offset + _BEACON_IES:
+        return None
+        
+    ssid_start, ssid_len, channel = _scan_beacon_ies(buf, offset + _BEACON_IES)
+    if ssid_start < 0:
+        return None
+        
+    bssid = ':'.join(f'{b:02x}' for b in buf[offset + _DOT11_ADDR2:offset + _DOT11_ADDR2 + 6])
+    ssid = bytes(buf[ssid_start:ssid_start + ssid_len]).decode('utf-8', 'replace')
+    return bssid, ssid, channel if channel >= 0 else None
 
 class WiFiScanner(Plugin):
     name = 'WiFi Scanner'
@@ -12,7 +80,9 @@ class WiFiScanner(Plugin):
     def __init__(self):
         super().__init__()
         self.networks = []
-        self.scan_thread = None
+        self._seen_bssids = set()
+        self._lock = Lock()  # Guards networks and _seen_bssids
+        self._sniffer = None
         
     def initialize(self) -> bool:
         """Initialize the WiFi scanner"""
@@ -26,42 +96,57 @@ class WiFiScanner(Plugin):
             
     def start_scan(self):
         """Start scanning for networks"""
-        if not self.enabled:
+        if not self.enabled or self._sniffer:
             return
             
-        def scan_worker():
-            while self.enabled:
-                try:
-                    # Perform network scan
-                    packets = scapy.sniff(count=10, timeout=2)
-                    for packet in packets:
-                        if packet.haslayer(scapy.Dot11Beacon):
-                            ssid = packet[scapy.Dot11Elt].info.decode()
-                            bssid = packet[scapy.Dot11].addr2
-                            channel = int(ord(packet[scapy.Dot11Elt:3].info))
-                            
-                            network = {
-                                'ssid': ssid,
-                                'bssid': bssid,
-                                'channel': channel
-                            }
-                            
-                            if network not in self.networks:
-                                self.networks.append(network)
-                                print(f'Found network: {ssid} ({bssid}) on channel {channel}')
-                                
-                    time.sleep(1)
-                except Exception as e:
-                    print(f'Error during scan: {str(e)}')
-                    time.sleep(5)
-                    
-        self.scan_thread = Thread(target=scan_worker)
-        self.scan_thread.daemon = True
-        self.scan_thread.start()
+        # Handle beacons as they arrive instead of sniffing in batches
+        self._sniffer = scapy.AsyncSniffer(
+            filter=_BEACON_FILTER,
+            lfilter=_is_beacon,
+            prn=self._on_beacon,
+            store=False
+        )
+        self._sniffer.start()
+        
+    def _on_beacon(self, packet):
+        """Record the network advertised by a beacon frame"""
+        try:
+            parsed = _parse_beacon(bytes(packet), isinstance(packet, _RadioTap))
+            if parsed is None:
+                return
+            bssid, ssid, channel = parsed
+            if bssid in self._seen_bssids:
+                return
+                
+            network = {
+                'ssid': ssid,
+                'bssid': bssid,
+                'channel': channel
+            }
+            
+            with self._lock:
+                if bssid in self._seen_bssids:
+                    return
+                self._seen_bssids.add(bssid)
+                self.networks.append(network)
+            print(f'Found network: {ssid} ({bssid}) on channel {channel}')
+        except Exception as e:
+            print(f'Error during scan: {str(e)}')
+            
+    def get_networks(self):
+        """Get a snapshot of the networks found so far"""
+        with self._lock:
+            return list(self.networks)
         
     def cleanup(self) -> bool:
         """Stop scanning and cleanup"""
         self.enabled = False
-        if self.scan_thread:
-            self.scan_thread.join(timeout=2)
+        if self._sniffer:
+            try:
+                self._sniffer.stop()
+            except Exception as e:
+                print(f'Error stopping scan: {str(e)}')
+            self._sniffer = None
+        with self._lock:
+            self._seen_bssids.clear()
         return True
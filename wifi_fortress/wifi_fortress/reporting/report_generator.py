@@ -1,20 +1,212 @@
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter, landscape
 from reportlab.platypus import (
-    SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
-    PageBreak, Image, Flowable
+    BaseDocTemplate, PageTemplate, Frame, Paragraph, Spacer, Table, TableStyle,
+    PageBreak, Image, Flowable, KeepTogether
 )
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.graphics.shapes import Drawing, Line
-from reportlab.graphics.charts.linecharts import HorizontalLineChart
 from reportlab.graphics.charts.piecharts import Pie
-from datetime import datetime, timedelta
+from pathlib import Path
 from typing import List, Dict, Any, Optional
+from collections import Counter
+from functools import lru_cache
+from concurrent.futures import Future, ProcessPoolExecutor
+from threading import Lock
+import atexit
+import multiprocessing
 import os
 import json
+import re
+import time
+import matplotlib
+matplotlib.use('Agg')  # Charts are only ever rendered to image buffers
 import matplotlib.pyplot as plt
 import io
+import numpy as np
+
+# Styles are immutable once built, so build them once and share them
+# between generators and reports
+_SAMPLE_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_SAMPLE_STYLES['Heading1'],
+    fontSize=24,
+    spaceAfter=30,
+    textColor=colors.HexColor('#1a237e')
+)
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_SAMPLE_STYLES['Heading2'],
+    fontSize=18,
+    textColor=colors.HexColor('#283593'),
+    spaceAfter=12
+)
+_SUBHEADING_STYLE = ParagraphStyle(
+    'CustomSubHeading',
+    parent=_SAMPLE_STYLES['Heading3'],
+    fontSize=14,
+    textColor=colors.HexColor('#3949ab'),
+    spaceAfter=10
+)
+_NORMAL_STYLE = ParagraphStyle(
+    'CustomNormal',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=11,
+    leading=14
+)
+_ALERT_STYLE = ParagraphStyle(
+    'CustomAlert',
+    parent=_SAMPLE_STYLES['Normal'],
+    fontSize=12,
+    textColor=colors.red,
+    leading=14
+)
+
+_SUMMARY_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f3f3f3')),
+    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#000000')),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e3f2fd')),
+    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbdefb'))
+])
+_THREAT_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('FONTSIZE', (0, 1), (-1, -1), _NORMAL_STYLE.fontSize),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+_ANALYSIS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#283593')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('FONTSIZE', (0, 1), (-1, -1), _NORMAL_STYLE.fontSize),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6)
+])
+_RECS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('FONTSIZE', (0, 1), (-1, -1), _NORMAL_STYLE.fontSize),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.white),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('LEFTPADDING', (0, 0), (-1, -1), 6),
+    ('RIGHTPADDING', (0, 0), (-1, -1), 6)
+])
+
+# Canonical security protocol codes used in report summaries
+SEC_WEP = 'WEP'
+SEC_WPA = 'WPA'  # Original WPA (TKIP), including WPA/WPA2 mixed mode
+SEC_WPA2 = 'WPA2'
+SEC_WPA3 = 'WPA3'
+SEC_OPEN = 'OPEN'
+SEC_UNKNOWN = 'UNKNOWN'
+
+# (count above which it applies, threat severity), highest first
+_SEVERITY_BANDS = ((5, 'High'), (2, 'Medium'))
+
+# Protocol keywords, lower rank wins when a description matches several
+_SECURITY_KEYWORDS = re.compile(r'wpa3|wpa2|wpa|wep|open', re.IGNORECASE)
+_SECURITY_RANKS = {
+    'wep': (0, SEC_WEP),
+    'wpa3': (1, SEC_WPA3),
+    'wpa': (2, SEC_WPA),
+    'wpa2': (3, SEC_WPA2),
+    'open': (4, SEC_OPEN)
+}
+
+@lru_cache(maxsize=256)
+def _classify_security(security: str) -> str:
+    """Map a scanned security description to a SEC_* code"""
+    best = (len(_SECURITY_RANKS), SEC_UNKNOWN)
+    for keyword in _SECURITY_KEYWORDS.findall(security):
+        best = min(best, _SECURITY_RANKS[keyword.lower()])
+    return best[1]
+
+# (performance_data key, chart title, line color)
+_PERFORMANCE_CHARTS = (
+    ('signal_strength', 'Signal Strength', 'blue'),
+    ('bandwidth_usage', 'Bandwidth Usage', 'green'),
+    ('error_rates', 'Error Rates', 'red')
+)
+
+_chart_pool: Optional[ProcessPoolExecutor] = None
+_chart_pool_lock = Lock()
+
+def _get_chart_pool() -> ProcessPoolExecutor:
+    """Get the process pool charts are rasterized in, starting it on first use
+    
+    Workers are spawned rather than forked so they don't inherit the GUI
+    process's threads, and there are never more than one per chart.
+    """
+    global _chart_pool
+    with _chart_pool_lock:
+        if _chart_pool is None:
+            _chart_pool = ProcessPoolExecutor(
+                max_workers=min(len(_PERFORMANCE_CHARTS), os.cpu_count() or 1),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return _chart_pool
+
+def _shutdown_chart_pool() -> None:
+    """Stop the chart pool's worker processes"""
+    global _chart_pool
+    with _chart_pool_lock:
+        if _chart_pool is not None:
+            _chart_pool.shutdown()
+            _chart_pool = None
+
+atexit.register(_shutdown_chart_pool)
+
+def _render_line_chart(title: str, values: List[float], labels: List[str],
+                       color: str) -> bytes:
+    """Rasterize a line chart to PNG bytes
+    
+    Runs in a chart pool worker process, so it only works from its
+    arguments.
+    
+    Args:
+        title: Chart title
+        values: Data points, plotted on a 0-100 scale
+        labels: Category labels for the data points
+        color: Line color
+        
+    Returns:
+        PNG image data
+    """
+    fig, ax = plt.subplots(figsize=(6, 2), dpi=100)
+    try:
+        ax.plot(range(len(values)), values, color=color)
+        ax.set_title(title)
+        ax.set_ylim(0, 100)
+        ticks = range(min(len(values), len(labels)))
+        ax.set_xticks(list(ticks))
+        ax.set_xticklabels([str(labels[i]) for i in ticks], rotation=30, ha='right')
+        fig.tight_layout()
+        
+        buf = io.BytesIO()
+        fig.savefig(buf, format='png')
+        return buf.getvalue()
+    finally:
+        plt.close(fig)
 
 class HorizontalLine(Flowable):
     """Custom flowable for drawing horizontal lines"""
@@ -32,45 +224,31 @@ class HorizontalLine(Flowable):
 class ReportGenerator:
     def __init__(self, output_dir: str = 'reports'):
         self.output_dir = output_dir
-        if not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        self._output_path = Path(output_dir)
+        os.makedirs(self._output_path, exist_ok=True)
         
-        # Initialize styles
-        self.styles = getSampleStyleSheet()
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=colors.HexColor('#1a237e')
-        )
-        self.heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=18,
-            textColor=colors.HexColor('#283593'),
-            spaceAfter=12
-        )
-        self.subheading_style = ParagraphStyle(
-            'CustomSubHeading',
-            parent=self.styles['Heading3'],
-            fontSize=14,
-            textColor=colors.HexColor('#3949ab'),
-            spaceAfter=10
-        )
-        self.normal_style = ParagraphStyle(
-            'CustomNormal',
-            parent=self.styles['Normal'],
-            fontSize=11,
-            leading=14
-        )
-        self.alert_style = ParagraphStyle(
-            'CustomAlert',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=colors.red,
-            leading=14
+        # Page layout shared by every report, bound to an output per build
+        self._doc = BaseDocTemplate(
+            None,
+            pagesize=letter,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=72
         )
+        self._doc.addPageTemplates([PageTemplate(id='main', frames=[
+            Frame(self._doc.leftMargin, self._doc.bottomMargin,
+                  self._doc.width, self._doc.height, id='normal')
+        ])])
+        self._doc_lock = Lock()
+        
+        # Initialize styles
+        self.styles = _SAMPLE_STYLES
+        self.title_style = _TITLE_STYLE
+        self.heading_style = _HEADING_STYLE
+        self.subheading_style = _SUBHEADING_STYLE
+        self.normal_style = _NORMAL_STYLE
+        self.alert_style = _ALERT_STYLE
         
     def create_network_security_report(self, scan_results: List[Dict[str, Any]], 
                                      threat_data: Optional[Dict] = None,
@@ -94,17 +272,15 @@ class ReportGenerator:
                 'error_rates': [],
                 'timestamps': []
             }
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = os.path.join(self.output_dir, f'security_report_{timestamp}.pdf')
         
-        doc = SimpleDocTemplate(
-            filename,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72
-        )
+        # Start rasterizing charts so they render while the rest of the
+        # story is built
+        chart_futures = self.submit_performance_charts(performance_data)
+        
+        # Aggregate the scan once for every section that needs it
+        summary = self._summarize(scan_results)
+        
+        filename = self._timestamped_filename('security_report')
         
         # Build the document content
         story = []
@@ -116,27 +292,14 @@ class ReportGenerator:
         # Executive Summary
         story.append(Paragraph("Executive Summary", self.heading_style))
         summary_data = [
-            [Paragraph("Total Networks Scanned:", self.normal_style),
-             Paragraph(str(len(scan_results)), self.normal_style)],
-            [Paragraph("Threats Detected:", self.normal_style),
-             Paragraph(str(len(threat_data['suspicious_ips'])), self.normal_style)],
-            [Paragraph("Attacks Blocked:", self.normal_style),
-             Paragraph(str(threat_data['attacks_blocked']), self.normal_style)],
-            [Paragraph("Overall Security Score:", self.normal_style),
-             Paragraph(self.calculate_security_score(scan_results, threat_data), self.normal_style)]
+            ["Total Networks Scanned:", str(len(scan_results))],
+            ["Threats Detected:", str(len(threat_data['suspicious_ips']))],
+            ["Attacks Blocked:", str(threat_data['attacks_blocked'])],
+            ["Overall Security Score:", self.calculate_security_score(scan_results, threat_data, summary)]
         ]
         
         summary_table = Table(summary_data, colWidths=[2*inch, inch])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#f3f3f3')),
-            ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#000000')),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, -1), 12),
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e3f2fd')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bbdefb'))
-        ]))
+        summary_table.setStyle(_SUMMARY_TABLE_STYLE)
         story.append(summary_table)
         story.append(Spacer(1, 20))
         
@@ -147,24 +310,92 @@ class ReportGenerator:
         
         # Network Details
         story.append(Paragraph("Network Analysis", self.heading_style))
-        story.append(self.create_network_analysis(scan_results))
+        story.append(self.create_network_analysis(scan_results, summary))
         story.append(PageBreak())
         
         # Performance Metrics
         story.append(Paragraph("Performance Metrics", self.heading_style))
-        story.append(self.create_performance_charts(performance_data))
+        story.append(self.create_performance_charts(performance_data, chart_futures))
         story.append(PageBreak())
         
         # Security Recommendations
         story.append(Paragraph("Security Recommendations", self.heading_style))
-        story.append(self.create_security_recommendations(scan_results, threat_data))
+        story.append(self.create_security_recommendations(scan_results, threat_data, summary))
         
         # Build the PDF
-        doc.build(story)
+        self._build(story, filename)
         return filename
     
-    def calculate_security_score(self, scan_results: List[Dict], threat_data: Dict) -> str:
+    def _timestamped_filename(self, prefix: str) -> str:
+        """Get an output path for a report stamped with the current local time"""
+        return str(self._output_path / f"{prefix}_{time.strftime('%Y%m%d_%H%M%S')}.pdf")
+    
+    def _build(self, story: List[Flowable], filename: str) -> None:
+        """Lay out a story with the shared page template and write the PDF
+        
+        The PDF is rendered in memory and written to disk in one go.
+        
+        Args:
+            story: Flowables to render
+            filename: Output PDF path
+        """
+        buf = io.BytesIO()
+        with self._doc_lock:
+            self._doc.build(story, filename=buf)
+        with open(filename, 'wb') as f:
+            f.write(buf.getvalue())
+    
+    def _summarize(self, scan_results: List[Dict]) -> Dict[str, Any]:
+        """Aggregate scan results in a single pass
+        
+        Args:
+            scan_results: Scanned networks
+            
+        Returns:
+            Dict with 'security_counts' (Counter of SEC_* codes),
+            'channel_counts' (channel -> number of networks), and
+            'signal_n' and 'signal_stats' (mean, std, min, max, p25 and p75,
+            or None without data) over networks reporting signal strength
+        """
+        security_counts: Counter = Counter()
+        channel_counts: Counter = Counter()
+        signals = []
+        
+        for network in scan_results:
+            security_counts[_classify_security(network.get('security', ''))] += 1
+            channel_counts[network.get('channel', 0)] += 1
+            
+            if 'signal_strength' in network:
+                signals.append(network['signal_strength'])
+        
+        return {
+            'security_counts': security_counts,
+            'channel_counts': channel_counts,
+            'signal_n': len(signals),
+            'signal_stats': self._signal_stats(signals)
+        }
+    
+    @staticmethod
+    def _signal_stats(signals: List[float]) -> Optional[Dict[str, float]]:
+        """Compute signal strength statistics with vectorized reductions"""
+        if not signals:
+            return None
+        arr = np.fromiter(signals, dtype=np.float32, count=len(signals))
+        p25, p75 = np.percentile(arr, [25, 75])
+        return {
+            'mean': float(arr.mean()),
+            'std': float(arr.std()),
+            'min': float(arr.min()),
+            'max': float(arr.max()),
+            'p25': float(p25),
+            'p75': float(p75)
+        }
+    
+    def calculate_security_score(self, scan_results: List[Dict], threat_data: Dict,
+                                 summary: Optional[Dict[str, Any]] = None) -> str:
         """Calculate overall security score based on various metrics"""
+        if summary is None:
+            summary = self._summarize(scan_results)
         score = 100
         
         # Deduct points for each vulnerability
@@ -174,14 +405,10 @@ class ReportGenerator:
         score -= len(threat_data['suspicious_ips']) * 5
         
         # Deduct points for weak security protocols in networks
-        for network in scan_results:
-            security = network.get('security', '').lower()
-            if 'wep' in security:
-                score -= 20
-            elif 'wpa' in security and 'wpa3' not in security:
-                score -= 5
-            elif 'open' in security:
-                score -= 15
+        security_counts = summary['security_counts']
+        score -= (security_counts[SEC_WEP] * 20 +
+                  (security_counts[SEC_WPA] + security_counts[SEC_WPA2]) * 5 +
+                  security_counts[SEC_OPEN] * 15)
         
         # Ensure score stays within 0-100
         score = max(0, min(100, score))
@@ -207,74 +434,48 @@ class ReportGenerator:
         pie.y = 50
         pie.width = 100
         pie.height = 100
-        pie.data = list(threat_data['threat_types'].values())
-        pie.labels = list(threat_data['threat_types'].keys())
+        # Largest categories first so slices and rows keep a stable order
+        items = sorted(threat_data['threat_types'].items(), key=lambda kv: -kv[1])
+        labels, values = zip(*items) if items else ((), ())
+        pie.data = list(values)
+        pie.labels = list(labels)
         pie.slices.strokeWidth = 0.5
         drawing.add(pie)
         
         # Create threat summary
-        threat_summary = [
-            [Paragraph("Threat Category", self.subheading_style),
-             Paragraph("Count", self.subheading_style),
-             Paragraph("Severity", self.subheading_style)]
-        ]
+        threat_summary = [["Threat Category", "Count", "Severity"]]
+        alert_rows = []
         
-        for category, count in threat_data['threat_types'].items():
-            severity = "High" if count > 5 else "Medium" if count > 2 else "Low"
-            style = self.alert_style if severity == "High" else self.normal_style
+        for category, count in items:
+            severity = next((band for floor, band in _SEVERITY_BANDS if count > floor), "Low")
+            if severity == "High":
+                alert_rows.append(len(threat_summary))
             
-            threat_summary.append([
-                Paragraph(category.title(), self.normal_style),
-                Paragraph(str(count), self.normal_style),
-                Paragraph(severity, style)
-            ])
+            threat_summary.append([category.title(), str(count), severity])
         
         # Create and style the table
         table = Table(threat_summary, colWidths=[2*inch, inch, 1.5*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
+        table.setStyle(_THREAT_TABLE_STYLE)
+        self._highlight_alerts(table, 2, alert_rows)
         
         return table
     
-    def create_network_analysis(self, scan_results: List[Dict]) -> Table:
+    def create_network_analysis(self, scan_results: List[Dict],
+                                summary: Optional[Dict[str, Any]] = None) -> Table:
         """Create a detailed network analysis section"""
-        # Analyze security protocols
-        security_counts = {}
-        channel_usage = {}
-        signal_strengths = []
-        
-        for network in scan_results:
-            # Count security protocols
-            security = network.get('security', 'Unknown')
-            security_counts[security] = security_counts.get(security, 0) + 1
-            
-            # Count channel usage
-            channel = network.get('channel', 0)
-            channel_usage[channel] = channel_usage.get(channel, 0) + 1
-            
-            # Collect signal strengths
-            if 'signal_strength' in network:
-                signal_strengths.append(network['signal_strength'])
+        if summary is None:
+            summary = self._summarize(scan_results)
+        security_counts = summary['security_counts']
+        channel_usage = summary['channel_counts']
         
         # Create analysis table
-        analysis_data = [
-            [Paragraph("Analysis Category", self.subheading_style),
-             Paragraph("Details", self.subheading_style)]
-        ]
+        analysis_data = [["Analysis Category", "Details"]]
         
         # Add security protocol analysis
         security_text = ", ".join([f"{proto}: {count}" 
                                 for proto, count in security_counts.items()])
         analysis_data.append([
-            Paragraph("Security Protocols", self.normal_style),
+            "Security Protocols",
             Paragraph(security_text, self.normal_style)
         ])
         
@@ -284,157 +485,138 @@ class ReportGenerator:
         channel_text = f"Busy channels: {', '.join(map(str, busy_channels))}" \
                       if busy_channels else "No channel congestion detected"
         analysis_data.append([
-            Paragraph("Channel Analysis", self.normal_style),
+            "Channel Analysis",
             Paragraph(channel_text, self.normal_style)
         ])
         
         # Add signal strength analysis
-        if signal_strengths:
-            avg_signal = sum(signal_strengths) / len(signal_strengths)
+        stats = summary['signal_stats']
+        if stats:
+            avg_signal = stats['mean']
             signal_text = f"Average: {avg_signal:.1f}%, "
             signal_text += "Good" if avg_signal > 70 else \
                           "Fair" if avg_signal > 50 else "Poor"
+            signal_text += (f" (range {stats['min']:.0f}-{stats['max']:.0f}%, "
+                            f"middle half {stats['p25']:.0f}-{stats['p75']:.0f}%, "
+                            f"std dev {stats['std']:.1f})")
         else:
             signal_text = "No signal strength data available"
             
         analysis_data.append([
-            Paragraph("Signal Strength", self.normal_style),
+            "Signal Strength",
             Paragraph(signal_text, self.normal_style)
         ])
         
         # Create and style the table
         table = Table(analysis_data, colWidths=[2*inch, 4*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#283593')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        table.setStyle(_ANALYSIS_TABLE_STYLE)
         
         return table
     
-    def create_performance_charts(self, performance_data: Dict) -> Drawing:
-        """Create performance metric charts"""
-        drawing = Drawing(500, 200)
-        
-        # Create line chart
-        chart = HorizontalLineChart()
-        chart.x = 50
-        chart.y = 50
-        chart.height = 125
-        chart.width = 400
-        
-        # Add data
-        chart.data = [
-            performance_data['signal_strength'],
-            performance_data['bandwidth_usage'],
-            performance_data['error_rates']
-        ]
-        
-        # Customize chart
-        chart.lines[0].strokeColor = colors.blue
-        chart.lines[1].strokeColor = colors.green
-        chart.lines[2].strokeColor = colors.red
-        
-        chart.valueAxis.valueMin = 0
-        chart.valueAxis.valueMax = 100
-        chart.valueAxis.valueStep = 20
+    def submit_performance_charts(self, performance_data: Dict) -> List[Future]:
+        """Start rendering the performance charts in the chart process pool
         
-        # Add legend
-        chart.categoryAxis.categoryNames = performance_data['timestamps']
-        chart.categoryAxis.labels.boxAnchor = 'ne'
-        chart.categoryAxis.labels.dx = 8
-        chart.categoryAxis.labels.dy = -2
-        chart.categoryAxis.labels.angle = 30
-        
-        drawing.add(chart)
-        return drawing
+        Args:
+            performance_data: Performance metrics keyed like the report input
+            
+        Returns:
+            One future per chart, each resolving to PNG bytes
+        """
+        labels = list(performance_data['timestamps'])
+        pool = _get_chart_pool()
+        return [
+            pool.submit(_render_line_chart, title, list(performance_data[key]),
+                        labels, color)
+            for key, title, color in _PERFORMANCE_CHARTS
+        ]
+    
+    def create_performance_charts(self, performance_data: Dict,
+                                  chart_futures: Optional[List[Future]] = None) -> Flowable:
+        """Create performance metric charts
+        
+        Args:
+            performance_data: Performance metrics keyed like the report input
+            chart_futures: Charts already submitted with
+                submit_performance_charts, submitted here if not given
+        """
+        if chart_futures is None:
+            chart_futures = self.submit_performance_charts(performance_data)
+            
+        images = []
+        for future in chart_futures:
+            png = future.result()
+            images.append(Image(io.BytesIO(png), width=6*inch, height=2*inch))
+        return KeepTogether(images)
     
     def create_security_recommendations(self, scan_results: List[Dict], 
-                                      threat_data: Dict) -> Table:
+                                      threat_data: Dict,
+                                      summary: Optional[Dict[str, Any]] = None) -> Table:
         """Create detailed security recommendations based on analysis"""
-        recommendations = [
-            [Paragraph("Category", self.subheading_style),
-             Paragraph("Recommendation", self.subheading_style),
-             Paragraph("Priority", self.subheading_style)]
-        ]
+        if summary is None:
+            summary = self._summarize(scan_results)
+        recommendations = [["Category", "Recommendation", "Priority"]]
+        alert_rows = []
         
         # Network Security
-        has_weak_security = any('wep' in net.get('security', '').lower() 
-                              for net in scan_results)
-        if has_weak_security:
+        if summary['security_counts'][SEC_WEP]:
+            alert_rows.append(len(recommendations))
             recommendations.append([
-                Paragraph("Network Security", self.normal_style),
+                "Network Security",
                 Paragraph("Upgrade networks using WEP to WPA3", self.normal_style),
-                Paragraph("High", self.alert_style)
+                "High"
             ])
         
         # Threat Response
         if threat_data['suspicious_ips']:
+            alert_rows.append(len(recommendations))
             recommendations.append([
-                Paragraph("Threat Response", self.normal_style),
+                "Threat Response",
                 Paragraph(f"Block {len(threat_data['suspicious_ips'])} suspicious IPs", 
                          self.normal_style),
-                Paragraph("High", self.alert_style)
+                "High"
             ])
         
         # Channel Optimization
-        channel_conflicts = self._analyze_channel_conflicts(scan_results)
+        channel_conflicts = self._analyze_channel_conflicts(scan_results, summary)
         if channel_conflicts:
             recommendations.append([
-                Paragraph("Channel Optimization", self.normal_style),
+                "Channel Optimization",
                 Paragraph("Redistribute networks across channels to reduce interference",
                          self.normal_style),
-                Paragraph("Medium", self.normal_style)
+                "Medium"
             ])
         
         # Create and style the table
         table = Table(recommendations, colWidths=[1.5*inch, 4*inch, inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a237e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.white),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('LEFTPADDING', (0, 0), (-1, -1), 6),
-            ('RIGHTPADDING', (0, 0), (-1, -1), 6)
-        ]))
+        table.setStyle(_RECS_TABLE_STYLE)
+        self._highlight_alerts(table, 2, alert_rows)
         
         return table
     
-    def _analyze_channel_conflicts(self, scan_results: List[Dict]) -> bool:
+    @staticmethod
+    def _highlight_alerts(table: Table, column: int, rows: List[int]) -> None:
+        """Render the given cells of a table column in the alert style"""
+        if rows:
+            table.setStyle(TableStyle([
+                cmd for row in rows for cmd in (
+                    ('TEXTCOLOR', (column, row), (column, row), _ALERT_STYLE.textColor),
+                    ('FONTSIZE', (column, row), (column, row), _ALERT_STYLE.fontSize)
+                )
+            ]))
+        
+    def _analyze_channel_conflicts(self, scan_results: List[Dict],
+                                   summary: Optional[Dict[str, Any]] = None) -> bool:
         """Analyze network channels for conflicts"""
-        channel_count = {}
-        for network in scan_results:
-            channel = network.get('channel', 0)
-            if channel:
-                channel_count[channel] = channel_count.get(channel, 0) + 1
+        if summary is None:
+            summary = self._summarize(scan_results)
         
         # Check if any channel has more than 3 networks
-        return any(count > 3 for count in channel_count.values())
+        return any(count > 3 for channel, count in summary['channel_counts'].items()
+                   if channel)
         
     def create_incident_report(self, incident_data: Dict[str, Any]) -> str:
         """Create a PDF report for security incidents"""
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        filename = os.path.join(self.output_dir, f'incident_report_{timestamp}.pdf')
-        
-        doc = SimpleDocTemplate(
-            filename,
-            pagesize=letter,
-            rightMargin=72,
-            leftMargin=72,
-            topMargin=72,
-            bottomMargin=72
-        )
+        filename = self._timestamped_filename('incident_report')
         
         story = []
         
@@ -471,5 +653,5 @@ class ReportGenerator:
                 story.append(Paragraph(f"• {rec}", self.normal_style))
         
         # Build the PDF
-        doc.build(story)
+        self._build(story, filename)
         return filename
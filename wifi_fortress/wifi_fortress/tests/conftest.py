@@ -0,0 +1,143 @@
+import pytest
+from unittest.mock import MagicMock
+
+import wifi_fortress.core.network_mapper as network_mapper_module
+import wifi_fortress.core.secure_config as secure_config_module
+
+SAFE_PLUGIN_SOURCE = '''\
+def safe_method():
+    # Simple arithmetic
+    result = 0
+    for i in range(100):
+        result += i
+    return result
+'''
+
+# Plugin that tries to access system resources
+DANGEROUS_PLUGIN_SOURCE = '''\
+import os
+import sys
+
+def dangerous_method():
+    # Try to delete files
+    os.remove('/important_file')
+    return True
+'''
+
+# Plugin that consumes too much memory
+MEMORY_HOG_SOURCE = '''\
+def consume_memory():
+    # Try to allocate a large list
+    data = [0] * (1024 * 1024 * 20)  # 20MB (should exceed 10MB limit)
+    return len(data)
+'''
+
+# Plugin that runs too long
+CPU_HOG_SOURCE = '''\
+def consume_cpu():
+    # Infinite loop
+    while True:
+        pass
+'''
+
+VALID_PLUGIN_SOURCE = '''
+from wifi_fortress.core.plugin_loader import Plugin
+
+class TestPlugin(Plugin):
+    name = "Test Plugin"
+    description = "Test plugin for validation"
+    version = "1.0.0"
+    author = "Test Author"
+    
+    def initialize(self) -> bool:
+        return True
+        
+    def cleanup(self) -> bool:
+        return True
+'''
+
+# Plugin with dangerous imports
+INVALID_PLUGIN_SOURCE = '''
+import os
+import subprocess
+
+def dangerous_function():
+    os.system('rm -rf /')
+    subprocess.run(['format', 'c:'])
+'''
+
+def pytest_addoption(parser):
+    parser.addoption('--no-gui', action='store_true', default=False,
+                     help='skip tests that need a QApplication')
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'gui: test needs a QApplication')
+    config.addinivalue_line(
+        'markers', 'xdist_group(name): run tests sharing a group on the same xdist worker'
+    )
+
+def pytest_collection_modifyitems(config, items):
+    if not config.getoption('--no-gui'):
+        return
+    skip_gui = pytest.mark.skip(reason='GUI tests disabled with --no-gui')
+    for item in items:
+        if 'gui' in item.keywords:
+            item.add_marker(skip_gui)
+
+@pytest.fixture(scope='session', autouse=True)
+def _cheap_kdf():
+    """Keep SecureConfigManager's PBKDF2 key derivation cheap under test"""
+    orig_iterations = secure_config_module._KDF_ITERATIONS
+    secure_config_module._KDF_ITERATIONS = 1000
+    yield
+    secure_config_module._KDF_ITERATIONS = orig_iterations
+
+@pytest.fixture
+def mock_srp():
+    """Replace the srp used by NetworkMapper with a fresh mock"""
+    srp = MagicMock(name='srp', return_value=([], None))
+    orig_srp = network_mapper_module.srp
+    network_mapper_module.srp = srp
+    yield srp
+    network_mapper_module.srp = orig_srp
+
+@pytest.fixture
+def plugins_dir(tmp_path):
+    """Empty plugin directory for a single test"""
+    d = tmp_path / 'plugins'
+    d.mkdir()
+    return d
+
+@pytest.fixture(scope='session')
+def plugin_sources_dir(tmp_path_factory):
+    """Directory the shared test plugin sources are written to"""
+    return tmp_path_factory.mktemp('plugins_src')
+
+def _plugin_source(directory, name, source):
+    path = directory / name
+    path.write_text(source)
+    return path
+
+@pytest.fixture(scope='session')
+def safe_plugin_path(plugin_sources_dir):
+    return _plugin_source(plugin_sources_dir, 'safe_plugin.py', SAFE_PLUGIN_SOURCE)
+
+@pytest.fixture(scope='session')
+def dangerous_plugin_path(plugin_sources_dir):
+    return _plugin_source(plugin_sources_dir, 'dangerous_plugin.py', DANGEROUS_PLUGIN_SOURCE)
+
+@pytest.fixture(scope='session')
+def memory_hog_path(plugin_sources_dir):
+    return _plugin_source(plugin_sources_dir, 'memory_hog.py', MEMORY_HOG_SOURCE)
+
+@pytest.fixture(scope='session')
+def cpu_hog_path(plugin_sources_dir):
+    return _plugin_source(plugin_sources_dir, 'cpu_hog.py', CPU_HOG_SOURCE)
+
+@pytest.fixture(scope='session')
+def valid_plugin_path(plugin_sources_dir):
+    return _plugin_source(plugin_sources_dir, 'valid_plugin.py', VALID_PLUGIN_SOURCE)
+
+@pytest.fixture(scope='session')
+def invalid_plugin_path(plugin_sources_dir):
+    return _plugin_source(plugin_sources_dir, 'invalid_plugin.py', INVALID_PLUGIN_SOURCE)
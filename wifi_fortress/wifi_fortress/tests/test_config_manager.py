@@ -12,6 +12,11 @@ def temp_config_dir(tmp_path):
 def config_manager(temp_config_dir):
     return ConfigManager(config_dir=temp_config_dir)
 
+@pytest.fixture(scope='module')
+def shared_config_manager(tmp_path_factory):
+    """Config manager shared by tests that only read the config"""
+    return ConfigManager(config_dir=str(tmp_path_factory.mktemp('cfg')))
+
 def test_config_creation(temp_config_dir):
     """Test that config file is created with defaults"""
     cm = ConfigManager(config_dir=temp_config_dir)
@@ -26,11 +31,11 @@ def test_config_creation(temp_config_dir):
     assert 'security' in config
     assert 'plugins' in config
 
-def test_get_config_value(config_manager):
+def test_get_config_value(shared_config_manager):
     """Test getting config values"""
-    assert config_manager.get('logging.level') == 'INFO'
-    assert config_manager.get('network_scanner.scan_interval') == 300
-    assert config_manager.get('nonexistent.key', 'default') == 'default'
+    assert shared_config_manager.get('logging.level') == 'INFO'
+    assert shared_config_manager.get('network_scanner.scan_interval') == 300
+    assert shared_config_manager.get('nonexistent.key', 'default') == 'default'
 
 def test_set_config_value(config_manager):
     """Test setting config values"""
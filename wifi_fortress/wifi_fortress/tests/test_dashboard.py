@@ -1,35 +1,64 @@
+import os
 import pytest
+from dataclasses import make_dataclass
+from datetime import datetime
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt
 from PyQt5.QtTest import QTest
 
 from wifi_fortress.gui.dashboard import (
-    DashboardWidget, StatusWidget, MetricsWidget,
+    _format_bytes_mb, DashboardWidget, StatusWidget, MetricsWidget,
     NetworkDevicesWidget, SecurityAlertsWidget, PluginsWidget
 )
 from wifi_fortress.core.health_monitor import HealthMonitor
 from wifi_fortress.core.network_mapper import NetworkMapper
 from wifi_fortress.core.plugin_loader import PluginLoader
 
+# Keep the Qt widget tests on one xdist worker (pytest -n auto --dist loadgroup)
+pytestmark = [pytest.mark.gui, pytest.mark.xdist_group('qt')]
+
 @pytest.fixture(scope='session')
 def app():
     """QApplication fixture that persists for the whole test session"""
     app = QApplication.instance()
     if app is None:
+        # Render offscreen unless a platform was chosen explicitly
+        os.environ.setdefault('QT_QPA_PLATFORM', 'offscreen')
         app = QApplication([])
     return app
 
-@pytest.fixture
-def dashboard(app, monkeypatch):
-    """DashboardWidget fixture with mocked monitoring"""
+@pytest.fixture(scope='module')
+def dashboard(app):
+    """DashboardWidget fixture with mocked monitoring, shared by the module"""
     # Prevent actual monitoring threads from starting
-    monkeypatch.setattr('wifi_fortress.core.health_monitor.HealthMonitor.start_monitoring', lambda *args: None)
-    monkeypatch.setattr('wifi_fortress.core.health_monitor.HealthMonitor.stop_monitoring', lambda *args: None)
-    
-    widget = DashboardWidget()
-    yield widget
-    # Clean up
-    widget.close()
+    orig_start = HealthMonitor.start_monitoring
+    orig_stop = HealthMonitor.stop_monitoring
+    HealthMonitor.start_monitoring = lambda *args, **kwargs: None
+    HealthMonitor.stop_monitoring = lambda *args, **kwargs: None
+    try:
+        widget = DashboardWidget()
+        yield widget
+        # Clean up
+        widget.close()
+    finally:
+        HealthMonitor.start_monitoring = orig_start
+        HealthMonitor.stop_monitoring = orig_stop
+
+@pytest.fixture(scope='module')
+def metrics_widget(app):
+    """MetricsWidget shared by the module, each update replaces its contents"""
+    return MetricsWidget()
+
+@pytest.fixture(scope='module')
+def _alerts_widget(app):
+    return SecurityAlertsWidget()
+
+@pytest.fixture
+def alerts_widget(_alerts_widget):
+    """SecurityAlertsWidget shared by the module, emptied for each test"""
+    _alerts_widget.alerts.clear()
+    _alerts_widget._update_table()
+    return _alerts_widget
 
 def test_dashboard_init(dashboard):
     """Test dashboard initialization"""
@@ -69,10 +98,10 @@ def test_status_widget(app):
     (50.0, 75.0, {'eth0': {'bytes_sent': 1024*1024, 'bytes_recv': 2*1024*1024}}),
     (0.0, 0.0, {}),
     (100.0, 100.0, {'wlan0': {'bytes_sent': 0, 'bytes_recv': 0}})
-])
-def test_metrics_widget(app, cpu, mem, net_io):
+], ids=['normal', 'zero', 'maxed'])
+def test_metrics_widget(metrics_widget, cpu, mem, net_io):
     """Test MetricsWidget functionality with different metrics"""
-    widget = MetricsWidget()
+    widget = metrics_widget
     
     class MockMetrics:
         cpu_percent = cpu
@@ -92,38 +121,66 @@ def test_metrics_widget(app, cpu, mem, net_io):
         assert widget.net_table.item(row, 1).text() == f"{io['bytes_sent']/1024/1024:.1f} MB"
         assert widget.net_table.item(row, 2).text() == f"{io['bytes_recv']/1024/1024:.1f} MB"
 
-def test_network_devices_widget(app):
+def test_format_bytes_mb():
+    """Test byte counts are formatted like the per-row f-strings"""
+    values = [0, 1024 * 1024, 2.5 * 1024 * 1024, 123456789]
+    assert _format_bytes_mb(values) == [f"{v / 1024 / 1024:.1f} MB" for v in values]
+    assert _format_bytes_mb([]) == []
+
+MockDevice = make_dataclass(
+    'MockDevice',
+    ['ip_address', 'mac_address', 'hostname', 'last_seen']
+)
+
+@pytest.fixture(scope='module')
+def mock_devices():
+    """Devices shown by the NetworkDevicesWidget tests, built once"""
+    last_seen = datetime(2025, 6, 22, 12, 0, 0)
+    return [
+        MockDevice("192.168.1.1", "00:11:22:33:44:55", "host-192.168.1.1", last_seen),
+        MockDevice("192.168.1.2", "AA:BB:CC:DD:EE:FF", None, last_seen)
+    ]
+
+@pytest.mark.parametrize('count', [0, 1, 2], ids=['empty', 'one', 'two'])
+def test_network_devices_widget(app, mock_devices, count):
     """Test NetworkDevicesWidget functionality"""
     widget = NetworkDevicesWidget()
+    devices = mock_devices[:count]
     
     # Test device updates
-    class MockDevice:
-        def __init__(self, ip, mac):
-            self.ip_address = ip
-            self.mac_address = mac
-            self.hostname = f"host-{ip}"
-            self.last_seen = "2025-06-22 12:00:00"
-    
-    devices = [
-        MockDevice("192.168.1.1", "00:11:22:33:44:55"),
-        MockDevice("192.168.1.2", "AA:BB:CC:DD:EE:FF")
-    ]
+    widget.update_devices(devices)
+    
+    assert widget.devices_table.rowCount() == count
+    for row, device in enumerate(devices):
+        assert widget.devices_table.item(row, 0).text() == device.ip_address
+        assert widget.devices_table.item(row, 1).text() == device.mac_address
+        assert widget.devices_table.item(row, 2).text() == (device.hostname or "Unknown")
+        assert widget.devices_table.item(row, 3).text() == "2025-06-22 12:00:00"
+
+def test_network_devices_widget_large(app, mock_devices):
+    """Test NetworkDevicesWidget fills a large device list in one pass"""
+    widget = NetworkDevicesWidget()
+    devices = mock_devices * 2500
     
     widget.update_devices(devices)
     
-    assert widget.devices_table.rowCount() == 2
-    assert widget.devices_table.item(0, 0).text() == "192.168.1.1"
-    assert widget.devices_table.item(0, 1).text() == "00:11:22:33:44:55"
-    assert widget.devices_table.item(0, 2).text() == "host-192.168.1.1"
+    assert widget.devices_table.rowCount() == 5000
+    assert widget.devices_table.item(4999, 0).text() == devices[-1].ip_address
+    assert widget.devices_table.updatesEnabled()
+    
+    # Refilling replaces the rows rather than appending to them
+    widget.update_devices(devices[:3])
+    assert widget.devices_table.rowCount() == 3
+    assert widget.devices_table.updatesEnabled()
 
 @pytest.mark.parametrize('level,source,message', [
     ('HIGH', 'Firewall', 'Unauthorized access attempt'),
     ('MEDIUM', 'Network', 'High latency detected'),
     ('LOW', 'System', 'Resource usage warning')
-])
-def test_security_alerts_widget(app, level, source, message):
+], ids=['high', 'medium', 'low'])
+def test_security_alerts_widget(alerts_widget, level, source, message):
     """Test SecurityAlertsWidget functionality with different alerts"""
-    widget = SecurityAlertsWidget()
+    widget = alerts_widget
     
     # Add alert
     widget.add_alert(level, source, message)
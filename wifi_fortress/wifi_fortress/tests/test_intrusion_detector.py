@@ -1,10 +1,33 @@
 import pytest
-from datetime import datetime, timedelta
+from collections import deque
+from types import SimpleNamespace
+from wifi_fortress.plugins import intrusion_detector as intrusion_detector_module
 from wifi_fortress.plugins.intrusion_detector import IntrusionDetector, IntrusionEvent
 
+FROZEN_NOW = 1_000_000.0        # Monotonic reading while the clock is frozen
+OLD_TIME = FROZEN_NOW - 10 * 60  # Outside a 5 minute lookback
+
+@pytest.fixture(scope='module')
+def intrusion_detector(tmp_path_factory):
+    return IntrusionDetector(data_dir=tmp_path_factory.mktemp('ids'))
+
 @pytest.fixture
-def intrusion_detector():
-    return IntrusionDetector()
+def frozen_clock(monkeypatch):
+    """Pin the detector's monotonic clock to FROZEN_NOW"""
+    monkeypatch.setattr(intrusion_detector_module, 'time',
+                        SimpleNamespace(monotonic=lambda: FROZEN_NOW))
+
+@pytest.fixture(autouse=True)
+def reset_intrusion_detector(intrusion_detector):
+    """Give each test a clean detector while sharing one instance per module"""
+    yield
+    with intrusion_detector._lock:
+        intrusion_detector._events.clear()
+        intrusion_detector._blacklist = frozenset()
+        intrusion_detector._known_devices = frozenset()
+        intrusion_detector._connection_attempts.clear()
+    intrusion_detector._known_devices_file.unlink(missing_ok=True)
+    intrusion_detector._blacklist_file.unlink(missing_ok=True)
 
 def test_intrusion_detector_init(intrusion_detector):
     """Test intrusion detector initialization"""
@@ -81,24 +104,34 @@ def test_suspicious_signal_strength(intrusion_detector):
     events = intrusion_detector.get_recent_events(minutes=1)
     assert not any(e.event_type == 'SuspiciousSignalStrength' for e in events)
 
-def test_event_management(intrusion_detector):
+def test_event_management(intrusion_detector, frozen_clock):
     """Test event management"""
     # Add test events
     for i in range(10):
-        event = IntrusionEvent('TestEvent', f'source{i}', {'test': i})
-        intrusion_detector._events.append(event)
+        intrusion_detector._log_event('TestEvent', f'source{i}', {'test': i})
     
     # Test recent events filtering
     recent = intrusion_detector.get_recent_events(minutes=5)
     assert len(recent) == 10
     
     # Make some events old
-    old_time = datetime.now() - timedelta(minutes=10)
-    for event in intrusion_detector._events[:5]:
-        event.timestamp = old_time
+    for i in range(5):
+        intrusion_detector._events[i].timestamp = OLD_TIME
     
     recent = intrusion_detector.get_recent_events(minutes=5)
     assert len(recent) == 5
+    
+    # Recent events come back oldest first
+    assert [e.source for e in recent] == [f'source{i}' for i in range(5, 10)]
+    
+    # Stored events are bounded, the oldest are dropped first
+    assert isinstance(intrusion_detector._events, deque)
+    maxlen = intrusion_detector._events.maxlen
+    assert maxlen is not None
+    for i in range(maxlen):
+        intrusion_detector._log_event('FillerEvent', f'filler{i}', {})
+    assert len(intrusion_detector._events) == maxlen
+    assert intrusion_detector._events[0].event_type == 'FillerEvent'
 
 def test_cleanup(intrusion_detector):
     """Test cleanup"""
@@ -115,15 +148,14 @@ def test_cleanup(intrusion_detector):
     assert len(intrusion_detector._blacklist) == 0
     assert len(intrusion_detector._known_devices) == 0
 
-def test_connection_window(intrusion_detector):
+def test_connection_window(intrusion_detector, frozen_clock):
     """Test connection attempt window"""
     mac = '00:11:22:33:44:55'
     ip = '192.168.1.100'
     
     # Make some old attempts
-    old_time = datetime.now() - timedelta(seconds=intrusion_detector._connection_window + 10)
-    for _ in range(3):
-        intrusion_detector._connection_attempts[mac].append(old_time)
+    old_time = FROZEN_NOW - (intrusion_detector._connection_window + 10)
+    intrusion_detector._connection_attempts[mac].extend([old_time] * 3)
     
     # Make some new attempts
     for _ in range(3):
@@ -137,3 +169,17 @@ def test_connection_window(intrusion_detector):
         intrusion_detector.analyze_connection(mac, ip)
     
     assert mac in intrusion_detector._blacklist
+
+def test_device_lists_persist(tmp_path):
+    """Test known devices and blacklist survive a cleanup/initialize cycle"""
+    detector = IntrusionDetector(data_dir=tmp_path)
+    detector.initialize()
+    detector.whitelist_device('00:11:22:33:44:55')
+    detector.blacklist_device('AA:BB:CC:DD:EE:FF', 'Test blacklist')
+    assert detector.cleanup()
+    
+    restored = IntrusionDetector(data_dir=tmp_path)
+    assert restored.initialize()
+    assert '00:11:22:33:44:55' in restored._known_devices
+    assert 'AA:BB:CC:DD:EE:FF' in restored._blacklist
+    assert not list(tmp_path.glob('*.tmp'))
@@ -5,7 +5,7 @@ from datetime import datetime
 from cryptography.fernet import Fernet
 from wifi_fortress.core.network_mapper import NetworkMapper, NetworkDevice
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def encryption_key():
     return Fernet.generate_key().decode()
 
@@ -13,6 +13,24 @@ def encryption_key():
 def network_mapper(encryption_key):
     return NetworkMapper(encryption_key=encryption_key)
 
+@pytest.fixture
+def skip_validation():
+    """Accept any interface and network without touching the system"""
+    orig_interface = NetworkMapper._validate_interface
+    orig_network = NetworkMapper._validate_network
+    NetworkMapper._validate_interface = lambda *args, **kwargs: True
+    NetworkMapper._validate_network = lambda *args, **kwargs: True
+    yield
+    NetworkMapper._validate_interface = orig_interface
+    NetworkMapper._validate_network = orig_network
+
+@pytest.fixture
+def netifaces_stub():
+    """Stub netifaces.interfaces and netifaces.ifaddresses for one test"""
+    with patch('netifaces.interfaces') as mock_interfaces, \
+            patch('netifaces.ifaddresses') as mock_ifaddresses:
+        yield mock_interfaces, mock_ifaddresses
+
 @pytest.fixture
 def mock_network_device():
     return NetworkDevice(
@@ -41,9 +59,8 @@ def test_encryption(network_mapper, mock_network_device):
     network_mapper._decrypt_device_data(mock_network_device)
     assert mock_network_device.mac_address == '00:11:22:33:44:55'
 
-@patch('netifaces.interfaces')
-@patch('netifaces.ifaddresses')
-def test_get_network_interfaces(mock_ifaddresses, mock_interfaces, network_mapper):
+def test_get_network_interfaces(netifaces_stub, network_mapper):
+    mock_interfaces, mock_ifaddresses = netifaces_stub
     mock_interfaces.return_value = ['eth0']
     mock_ifaddresses.return_value = {
         2: [{
@@ -58,13 +75,8 @@ def test_get_network_interfaces(mock_ifaddresses, mock_interfaces, network_mappe
     assert interfaces[0]['ip'] == '192.168.1.2'
     assert interfaces[0]['netmask'] == '255.255.255.0'
 
-@patch('wifi_fortress.core.network_mapper.NetworkMapper._validate_interface')
-@patch('wifi_fortress.core.network_mapper.NetworkMapper._validate_network')
-@patch('scapy.all.srp')
-def test_scan_network(mock_srp, mock_validate_network, mock_validate_interface, network_mapper):
+def test_scan_network(mock_srp, network_mapper, skip_validation):
     # Setup mocks
-    mock_validate_interface.return_value = True
-    mock_validate_network.return_value = True
     mock_response = Mock()
     mock_response.psrc = '192.168.1.1'
     mock_response.hwsrc = '00:11:22:33:44:55'
@@ -88,12 +100,7 @@ def test_scan_validation(network_mapper):
     with pytest.raises(ValueError):
         network_mapper.scan_network('eth0', '192.168.1.0/16')  # Too large
 
-@patch('wifi_fortress.core.network_mapper.NetworkMapper._validate_interface')
-@patch('wifi_fortress.core.network_mapper.NetworkMapper._validate_network')
-def test_continuous_scanning_start_stop(mock_validate_network, mock_validate_interface, network_mapper):
-    mock_validate_interface.return_value = True
-    mock_validate_network.return_value = True
-    
+def test_continuous_scanning_start_stop(network_mapper, skip_validation):
     with patch.object(network_mapper, 'scan_network') as mock_scan:
         # Start scanning
         network_mapper.start_continuous_scanning('eth0', '192.168.1.0/24', interval=60)
@@ -104,13 +111,7 @@ def test_continuous_scanning_start_stop(mock_validate_network, mock_validate_int
         assert network_mapper.stop_continuous_scanning(timeout=5)
         
         # Verify thread has stopped
-        max_wait = 5  # Maximum time to wait for thread to stop
-        start_time = time.time()
-        while network_mapper._active_thread.is_alive():
-            if time.time() - start_time > max_wait:
-                pytest.fail('Thread failed to stop within timeout')
-            time.sleep(0.1)
-        
+        network_mapper._active_thread.join(timeout=5)
         assert not network_mapper._active_thread.is_alive()
         
     # Test validation
@@ -142,52 +143,48 @@ def test_device_tracking(network_mapper, mock_network_device):
     assert len(device_history) == 1
     assert device_history[0].ip_address == mock_network_device.ip_address
 
-def test_error_handling(network_mapper):
+def test_error_handling(network_mapper, skip_validation, mock_srp, netifaces_stub):
     # Test interface error handling
-    with patch('netifaces.interfaces', side_effect=Exception('Test error')):
-        interfaces = network_mapper.get_network_interfaces()
-        assert interfaces == []
+    mock_interfaces, _ = netifaces_stub
+    mock_interfaces.side_effect = Exception('Test error')
+    interfaces = network_mapper.get_network_interfaces()
+    assert interfaces == []
     
     # Test scan error handling
-    with patch('scapy.all.srp', side_effect=Exception('Test error')):
-        with patch.object(network_mapper, '_validate_interface', return_value=True):
-            with patch.object(network_mapper, '_validate_network', return_value=True):
-                devices = network_mapper.scan_network('eth0', '192.168.1.0/24')
-                assert devices == []
+    mock_srp.side_effect = Exception('Test error')
+    devices = network_mapper.scan_network('eth0', '192.168.1.0/24')
+    assert devices == []
     
     # Test timeout handling
-    with patch('scapy.all.srp', side_effect=TimeoutError('Scan timeout')):
-        with patch.object(network_mapper, '_validate_interface', return_value=True):
-            with patch.object(network_mapper, '_validate_network', return_value=True):
-                devices = network_mapper.scan_network('eth0', '192.168.1.0/24')
-                assert devices == []
+    mock_srp.side_effect = TimeoutError('Scan timeout')
+    devices = network_mapper.scan_network('eth0', '192.168.1.0/24')
+    assert devices == []
 
-def test_rate_limiting(network_mapper):
+def test_rate_limiting(network_mapper, skip_validation, mock_srp):
     """Test rate limiting functionality"""
-    with patch.object(network_mapper, '_validate_interface', return_value=True):
-        with patch.object(network_mapper, '_validate_network', return_value=True):
-            with patch('scapy.all.srp', return_value=([], None)):
-                # Reset rate limiter to ensure clean state
-                network_mapper._rate_limiter.reset()
-                
-                # Should allow initial requests
-                for i in range(5):
-                    try:
-                        network_mapper.scan_network('eth0', '192.168.1.0/24')
-                    except RuntimeError as e:
-                        if 'Rate limit exceeded' in str(e):
-                            pytest.fail(f'Rate limit hit too early at request {i}')
-                        raise
-                
-                # Should block additional requests
-                with pytest.raises(RuntimeError, match='Rate limit exceeded'):
-                    network_mapper.scan_network('eth0', '192.168.1.0/24')
-                    
-                # Wait for rate limit window to expire and verify we can scan again
-                time.sleep(61)  # Wait just over the 60-second window
-                try:
-                    network_mapper.scan_network('eth0', '192.168.1.0/24')
-                except RuntimeError as e:
-                    if 'Rate limit exceeded' in str(e):
-                        pytest.fail('Rate limit still active after window expiry')
-                    raise
+    # Reset rate limiter to ensure clean state
+    network_mapper._rate_limiter.reset()
+    
+    # Should allow initial requests
+    for i in range(5):
+        try:
+            network_mapper.scan_network('eth0', '192.168.1.0/24')
+        except RuntimeError as e:
+            if 'Rate limit exceeded' in str(e):
+                pytest.fail(f'Rate limit hit too early at request {i}')
+            raise
+    
+    # Should block additional requests
+    with pytest.raises(RuntimeError, match='Rate limit exceeded'):
+        network_mapper.scan_network('eth0', '192.168.1.0/24')
+        
+    # Move the rate limiter's clock just past the 60-second window
+    # and verify we can scan again
+    real_clock = network_mapper._rate_limiter._clock
+    network_mapper._rate_limiter._clock = lambda: real_clock() + 61
+    try:
+        network_mapper.scan_network('eth0', '192.168.1.0/24')
+    except RuntimeError as e:
+        if 'Rate limit exceeded' in str(e):
+            pytest.fail('Rate limit still active after window expiry')
+        raise
@@ -0,0 +1,143 @@
+import os
+import pytest
+import wifi_fortress.utils.network_utils as network_utils
+from wifi_fortress.utils.network_utils import (
+    NetworkUsage, _dbm_to_percent, _read_proc_net_dev, _read_wireless_signal_dbm,
+    dbm_to_percent, is_interface_up
+)
+
+PROC_NET_WIRELESS = """\
+Inter-| sta-|   Quality        |   Discarded packets               | Missed | WE
+ face | tus | link level noise |  nwid  crypt   frag  retry   misc | beacon | 22
+ wlan0: 0000   54.  -56.  -256        0      0      0      3      0        0
+ wlan1: 0000    0     0     0         0      0      0      0      0        0
+ wlan2: 0000   30.   40.    0         0      0      0      0      0        0
+ wlan3: 0000
+"""
+
+@pytest.fixture
+def proc_net_wireless(tmp_path, monkeypatch):
+    path = tmp_path / 'wireless'
+    path.write_text(PROC_NET_WIRELESS)
+    monkeypatch.setattr(network_utils, '_PROC_NET_WIRELESS', str(path))
+    return path
+
+def test_is_interface_up_operstate(tmp_path, monkeypatch):
+    """Test the link state is read from operstate"""
+    for iface, state in (('eth0', 'up'), ('eth1', 'down'), ('wlan0', 'dormant')):
+        (tmp_path / iface).mkdir()
+        (tmp_path / iface / 'operstate').write_text(state + '\n')
+    monkeypatch.setattr(network_utils, '_SYS_CLASS_NET_OPERSTATE',
+                        str(tmp_path / '{}' / 'operstate'))
+    
+    assert is_interface_up('eth0')
+    assert not is_interface_up('eth1')
+    assert not is_interface_up('wlan0')
+    assert not is_interface_up('missing0')
+    assert not is_interface_up('../eth0')
+
+def test_dbm_to_percent():
+    """Test the array conversion matches the scalar one"""
+    levels = [-120, -100, -99, -75, -51, -50, -30, 0]
+    assert [_dbm_to_percent(d) for d in levels] == [0, 0, 2, 50, 98, 100, 100, 100]
+    assert dbm_to_percent(levels).tolist() == [_dbm_to_percent(d) for d in levels]
+    assert dbm_to_percent([[-100, -50]]).shape == (1, 2)
+
+@pytest.mark.parametrize('interface,dbm', [
+    ('wlan0', -56),  # Associated
+    ('wlan1', None), # Listed but not associated
+    ('wlan2', None), # Relative level, not dBm
+    ('wlan3', None), # Truncated row
+    ('eth0', None),  # Not a wireless interface
+])
+def test_read_wireless_signal_dbm(proc_net_wireless, interface, dbm):
+    """Test signal levels are only reported for real dBm readings"""
+    assert _read_wireless_signal_dbm(interface) == dbm
+
+def test_read_wireless_signal_dbm_missing_file(tmp_path, monkeypatch):
+    """Test systems without wireless extensions give no reading"""
+    monkeypatch.setattr(network_utils, '_PROC_NET_WIRELESS', str(tmp_path / 'missing'))
+    assert _read_wireless_signal_dbm('wlan0') is None
+
+def test_signal_strength_unassociated(proc_net_wireless, monkeypatch):
+    """Test an unassociated interface reports no signal instead of 100%"""
+    monkeypatch.setattr(network_utils.platform, 'system', lambda: 'Linux')
+    monkeypatch.setattr(network_utils.subprocess, 'check_output',
+                        lambda *args, **kwargs: b'wlan1     IEEE 802.11  ESSID:off/any\n')
+    assert network_utils.get_wifi_signal_strength('wlan0') == 88
+    assert network_utils.get_wifi_signal_strength('wlan1') is None
+
+PROC_NET_DEV = """\
+Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo:    1000      10    0    0    0     0          0         0     1000      10    0    0    0     0       0          0
+  eth0: 5000000    4000    2    3    0     0          0         7   200000    1500    4    5    0     0       0          0
+ wlan0:12345678    9000    0    1    0     0          0         0    54321     600    0    0    0     0       0          0
+"""
+
+@pytest.fixture
+def proc_net_dev(tmp_path, monkeypatch):
+    path = tmp_path / 'dev'
+    path.write_text(PROC_NET_DEV)
+    monkeypatch.setattr(network_utils, '_PROC_NET_DEV', str(path))
+    # Reopen against the fixture file; the real fd is restored afterwards
+    monkeypatch.setattr(network_utils, '_proc_net_dev_fd', None)
+    yield path
+    if network_utils._proc_net_dev_fd not in (None, -1):
+        os.close(network_utils._proc_net_dev_fd)
+
+def test_read_proc_net_dev(proc_net_dev):
+    """Test receive and transmit columns map onto the right counters"""
+    usage = _read_proc_net_dev('eth0')
+    assert usage == NetworkUsage(
+        bytes_sent=200000, bytes_recv=5000000,
+        packets_sent=1500, packets_recv=4000,
+        errin=2, errout=4, dropin=3, dropout=5
+    )
+    # Names and counters can run together once the byte count is wide
+    assert _read_proc_net_dev('wlan0').bytes_recv == 12345678
+    assert _read_proc_net_dev('missing0') is None
+
+def test_read_proc_net_dev_oversize(proc_net_dev, monkeypatch):
+    """Test a file too big for one read is left to psutil"""
+    monkeypatch.setattr(network_utils, '_PROC_NET_DEV_READ_SIZE', 64)
+    assert _read_proc_net_dev('eth0') is None
+
+def test_read_proc_net_dev_unavailable(tmp_path, monkeypatch):
+    """Test systems without /proc/net/dev are left to psutil"""
+    monkeypatch.setattr(network_utils, '_PROC_NET_DEV', str(tmp_path / 'missing'))
+    monkeypatch.setattr(network_utils, '_proc_net_dev_fd', None)
+    assert _read_proc_net_dev('eth0') is None
+    assert network_utils._proc_net_dev_fd == -1
+
+class FakePsutil:
+    def __init__(self, counters):
+        self.counters = counters
+        
+    def net_io_counters(self, pernic=False):
+        return self.counters
+
+def test_network_usage_psutil(monkeypatch):
+    """Test counters come from psutil when /proc/net/dev can't be used"""
+    counters = (100, 200, 1, 2, 0, 0, 3, 4)
+    monkeypatch.setattr(network_utils, '_proc_net_dev_fd', -1)
+    monkeypatch.setattr(network_utils, '_psutil', FakePsutil({'eth0': counters}))
+    
+    usage = network_utils.get_network_usage('eth0')
+    assert isinstance(usage, NetworkUsage)
+    assert tuple(usage) == counters
+    # Dict-style lookups from before the NamedTuple change still work
+    assert usage['bytes_sent'] == usage.bytes_sent == 100
+    assert usage[1] == 200
+    assert usage._asdict()['dropout'] == 4
+    with pytest.raises(KeyError):
+        usage['missing']
+
+def test_network_usage_unknown_interface(monkeypatch):
+    """Test unknown interfaces report zero counters"""
+    monkeypatch.setattr(network_utils, '_proc_net_dev_fd', -1)
+    monkeypatch.setattr(network_utils, '_psutil', FakePsutil({}))
+    
+    usage = network_utils.get_network_usage('missing0')
+    assert usage == NetworkUsage(0, 0, 0, 0, 0, 0, 0, 0)
+    assert usage['bytes_recv'] == 0
@@ -0,0 +1,64 @@
+import pytest
+import scapy.all as scapy
+from types import SimpleNamespace
+import wifi_fortress.plugins.packet_analyzer as packet_analyzer
+from wifi_fortress.plugins.packet_analyzer import PacketAnalyzer, _capture_filter
+
+@pytest.mark.parametrize('link_type,expected', [
+    ('1', packet_analyzer._ARP_FILTER),      # Ethernet and managed-mode Wi-Fi
+    ('772', packet_analyzer._ARP_FILTER),    # Loopback
+    ('801', packet_analyzer._DOT11_FILTER),  # Raw 802.11
+    ('803', packet_analyzer._DOT11_FILTER),  # Monitor mode with radiotap
+    ('garbage', packet_analyzer._ARP_FILTER),
+])
+def test_capture_filter(tmp_path, monkeypatch, link_type, expected):
+    """Test the 802.11 clause is only used on 802.11 links"""
+    (tmp_path / 'wlan0').mkdir()
+    (tmp_path / 'wlan0' / 'type').write_text(link_type + '\n')
+    monkeypatch.setattr(packet_analyzer, '_SYS_CLASS_NET_TYPE',
+                        str(tmp_path / '{}' / 'type'))
+    assert _capture_filter('wlan0') == expected
+
+def test_capture_filter_unknown_interface(tmp_path, monkeypatch):
+    """Test interfaces without a readable link type get ARP only"""
+    monkeypatch.setattr(packet_analyzer, '_SYS_CLASS_NET_TYPE',
+                        str(tmp_path / '{}' / 'type'))
+    assert _capture_filter('missing0') == packet_analyzer._ARP_FILTER
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Settable monotonic clock for the analyzer"""
+    now = [1000.0]
+    monkeypatch.setattr(packet_analyzer, 'time', SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+def beacon(bssid, ssid=b'TestNet'):
+    return scapy.Dot11(addr1='ff:ff:ff:ff:ff:ff', addr2=bssid, addr3=bssid) / \
+        scapy.Dot11Beacon() / scapy.Dot11Elt(ID=0, info=ssid)
+
+def test_packet_stats_expiry(clock):
+    """Test BSSIDs expire by last sighting even when seen out of queue order"""
+    analyzer = PacketAnalyzer()
+    ttl = analyzer._stats_ttl
+    
+    start = clock[0]
+    analyzer.detect_beacon_flood(beacon('02:00:00:00:00:0a'))
+    clock[0] = start + 20
+    analyzer.detect_beacon_flood(beacon('02:00:00:00:00:0b'))
+    # A is seen again after B was queued
+    clock[0] = start + 50
+    analyzer.detect_beacon_flood(beacon('02:00:00:00:00:0a'))
+    
+    # Neither has gone a full TTL unseen, A's first record is skipped
+    clock[0] = start + 20 + ttl - 1
+    analyzer.update_packet_stats(None)
+    assert set(analyzer.packet_stats) == {'02:00:00:00:00:0a', '02:00:00:00:00:0b'}
+    
+    # B expires first, then A, whatever order their records were queued in
+    clock[0] = start + 20 + ttl + analyzer._expiry_granularity + 1
+    analyzer.update_packet_stats(None)
+    assert set(analyzer.packet_stats) == {'02:00:00:00:00:0a'}
+    clock[0] = start + 50 + ttl + analyzer._expiry_granularity + 1
+    analyzer.update_packet_stats(None)
+    assert analyzer.packet_stats == {}
+    assert not analyzer._expiry
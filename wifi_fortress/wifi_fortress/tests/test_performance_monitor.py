@@ -1,117 +1,171 @@
 import pytest
 import time
 from unittest.mock import Mock, patch
-from wifi_fortress.plugins.performance_monitor import PerformanceMonitor, NetworkStats
+from wifi_fortress.core.poller import get_net_stats_poller
+from wifi_fortress.plugins.performance_monitor import (
+    PerformanceMonitor, NetworkStats, NetworkStatsHistory
+)
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def performance_monitor():
-    return PerformanceMonitor()
+    monitor = PerformanceMonitor()
+    yield monitor
+    monitor.cleanup()
+
+@pytest.fixture
+def net_if_stats():
+    """Stub the interface list read by PerformanceMonitor.initialize"""
+    with patch('psutil.net_if_stats') as mock_stats:
+        mock_stats.return_value = {'eth0': Mock()}
+        yield mock_stats
 
-def test_performance_monitor_init(performance_monitor):
+@pytest.fixture(autouse=True)
+def reset_performance_monitor(performance_monitor):
+    """Give each test a clean monitor while sharing one instance per module"""
+    thresholds = dict(performance_monitor._alert_thresholds)
+    yield
+    # Stop sampling so no poller thread outlives the test that started it
+    poller = get_net_stats_poller()
+    if poller.is_subscribed(performance_monitor._on_net_stats):
+        performance_monitor.cleanup()
+    assert not poller.is_subscribed(performance_monitor._on_net_stats)
+    with performance_monitor._lock:
+        performance_monitor._stats_history.clear()
+    performance_monitor._last_check.clear()
+    performance_monitor._alert_thresholds.update(thresholds)
+
+def test_performance_monitor_init(performance_monitor, net_if_stats):
     """Test performance monitor initialization"""
     assert performance_monitor.name == 'Performance Monitor'
     assert performance_monitor.version == '1.0.0'
     assert performance_monitor.enabled
     
     # Test initialization
-    with patch('psutil.net_if_stats') as mock_stats:
-        mock_stats.return_value = {'eth0': Mock(), 'wlan0': Mock()}
-        assert performance_monitor.initialize()
-        assert len(performance_monitor._stats_history) == 2
-        assert 'eth0' in performance_monitor._stats_history
-        assert 'wlan0' in performance_monitor._stats_history
+    net_if_stats.return_value = {'eth0': Mock(), 'wlan0': Mock()}
+    assert performance_monitor.initialize()
+    assert len(performance_monitor._stats_history) == 2
+    assert 'eth0' in performance_monitor._stats_history
+    assert 'wlan0' in performance_monitor._stats_history
 
 def test_monitor_loop(performance_monitor):
     """Test monitoring loop"""
-    # Mock network stats
-    mock_stats = {
-        'eth0': Mock(
-            bytes_sent=1000,
-            bytes_recv=2000,
-            packets_sent=100,
-            packets_recv=200,
-            errin=1,
-            errout=2,
-            dropin=3,
-            dropout=4
-        )
-    }
-    
-    with patch('psutil.net_io_counters', return_value=mock_stats):
-        # Initialize monitor
-        performance_monitor.initialize()
-        
-        # Let it run for a bit
-        time.sleep(2)
-        
-        # Check collected stats
-        stats = performance_monitor.get_interface_stats('eth0', duration=1)
-        assert len(stats) > 0
-        
-        # Verify stats content
-        latest_stat = stats[-1]
-        assert isinstance(latest_stat, NetworkStats)
-        assert latest_stat.bytes_sent >= 0
-        assert latest_stat.bytes_recv >= 0
-        assert latest_stat.packets_sent >= 0
-        assert latest_stat.packets_recv >= 0
+    # Mock network stats for two consecutive polls
+    def mock_counters(scale):
+        return {
+            'eth0': Mock(
+                bytes_sent=1000 * scale,
+                bytes_recv=2000 * scale,
+                packets_sent=100 * scale,
+                packets_recv=200 * scale,
+                errin=1,
+                errout=2,
+                dropin=3,
+                dropout=4
+            )
+        }
+    
+    # Feed samples the way the poller would instead of waiting on it
+    performance_monitor._stats_history['eth0'] = NetworkStatsHistory(
+        performance_monitor._history_length
+    )
+    now = time.monotonic()
+    performance_monitor._on_net_stats(now - 1, mock_counters(1))
+    performance_monitor._on_net_stats(now, mock_counters(2))
+    
+    # Check collected stats
+    stats = performance_monitor.get_interface_stats('eth0', duration=1)
+    assert len(stats) == 1
+    
+    # Verify stats content
+    latest_stat = stats[-1]
+    assert isinstance(latest_stat, NetworkStats)
+    assert latest_stat.bytes_sent == pytest.approx(1000)
+    assert latest_stat.bytes_recv == pytest.approx(2000)
+    assert latest_stat.packets_sent == pytest.approx(100)
+    assert latest_stat.packets_recv == pytest.approx(200)
 
 def test_cleanup(performance_monitor):
     """Test cleanup"""
     performance_monitor.initialize()
+    poller = get_net_stats_poller()
+    assert poller.is_subscribed(performance_monitor._on_net_stats)
     assert performance_monitor.cleanup()
-    assert not performance_monitor._monitor_thread.is_alive()
+    assert not poller.is_subscribed(performance_monitor._on_net_stats)
 
-def test_get_interface_stats(performance_monitor):
+def test_get_interface_stats(performance_monitor, net_if_stats):
     """Test getting interface statistics"""
     # Initialize with mock data
-    with patch('psutil.net_if_stats') as mock_stats:
-        mock_stats.return_value = {'eth0': Mock()}
-        performance_monitor.initialize()
-        
-        # Add some test stats
-        test_stats = NetworkStats()
-        test_stats.bytes_sent = 1000
-        test_stats.bytes_recv = 2000
-        
-        with performance_monitor._lock:
-            performance_monitor._stats_history['eth0'].append(test_stats)
-        
-        # Get stats
-        stats = performance_monitor.get_interface_stats('eth0', duration=60)
-        assert len(stats) > 0
-        assert isinstance(stats[0], NetworkStats)
-        
-        # Test nonexistent interface
-        assert performance_monitor.get_interface_stats('invalid') == []
+    performance_monitor.initialize()
+    
+    # Add some test stats
+    test_stats = NetworkStats()
+    test_stats.bytes_sent = 1000
+    test_stats.bytes_recv = 2000
+    
+    with performance_monitor._lock:
+        performance_monitor._stats_history['eth0'].append(test_stats)
+    
+    # Get stats
+    stats = performance_monitor.get_interface_stats('eth0', duration=60)
+    assert len(stats) > 0
+    assert isinstance(stats[0], NetworkStats)
+    
+    # Test nonexistent interface
+    assert performance_monitor.get_interface_stats('invalid') == []
 
-def test_get_current_bandwidth(performance_monitor):
+def test_stats_history_ring():
+    """Test the stats history keeps the newest samples in order"""
+    history = NetworkStatsHistory(capacity=4)
+    now = time.monotonic()
+    for i in range(6):
+        stats = NetworkStats()
+        stats.timestamp = now - 5 + i
+        stats.bytes_sent = i
+        history.append(stats)
+    
+    assert len(history) == 4
+    assert history.latest('bytes_sent') == 5
+    assert list(history.since(now - 10)['bytes_sent']) == [2, 3, 4, 5]
+    assert list(history.since(now - 1)['bytes_sent']) == [4, 5]
+
+def test_stats_history_since_copies():
+    """Test query results aren't changed by later samples"""
+    history = NetworkStatsHistory(capacity=4)
+    now = time.monotonic()
+    stats = NetworkStats()
+    stats.timestamp = now
+    stats.bytes_sent = 1
+    history.append(stats)
+    
+    result = history.since(now - 10)
+    history.columns['bytes_sent'][0] = 99
+    assert list(result['bytes_sent']) == [1]
+
+def test_get_current_bandwidth(performance_monitor, net_if_stats):
     """Test bandwidth calculation"""
     # Initialize with mock data
-    with patch('psutil.net_if_stats') as mock_stats:
-        mock_stats.return_value = {'eth0': Mock()}
-        performance_monitor.initialize()
-        
-        # Add test stats
-        test_stats = NetworkStats()
-        test_stats.bytes_sent = 1_000_000  # 1 MB
-        test_stats.bytes_recv = 2_000_000  # 2 MB
-        
-        with performance_monitor._lock:
-            performance_monitor._stats_history['eth0'].append(test_stats)
-        
-        # Get bandwidth
-        bandwidth = performance_monitor.get_current_bandwidth('eth0')
-        assert isinstance(bandwidth, dict)
-        assert 'rx_mbps' in bandwidth
-        assert 'tx_mbps' in bandwidth
-        assert bandwidth['rx_mbps'] > 0
-        assert bandwidth['tx_mbps'] > 0
-        
-        # Test nonexistent interface
-        bandwidth = performance_monitor.get_current_bandwidth('invalid')
-        assert bandwidth['rx_mbps'] == 0
-        assert bandwidth['tx_mbps'] == 0
+    performance_monitor.initialize()
+    
+    # Add test stats
+    test_stats = NetworkStats()
+    test_stats.bytes_sent = 1_000_000  # 1 MB
+    test_stats.bytes_recv = 2_000_000  # 2 MB
+    
+    with performance_monitor._lock:
+        performance_monitor._stats_history['eth0'].append(test_stats)
+    
+    # Get bandwidth
+    bandwidth = performance_monitor.get_current_bandwidth('eth0')
+    assert isinstance(bandwidth, dict)
+    assert 'rx_mbps' in bandwidth
+    assert 'tx_mbps' in bandwidth
+    assert bandwidth['rx_mbps'] > 0
+    assert bandwidth['tx_mbps'] > 0
+    
+    # Test nonexistent interface
+    bandwidth = performance_monitor.get_current_bandwidth('invalid')
+    assert bandwidth['rx_mbps'] == 0
+    assert bandwidth['tx_mbps'] == 0
 
 def test_alert_thresholds(performance_monitor):
     """Test alert threshold management"""
@@ -128,31 +182,30 @@ def test_alert_thresholds(performance_monitor):
     assert performance_monitor._alert_thresholds['drop_rate'] == 0.05
     assert performance_monitor._alert_thresholds['latency_ms'] == 50
 
-def test_thread_safety(performance_monitor):
+def test_thread_safety(performance_monitor, net_if_stats):
     """Test thread safety of stats collection"""
     import threading
     
     # Initialize monitor
-    with patch('psutil.net_if_stats') as mock_stats:
-        mock_stats.return_value = {'eth0': Mock()}
-        performance_monitor.initialize()
-        
-        # Function to simulate concurrent access
-        def concurrent_access():
-            for _ in range(100):
-                stats = performance_monitor.get_interface_stats('eth0')
-                bandwidth = performance_monitor.get_current_bandwidth('eth0')
-        
-        # Create multiple threads
-        threads = [
-            threading.Thread(target=concurrent_access)
-            for _ in range(5)
-        ]
-        
-        # Run threads
-        for thread in threads:
-            thread.start()
-        for thread in threads:
-            thread.join()
-        
-        # If we got here without exceptions, thread safety worked
+    performance_monitor.initialize()
+    
+    # Readers line up on a barrier before each round so their calls overlap
+    barrier = threading.Barrier(2)
+    errors = []
+    
+    def concurrent_access():
+        try:
+            for _ in range(5):
+                barrier.wait(timeout=5)
+                performance_monitor.get_interface_stats('eth0')
+                performance_monitor.get_current_bandwidth('eth0')
+        except Exception as e:
+            errors.append(e)
+    
+    threads = [threading.Thread(target=concurrent_access) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=10)
+    
+    assert not errors
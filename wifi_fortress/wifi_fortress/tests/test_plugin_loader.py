@@ -4,14 +4,6 @@ import sys
 from pathlib import Path
 from wifi_fortress.core.plugin_loader import Plugin, PluginLoader, PluginError
 
-logger = logging.getLogger(__name__)
-
-# Configure logging for tests
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
-
 class TestPlugin(Plugin):
     name = 'Test Plugin'
     description = 'Test plugin for unit testing'
@@ -38,33 +30,7 @@ class TestPlugin(Plugin):
         return {k.upper(): v.upper() if isinstance(v, str) else v
                 for k, v in input_data.items()}
 
-@pytest.fixture
-def temp_plugin_dir(tmp_path):
-    """Create a temporary plugin directory"""
-    # Create plugins directory
-    plugin_dir = tmp_path / 'plugins'
-    plugin_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Add parent directory to Python path
-    parent_dir = str(tmp_path)
-    if parent_dir not in sys.path:
-        sys.path.insert(0, parent_dir)
-    return plugin_dir
-
-@pytest.fixture
-def plugin_loader(tmp_path):
-    """Create a plugin loader for testing"""
-    plugin_dir = tmp_path / 'plugins'
-    config_dir = tmp_path / 'config'
-    plugin_dir.mkdir()
-    config_dir.mkdir()
-    return PluginLoader(plugin_dir, config_dir)
-
-@pytest.fixture
-def test_plugin_file(plugin_loader):
-    """Create a test plugin file"""
-    plugin_file = plugin_loader.plugin_dir / 'test_plugin.py'
-    plugin_content = '''
+TEST_PLUGIN_SOURCE = '''
 from wifi_fortress.core.plugin_loader import Plugin
 
 class TestPlugin(Plugin):
@@ -85,35 +51,46 @@ class TestPlugin(Plugin):
         self.enabled = False
         return True
 '''
-    plugin_file.write_text(plugin_content)
-    
-    # Wait for file to be written
+
+@pytest.fixture(scope='module')
+def _plugin_loader_base(tmp_path_factory):
+    """Plugin loader shared by the module, with the test plugin written once"""
+    base_dir = tmp_path_factory.mktemp('plugins_shared')
+    plugin_dir = base_dir / 'plugins'
+    config_dir = base_dir / 'config'
+    plugin_dir.mkdir()  # PluginLoader creates the config directory
+    (plugin_dir / 'test_plugin.py').write_text(TEST_PLUGIN_SOURCE)
+    
+    loader = PluginLoader(plugin_dir, config_dir)
+    return loader, dict(loader.plugins)
+
+def reset_state(loader: PluginLoader, plugins: dict) -> None:
+    """Return a shared loader to its freshly loaded state"""
+    loader.active_plugins.clear()
+    loader.loaded_instances.clear()
+    loader.plugins.clear()
+    loader.plugins.update(plugins)
+
+@pytest.fixture
+def plugin_loader(_plugin_loader_base):
+    """Create a plugin loader for testing"""
+    loader, plugins = _plugin_loader_base
+    reset_state(loader, plugins)
+    yield loader
+    reset_state(loader, plugins)
+
+@pytest.fixture
+def test_plugin_file(plugin_loader):
+    """Path of the test plugin file"""
+    plugin_file = plugin_loader.plugin_dir / 'test_plugin.py'
     assert plugin_file.exists(), "Plugin file not created"
-    
-    # Clean up module if it exists
-    module_name = plugin_file.stem
-    if module_name in sys.modules:
-        logger.debug(f'Removing existing module: {module_name}')
-        del sys.modules[module_name]
-    
-    # Clean up any previous instances
-    for cls in Plugin.__subclasses__():
-        if cls.__name__ == 'TestPlugin':
-            logger.debug('Found existing TestPlugin class, removing from Plugin subclasses')
-            Plugin.__subclasses__().remove(cls)
-    
-    # Force plugin loader to reload plugins
-    plugin_loader._load_plugins()
-    
-    return plugin_path
+    return plugin_file
 
-@pytest.fixture(autouse=True)
-def _cleanup_sys_modules():
-    """Clean up test plugin modules from sys.modules after each test"""
+@pytest.fixture
+def cleanup_plugin_modules(test_plugin_file):
+    """Drop the test plugin's module if the test imported it"""
     yield
-    for name in list(sys.modules.keys()):
-        if name.startswith('test_plugin'):
-            del sys.modules[name]
+    sys.modules.pop(test_plugin_file.stem, None)
 
 def test_plugin_base_class():
     """Test Plugin base class"""
@@ -143,10 +120,30 @@ def test_plugin_base_class():
     assert not plugin.enabled, "Plugin still enabled after cleanup"
     assert not plugin.initialized, "Plugin still initialized after cleanup"
 
-def test_plugin_loader_init(plugin_loader, temp_plugin_dir):
+def test_plugin_registry():
+    """Test Plugin subclasses register themselves by module and qualified name"""
+    assert Plugin._registry[f'{__name__}.TestPlugin'] is TestPlugin
+    
+    class RegisteredPlugin(Plugin):
+        name = 'Registered Plugin'
+    
+    key = f'{__name__}.test_plugin_registry.<locals>.RegisteredPlugin'
+    assert Plugin._registry.pop(key) is RegisteredPlugin
+    assert f'{Plugin.__module__}.Plugin' not in Plugin._registry, \
+        "Base class should not register itself"
+    
+    # Same class name in different modules doesn't collide
+    first = type('DuplicatePlugin', (Plugin,), {'__module__': 'plugin_a'})
+    second = type('DuplicatePlugin', (Plugin,), {'__module__': 'plugin_b'})
+    assert Plugin._registry.pop('plugin_a.DuplicatePlugin') is first
+    assert Plugin._registry.pop('plugin_b.DuplicatePlugin') is second
+
+def test_plugin_loader_init(plugins_dir):
     """Test PluginLoader initialization"""
+    plugin_loader = PluginLoader(plugins_dir, plugins_dir.parent / 'config')
+    
     # Check directory path
-    assert plugin_loader.plugin_dir == Path(temp_plugin_dir), "Plugin directory path mismatch"
+    assert plugin_loader.plugin_dir == Path(plugins_dir), "Plugin directory path mismatch"
     assert plugin_loader.plugin_dir.exists(), "Plugin directory does not exist"
     assert plugin_loader.plugin_dir.is_dir(), "Plugin directory path is not a directory"
     
@@ -160,11 +157,8 @@ def test_plugin_loader_init(plugin_loader, temp_plugin_dir):
     assert len(plugin_loader.active_plugins) == 0, "Active plugins registry not empty at initialization"
     assert len(plugin_loader.loaded_instances) == 0, "Loaded instances registry not empty at initialization"
 
-def test_plugin_loading(plugin_loader, test_plugin_file):
+def test_plugin_loading(plugin_loader, test_plugin_file, cleanup_plugin_modules):
     """Test plugin loading"""
-    # Force reload to ensure clean state
-    plugin_loader._load_plugins()
-    
     # Plugin should be loaded
     available_plugins = plugin_loader.get_available_plugins()
     assert 'TestPlugin' in available_plugins, "TestPlugin not found in available plugins"
@@ -179,9 +173,6 @@ def test_plugin_loading(plugin_loader, test_plugin_file):
 
 def test_plugin_activation(plugin_loader, test_plugin_file):
     """Test plugin activation and deactivation"""
-    # Force reload to ensure clean state
-    plugin_loader.reload_plugins()
-    
     # Initial state
     assert 'TestPlugin' in plugin_loader.plugins, "TestPlugin not found in available plugins"
     assert len(plugin_loader.active_plugins) == 0, "Active plugins not empty at start"
@@ -206,9 +197,6 @@ def test_plugin_activation(plugin_loader, test_plugin_file):
 
 def test_plugin_errors(plugin_loader):
     """Test plugin error handling"""
-    # Force reload to ensure clean state
-    plugin_loader.reload_plugins()
-    
     # Test non-existent plugin
     with pytest.raises(KeyError):
         plugin_loader.instantiate_plugin('NonExistentPlugin')
@@ -251,36 +239,31 @@ def test_plugin_errors(plugin_loader):
 
 def test_plugin_listing(plugin_loader, test_plugin_file):
     """Test plugin listing methods"""
-    # Force reload to ensure clean state
-    plugin_loader._load_plugins()
-    
-    # Get available plugins
-    available_plugins = plugin_loader.get_available_plugins()
-    assert len(available_plugins) > 0, "No plugins found"
-    assert 'TestPlugin' in available_plugins, "TestPlugin not found in available plugins"
+    # Verify no active plugins initially
+    active = plugin_loader.get_active_plugins()
+    assert len(active) == 0, f"Expected 0 active plugins, got {len(active)}: {active}"
     
-    # Get active plugins (should be empty)
-    active_plugins = plugin_loader.get_active_plugins()
-    assert len(active_plugins) == 0, "Active plugins not empty at start"
+    # Check available plugins
+    available = plugin_loader.get_available_plugins()
+    assert len(available) == 1, f"Expected 1 available plugin, got {len(available)}: {available}"
+    assert 'TestPlugin' in available, f"TestPlugin not found in available plugins: {available}"
     
-    # Activate plugin
+    # Activate plugin and verify it appears in active list
     success = plugin_loader.activate_plugin('TestPlugin')
     assert success, "Failed to activate TestPlugin"
     
-    # Check active plugins
-    active_plugins = plugin_loader.get_active_plugins()
-    assert len(active_plugins) == 1, "Wrong number of active plugins"
-    assert 'TestPlugin' in active_plugins, "TestPlugin not in active plugins"
+    active = plugin_loader.get_active_plugins()
+    assert len(active) == 1, f"Expected 1 active plugin after activation, got {len(active)}: {active}"
+    assert 'TestPlugin' in active, f"TestPlugin not found in active plugins after activation: {active}"
     
     # Deactivate plugin
     success = plugin_loader.deactivate_plugin('TestPlugin')
     assert success, "Failed to deactivate TestPlugin"
     
-    # Check active plugins again
-    active_plugins = plugin_loader.get_active_plugins()
-    assert len(active_plugins) == 0, "Active plugins not empty after deactivation"
+    active = plugin_loader.get_active_plugins()
+    assert len(active) == 0, f"Expected 0 active plugins after deactivation, got {len(active)}: {active}"
 
-def test_plugin_reload(plugin_loader, test_plugin_file):
+def test_plugin_reload(plugin_loader, test_plugin_file, cleanup_plugin_modules):
     """Test plugin reloading"""
     # Initial state check
     assert 'TestPlugin' in plugin_loader.plugins, "TestPlugin not found in available plugins"
@@ -313,25 +296,42 @@ def test_plugin_reload(plugin_loader, test_plugin_file):
     # Verify instance was recreated
     assert id(new_instance) != id(initial_instance), "Plugin instance not recreated on reload"
 
-def test_plugin_listing(plugin_loader, test_plugin_file):
-    """Test plugin listing methods"""
-    # Force reload plugins to ensure clean state
-    plugin_loader.reload_plugins()
-    
-    # Verify no active plugins initially
-    active = plugin_loader.get_active_plugins()
-    assert len(active) == 0, f"Expected 0 active plugins, got {len(active)}: {active}"
-    
-    # Check available plugins
-    available = plugin_loader.get_available_plugins()
-    assert len(available) == 1, f"Expected 1 available plugin, got {len(available)}: {available}"
-    assert 'TestPlugin' in available, f"TestPlugin not found in available plugins: {available}"
-    
-    # Activate plugin and verify it appears in active list
-    success = plugin_loader.activate_plugin('TestPlugin')
-    assert success, "Failed to activate TestPlugin"
-    
-    active = plugin_loader.get_active_plugins()
-    assert len(active) == 1, f"Expected 1 active plugin after activation, got {len(active)}: {active}"
-    assert 'TestPlugin' in active, f"TestPlugin not found in active plugins after activation: {active}"
+def test_deactivate_all(plugin_loader):
+    """Test deactivating all active plugins at shutdown"""
+    class SlowPlugin(TestPlugin):
+        def cleanup(self) -> bool:
+            import time
+            time.sleep(0.2)
+            return super().cleanup()
+    
+    # Activate several slow-to-cleanup plugins
+    instances = []
+    for i in range(3):
+        instance = SlowPlugin()
+        instance.initialize()
+        plugin_loader.active_plugins[f'SlowPlugin{i}'] = instance
+        instances.append(instance)
+    
+    assert plugin_loader.deactivate_all(timeout=5), "Failed to deactivate all plugins"
+    assert len(plugin_loader.get_active_plugins()) == 0, "Active plugins not empty after deactivate_all"
+    assert not any(instance.enabled for instance in instances), "Plugin still enabled after deactivate_all"
 
+def test_deactivate_all_timeout(plugin_loader):
+    """Test a plugin stuck in cleanup doesn't hold up deactivate_all"""
+    import threading
+    release = threading.Event()
+    
+    class StuckPlugin(TestPlugin):
+        def cleanup(self) -> bool:
+            release.wait(5)
+            return super().cleanup()
+            
+    instance = StuckPlugin()
+    instance.initialize()
+    plugin_loader.active_plugins['StuckPlugin'] = instance
+    try:
+        assert not plugin_loader.deactivate_all(timeout=0.1)
+        stuck = [t for t in threading.enumerate() if t.name == 'deactivate_StuckPlugin']
+        assert stuck and all(t.daemon for t in stuck)
+    finally:
+        release.set()
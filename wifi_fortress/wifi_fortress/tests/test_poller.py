@@ -0,0 +1,42 @@
+import threading
+from unittest.mock import Mock, patch
+from wifi_fortress.core.poller import NetStatsPoller
+
+def test_subscribers_share_samples():
+    """Test every subscriber receives the same counter snapshot"""
+    poller = NetStatsPoller(tick=0.01)
+    counters = {'eth0': Mock()}
+    received = []
+    done = threading.Event()
+    
+    def first(timestamp, stats):
+        received.append(('first', timestamp, stats))
+        
+    def second(timestamp, stats):
+        received.append(('second', timestamp, stats))
+        done.set()
+    
+    with patch('psutil.net_io_counters', return_value=counters) as mock_counters:
+        poller.subscribe(first, interval=60)
+        poller.subscribe(second, interval=60)
+        assert done.wait(timeout=2)
+        poller.unsubscribe(first)
+        poller.unsubscribe(second)
+    
+    assert all(stats is counters for _, _, stats in received)
+    assert {name for name, _, _ in received} == {'first', 'second'}
+    assert mock_counters.call_count <= 2
+
+def test_thread_stops_without_subscribers():
+    """Test the poller thread exits once the last subscriber leaves"""
+    poller = NetStatsPoller(tick=0.01)
+    callback = Mock()
+    
+    with patch('psutil.net_io_counters', return_value={}):
+        poller.subscribe(callback)
+        thread = poller._thread
+        assert thread.is_alive()
+        
+        poller.unsubscribe(callback)
+        assert not thread.is_alive()
+        assert not poller.is_subscribed(callback)
@@ -1,10 +1,15 @@
 import pytest
-import time
 from wifi_fortress.core.rate_limiter import RateLimiter
 
 @pytest.fixture
-def rate_limiter():
-    return RateLimiter(max_requests=5, time_window=1)  # 5 requests per second for testing
+def mock_clock():
+    """Clock the tests advance by hand instead of sleeping"""
+    return [0.0]
+
+@pytest.fixture
+def rate_limiter(mock_clock):
+    # 5 requests per second for testing
+    return RateLimiter(max_requests=5, time_window=1, clock=lambda: mock_clock[0])
 
 def test_rate_limiter_init(rate_limiter):
     """Test rate limiter initialization"""
@@ -21,14 +26,14 @@ def test_rate_limiter_allow_request(rate_limiter):
     # Should block additional requests
     assert not rate_limiter.allow_request()
 
-def test_rate_limiter_window_sliding(rate_limiter):
+def test_rate_limiter_window_sliding(rate_limiter, mock_clock):
     """Test sliding window functionality"""
     # Fill up the limit
     for _ in range(5):
         assert rate_limiter.allow_request()
     
     # Wait for window to slide
-    time.sleep(1.1)  # Slightly longer than window
+    mock_clock[0] += 1.1  # Slightly longer than window
     
     # Should allow new requests
     assert rate_limiter.allow_request()
@@ -46,7 +51,7 @@ def test_rate_limiter_reset(rate_limiter):
     # Should allow new requests
     assert rate_limiter.allow_request()
 
-def test_rate_limiter_current_usage(rate_limiter):
+def test_rate_limiter_current_usage(rate_limiter, mock_clock):
     """Test current usage tracking"""
     assert rate_limiter.current_usage == 0
     
@@ -56,5 +61,5 @@ def test_rate_limiter_current_usage(rate_limiter):
         assert rate_limiter.current_usage == i + 1
     
     # Wait for window to slide
-    time.sleep(1.1)
+    mock_clock[0] += 1.1
     assert rate_limiter.current_usage == 0
@@ -8,82 +8,37 @@ from pathlib import Path
 
 from wifi_fortress.core.sandbox import PluginSandbox, SecurityError
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def sandbox():
     """Create a plugin sandbox for testing"""
     return PluginSandbox(max_memory_mb=10, max_cpu_time=1)
 
-def test_safe_plugin(sandbox, tmp_path):
+@pytest.fixture(scope='module')
+def fast_sandbox():
+    """Create a plugin sandbox with a short CPU budget for limit tests"""
+    return PluginSandbox(max_memory_mb=10, max_cpu_time=0.05)
+
+def test_safe_plugin(sandbox, safe_plugin_path):
     """Test loading and executing a safe plugin"""
-    # Create test plugin
-    plugin_dir = tmp_path / 'plugins'
-    plugin_dir.mkdir()
-    
-    test_plugin = plugin_dir / 'safe_plugin.py'
-    test_plugin.write_text('''\
-def safe_method():
-    # Simple arithmetic
-    result = 0
-    for i in range(100):
-        result += i
-    return result
-''')
-    
     # Load and execute plugin
-    module = sandbox.load_plugin(test_plugin)
+    module = sandbox.load_plugin(safe_plugin_path)
     result = sandbox.execute_plugin_method(module, 'safe_method')
     assert result == sum(range(100))
 
-def test_dangerous_plugin(sandbox, tmp_path):
+def test_dangerous_plugin(sandbox, dangerous_plugin_path):
     """Test loading a dangerous plugin"""
-    plugin_dir = tmp_path / 'plugins'
-    plugin_dir.mkdir()
-    
-    # Plugin that tries to access system resources
-    test_plugin = plugin_dir / 'dangerous_plugin.py'
-    test_plugin.write_text('''\
-import os
-import sys
-
-def dangerous_method():
-    # Try to delete files
-    os.remove('/important_file')
-    return True
-''')
-    
     # Loading should fail due to restricted globals
     with pytest.raises(SecurityError, match='Failed to load plugin in sandbox'):
-        sandbox.load_plugin(test_plugin)
+        sandbox.load_plugin(dangerous_plugin_path)
 
-def test_resource_limits(sandbox, tmp_path):
-    """Test plugin resource limits"""
-    plugin_dir = tmp_path / 'plugins'
-    plugin_dir.mkdir()
-    
-    # Plugin that consumes too much memory
-    memory_plugin = plugin_dir / 'memory_hog.py'
-    memory_plugin.write_text('''\
-def consume_memory():
-    # Try to allocate a large list
-    data = [0] * (1024 * 1024 * 20)  # 20MB (should exceed 10MB limit)
-    return len(data)
-''')
-    
-    # Plugin that runs too long
-    cpu_plugin = plugin_dir / 'cpu_hog.py'
-    cpu_plugin.write_text('''\
-def consume_cpu():
-    # Infinite loop
-    while True:
-        pass
-''')
-    
-    # Test memory limit
-    module = sandbox.load_plugin(memory_plugin)
+def test_memory_limit_exceeded(fast_sandbox, memory_hog_path):
+    """Test plugin memory limit"""
+    module = fast_sandbox.load_plugin(memory_hog_path)
     with pytest.raises(SecurityError, match='Memory limit exceeded'):
-        sandbox.execute_plugin_method(module, 'consume_memory')
-    
-    # Test CPU limit
-    module = sandbox.load_plugin(cpu_plugin)
+        fast_sandbox.execute_plugin_method(module, 'consume_memory')
+
+def test_cpu_limit_exceeded(fast_sandbox, cpu_hog_path):
+    """Test plugin CPU time limit"""
+    module = fast_sandbox.load_plugin(cpu_hog_path)
     with pytest.raises(SecurityError, match='Plugin method execution timed out'):
-        sandbox.execute_plugin_method(module, 'consume_cpu')
+        fast_sandbox.execute_plugin_method(module, 'consume_cpu')
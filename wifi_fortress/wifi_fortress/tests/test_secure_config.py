@@ -1,14 +1,11 @@
 import pytest
-import os
-import tempfile
+import io
 from wifi_fortress.core.secure_config import SecureConfigManager
 
 @pytest.fixture
-def config_file():
-    """Create temporary config file"""
-    with tempfile.NamedTemporaryFile(delete=False) as f:
-        yield f.name
-    os.unlink(f.name)
+def config_file(tmp_path_factory):
+    """Path for a config file that doesn't exist yet"""
+    return str(tmp_path_factory.mktemp('cfg') / 'c.bin')
 
 @pytest.fixture
 def secure_config(config_file):
@@ -48,6 +45,20 @@ def test_wrong_password(config_file):
     config2 = SecureConfigManager(config_file, 'password2')
     assert not config2.load_config()
 
+def test_in_memory_config():
+    """Test saving and loading a config kept in a BytesIO buffer"""
+    buffer = io.BytesIO()
+    config1 = SecureConfigManager(buffer, 'test_password')
+    assert config1.load_config()
+    assert config1.get_all_config() == {}
+    
+    config1.set_value('key', 'value')
+    assert config1.save_config()
+    
+    config2 = SecureConfigManager(buffer, 'test_password')
+    assert config2.load_config()
+    assert config2.get_value('key') == 'value'
+
 def test_nested_config(secure_config):
     """Test nested configuration values"""
     secure_config.set_value('level1.level2.level3', 'deep_value')
@@ -9,18 +9,30 @@ from cryptography.fernet import Fernet
 from wifi_fortress.core.security import SecurityManager, SecurityError
 from wifi_fortress.core.error_handler import handle_errors
 
-@pytest.fixture
-def temp_config_dir(tmp_path):
+@pytest.fixture(scope='module')
+def temp_config_dir(tmp_path_factory):
     """Create temporary config directory"""
-    config_dir = tmp_path / 'config'
-    config_dir.mkdir()
-    return config_dir
+    return tmp_path_factory.mktemp('sec_cfg')
 
 @pytest.fixture
+def fresh_config_dir(tmp_path):
+    """Create an empty config directory with no key generated yet"""
+    return tmp_path
+
+@pytest.fixture(scope='module')
 def security_manager(temp_config_dir):
-    """Create security manager instance"""
+    """Create security manager instance shared by the module"""
     return SecurityManager(temp_config_dir)
 
+@pytest.fixture(autouse=True)
+def _reset_security_state(security_manager):
+    """Clear the plugin hash lists, in memory and on disk, after each test"""
+    yield
+    security_manager.whitelist.clear()
+    security_manager.blacklist.clear()
+    security_manager.whitelist_file.unlink(missing_ok=True)
+    security_manager.blacklist_file.unlink(missing_ok=True)
+
 def test_encryption(security_manager):
     """Test data encryption/decryption"""
     # Test string encryption
@@ -35,46 +47,35 @@ def test_encryption(security_manager):
     decrypted = security_manager.decrypt_data(encrypted)
     assert decrypted == test_dict
 
-def test_plugin_validation(security_manager, tmp_path):
+def test_plugin_validation(security_manager, valid_plugin_path, invalid_plugin_path):
     """Test plugin validation"""
-    # Create test plugin file
-    plugin_dir = tmp_path / 'plugins'
-    plugin_dir.mkdir()
+    # Test validation
+    assert security_manager.validate_plugin(valid_plugin_path) is True
     
-    # Valid plugin
-    valid_plugin = plugin_dir / 'valid_plugin.py'
-    valid_plugin.write_text('''
-from wifi_fortress.core.plugin_loader import Plugin
+    with pytest.raises(SecurityError, match='Plugin contains potentially dangerous code'):
+        security_manager.validate_plugin(invalid_plugin_path)
 
-class TestPlugin(Plugin):
-    name = "Test Plugin"
-    description = "Test plugin for validation"
-    version = "1.0.0"
-    author = "Test Author"
-    
-    def initialize(self) -> bool:
-        return True
-        
-    def cleanup(self) -> bool:
-        return True
-''')
-    
-    # Invalid plugin with dangerous imports
-    invalid_plugin = plugin_dir / 'invalid_plugin.py'
-    invalid_plugin.write_text('''
-import os
-import subprocess
+def test_plugin_validation_ignores_comments(security_manager, tmp_path):
+    """Test dangerous names in comments and strings aren't flagged"""
+    plugin = tmp_path / 'commented_plugin.py'
+    plugin.write_text(
+        '# Never call os.system or subprocess.run from a plugin\n'
+        'HELP = "eval( and exec( are not allowed"\n'
+    )
+    assert security_manager.validate_plugin(plugin) is True
 
-def dangerous_function():
-    os.system('rm -rf /')
-    subprocess.run(['format', 'c:'])
-''')
-    
-    # Test validation
-    assert security_manager.validate_plugin(valid_plugin) is True
-    
+@pytest.mark.parametrize('source', [
+    'import os\nf = os.system\nf("ls")\n',
+    'g = eval\ng("1")\n',
+    'import os\ngetattr(os, "system")("ls")\n',
+    'from os import system\nsystem("ls")\n',
+])
+def test_plugin_validation_aliased_calls(security_manager, tmp_path, source):
+    """Test dangerous calls are caught when aliased instead of called directly"""
+    plugin = tmp_path / 'aliased_plugin.py'
+    plugin.write_text(source)
     with pytest.raises(SecurityError, match='Plugin contains potentially dangerous code'):
-        security_manager.validate_plugin(invalid_plugin)
+        security_manager.validate_plugin(plugin)
 
 def test_input_sanitization(security_manager):
     """Test input sanitization"""
@@ -115,15 +116,15 @@ def test_signature_verification(security_manager):
     assert security_manager.verify_signature(data, valid_sig, key)
     assert not security_manager.verify_signature(data, invalid_sig, key)
 
-def test_key_persistence(temp_config_dir):
+def test_key_persistence(fresh_config_dir):
     """Test encryption key persistence"""
     # Create first instance
-    sm1 = SecurityManager(temp_config_dir)
+    sm1 = SecurityManager(fresh_config_dir)
     test_data = "test data"
     encrypted = sm1.encrypt_data(test_data)
     
     # Create second instance
-    sm2 = SecurityManager(temp_config_dir)
+    sm2 = SecurityManager(fresh_config_dir)
     decrypted = sm2.decrypt_data(encrypted)
     
     assert decrypted == test_data
@@ -142,40 +143,17 @@ def test_error_handling(security_manager):
     with pytest.raises(SecurityError, match='Signature verification failed'):
         security_manager.verify_signature(None, None, None)
 
-def test_plugin_hash_lists(security_manager, tmp_path):
+def test_plugin_hash_lists(security_manager, valid_plugin_path):
     """Test plugin hash whitelisting and blacklisting"""
-    # Create test plugin file
-    plugin_dir = tmp_path / 'plugins'
-    plugin_dir.mkdir()
-    
-    # Create a test plugin
-    test_plugin = plugin_dir / 'test_plugin.py'
-    test_plugin.write_text('''
-from wifi_fortress.core.plugin_loader import Plugin
-
-class TestPlugin(Plugin):
-    name = "Test Plugin"
-    description = "Test plugin for validation"
-    version = "1.0.0"
-    author = "Test Author"
-    
-    def initialize(self) -> bool:
-        return True
-        
-    def cleanup(self) -> bool:
-        return True
-''')
-    
     # Calculate plugin hash
-    with open(test_plugin, 'rb') as f:
-        content = f.read()
-    plugin_hash = hashlib.sha256(content).hexdigest()
+    with open(valid_plugin_path, 'rb') as f:
+        plugin_hash = hashlib.sha256(f.read()).hexdigest()
     
     # Test whitelisting first
     security_manager.add_to_whitelist(plugin_hash)
-    assert security_manager.validate_plugin(test_plugin) is True
+    assert security_manager.validate_plugin(valid_plugin_path) is True
     
     # Test blacklisting
     security_manager.add_to_blacklist(plugin_hash)
     with pytest.raises(SecurityError, match='Plugin hash .* is blacklisted'):
-        security_manager.validate_plugin(test_plugin)
+        security_manager.validate_plugin(valid_plugin_path)
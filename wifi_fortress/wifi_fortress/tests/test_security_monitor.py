@@ -1,11 +1,21 @@
 import pytest
-from datetime import datetime, timedelta
-from wifi_fortress.plugins.security_monitor import SecurityMonitor
+import numpy as np
+import time
+from types import SimpleNamespace
+import wifi_fortress.plugins.security_monitor as security_monitor_module
+from wifi_fortress.plugins.security_monitor import SecurityMonitor, _mac_key, _oui_lookup, _validate_mac
 
-@pytest.fixture
-def security_monitor():
+@pytest.fixture(scope='module')
+def security_monitor_shared():
+    """Monitor constructed once for the whole module"""
     return SecurityMonitor()
 
+@pytest.fixture
+def security_monitor(security_monitor_shared):
+    """Shared monitor with its devices and events cleared"""
+    security_monitor_shared.cleanup()
+    return security_monitor_shared
+
 def test_security_monitor_init(security_monitor):
     """Test security monitor initialization"""
     assert security_monitor.name == 'Security Monitor'
@@ -21,10 +31,67 @@ def test_analyze_device(security_monitor):
     assert len(security_monitor._suspicious_activity) == 1
     assert security_monitor._suspicious_activity[0]['type'] == 'New device detected'
 
+def test_mac_normalization(security_monitor):
+    """Test differently formatted MACs map to the same device"""
+    security_monitor.analyze_device('AA-BB-CC-DD-EE-FF', '192.168.1.100')
+    security_monitor.analyze_device('aa:bb:cc:dd:ee:ff', '192.168.1.100')
+    assert list(security_monitor._known_devices) == [0xaabbccddeeff]
+    assert len(security_monitor._suspicious_activity) == 1
+
+@pytest.mark.parametrize('mac,valid', [
+    ('aa:bb:cc:dd:ee:ff', True),
+    ('00:11:22:33:44:55', True),
+    ('aa-bb-cc-dd-ee-ff', False),
+    ('aabb:ccdd:eeff:00', False),
+    ('aa:bb:cc:dd:ee:f', False),
+    ('aa:bb:cc:dd:ee:fff', False),
+    ('', False),
+])
+def test_validate_mac(mac, valid):
+    """Test MAC shape validation"""
+    assert _validate_mac(mac) is valid
+
+def test_mac_key_malformed():
+    """Test malformed MACs fall back to their string form"""
+    assert _mac_key('aa:bb:cc:dd:ee:ff') == 0xaabbccddeeff
+    assert _mac_key('zz:bb:cc:dd:ee:ff') == 'zz:bb:cc:dd:ee:ff'
+    assert _mac_key('aabb:ccdd:eeff:00') == 'aabb:ccdd:eeff:00'
+
+def test_oui_lookup(monkeypatch):
+    """Test vendors come from the manufacturer database's public lookup"""
+    vendors = {'00:00:0c': ('Cisco', 'Cisco Systems, Inc')}
+    manufdb = SimpleNamespace(lookup=lambda mac: vendors.get(mac, (mac, mac)))
+    monkeypatch.setattr(security_monitor_module.scapy_conf, 'manufdb', manufdb)
+    _oui_lookup.cache_clear()
+    try:
+        assert _oui_lookup('00:00:0c') == 'Cisco Systems, Inc'
+        assert _oui_lookup('aa:bb:cc') is None
+    finally:
+        _oui_lookup.cache_clear()
+
+def test_analyze_devices_batch(security_monitor):
+    """Test batched analysis only reports each new device once"""
+    security_monitor.analyze_device('00:11:22:33:44:55', '192.168.1.100')
+    
+    macs = np.array([0x001122334455, 0xaabbccddeeff, 0xaabbccddeeff, 0x020000000001],
+                    dtype=np.uint64)
+    ips = np.array([0xc0a80164, 0xc0a80165, 0xc0a80165, 0xc0a80166], dtype=np.uint32)
+    security_monitor.analyze_devices(macs, ips)
+    
+    assert set(security_monitor._known_devices) == {0x001122334455, 0xaabbccddeeff, 0x020000000001}
+    new_events = list(security_monitor._suspicious_activity)[1:]
+    assert [e['details']['mac_address'] for e in new_events] == ['aa:bb:cc:dd:ee:ff', '02:00:00:00:00:01']
+    assert [e['details']['ip_address'] for e in new_events] == ['192.168.1.101', '192.168.1.102']
+    
+    # Seen devices aren't reported again, whichever path saw them
+    security_monitor.analyze_devices(macs, ips)
+    security_monitor.analyze_device('AA-BB-CC-DD-EE-FF', '192.168.1.101')
+    assert len(security_monitor._suspicious_activity) == 3
+
 def test_clean_old_events(security_monitor):
     """Test event cleanup"""
     # Add old event
-    old_time = datetime.now() - timedelta(hours=2)
+    old_time = time.monotonic_ns() - 2 * 60 * 60 * 1_000_000_000
     security_monitor._suspicious_activity.append({
         'type': 'Test Event',
         'details': {},
@@ -35,7 +102,7 @@ def test_clean_old_events(security_monitor):
     security_monitor._suspicious_activity.append({
         'type': 'Test Event',
         'details': {},
-        'timestamp': datetime.now()
+        'timestamp': time.monotonic_ns()
     })
     
     # Clean events
@@ -55,6 +122,15 @@ def test_security_alert_threshold(security_monitor):
     # Should have triggered alert
     assert len(security_monitor._suspicious_activity) >= security_monitor._alert_threshold
 
+def test_suspicious_activity_bounded(security_monitor):
+    """Test the event buffer stays bounded under a burst of events"""
+    for i in range(security_monitor._max_events * 3):
+        security_monitor._log_security_event('Test Event', {'test_id': i})
+    
+    assert len(security_monitor._suspicious_activity) == security_monitor._max_events
+    # Oldest events were evicted
+    assert security_monitor._suspicious_activity[0]['details']['test_id'] == security_monitor._max_events * 2
+
 def test_cleanup(security_monitor):
     """Test cleanup"""
     # Add some data
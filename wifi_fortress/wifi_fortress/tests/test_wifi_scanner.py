@@ -0,0 +1,34 @@
+import pytest
+import scapy.all as scapy
+from wifi_fortress.plugins.wifi_scanner import _parse_beacon
+
+BSSID = '02:11:22:33:44:55'
+
+def beacon(*elements, radiotap=True):
+    frame = scapy.Dot11(type=0, subtype=8, addr1='ff:ff:ff:ff:ff:ff',
+                        addr2=BSSID, addr3=BSSID) / scapy.Dot11Beacon()
+    for element in elements:
+        frame = frame / element
+    if radiotap:
+        frame = scapy.RadioTap() / frame
+    return bytes(frame)
+
+@pytest.mark.parametrize('radiotap', [True, False])
+def test_parse_beacon(radiotap):
+    """Test the BSSID, SSID and channel are read from the frame bytes"""
+    raw = beacon(scapy.Dot11Elt(ID=0, info=b'TestNet'),
+                 scapy.Dot11Elt(ID=1, info=b'\x82\x84'),
+                 scapy.Dot11Elt(ID=3, info=b'\x06'),
+                 radiotap=radiotap)
+    assert _parse_beacon(raw, radiotap) == (BSSID, 'TestNet', 6)
+
+def test_parse_beacon_no_channel():
+    """Test beacons without a DS parameter set have no channel"""
+    raw = beacon(scapy.Dot11Elt(ID=0, info=b'TestNet'))
+    assert _parse_beacon(raw, True) == (BSSID, 'TestNet', None)
+
+def test_parse_beacon_truncated():
+    """Test truncated frames and beacons without an SSID are skipped"""
+    raw = beacon(scapy.Dot11Elt(ID=0, info=b'TestNet'))
+    assert _parse_beacon(raw[:20], True) is None
+    assert _parse_beacon(beacon(scapy.Dot11Elt(ID=3, info=b'\x06')), True) is None
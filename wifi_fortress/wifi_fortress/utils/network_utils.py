@@ -1,106 +1,309 @@
-import netifaces
-import psutil
+import logging
+import os
 import subprocess
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Any, List, Dict, NamedTuple, Optional
 import platform
 import re
+import socket
+import time
+
+if TYPE_CHECKING:
+    import numpy as np
+
+logger = logging.getLogger(__name__)
+
+# psutil and numpy are imported on first use, so importing this module for
+# helpers like format_bytes doesn't load them
+_psutil = None
+_np = None
+
+def _get_psutil():
+    """Import psutil on first use"""
+    global _psutil
+    if _psutil is None:
+        import psutil as _psutil
+    return _psutil
+
+def _get_numpy():
+    """Import numpy on first use"""
+    global _np
+    if _np is None:
+        import numpy as _np
+    return _np
+
+_INTERFACE_CACHE_TTL = 1.0  # Seconds
+_IFACE_CACHE: Dict = {'t': 0.0, 'v': None}
+
+def invalidate_interface_cache() -> None:
+    """Make the next get_network_interfaces call re-read the interfaces"""
+    _IFACE_CACHE['v'] = None
 
 def get_network_interfaces() -> List[Dict]:
-    """Get all network interfaces with their details"""
+    """Get all network interfaces with their details
+    
+    Results are reused for up to a second, since interfaces rarely change
+    faster than that. Call invalidate_interface_cache() to force a re-read.
+    """
+    now = time.monotonic()
+    cached = _IFACE_CACHE['v']
+    if cached is None or now - _IFACE_CACHE['t'] >= _INTERFACE_CACHE_TTL:
+        cached = _read_network_interfaces()
+        _IFACE_CACHE['t'] = now
+        _IFACE_CACHE['v'] = cached
+    # Copy so callers can't modify the cached entries
+    return [dict(iface) for iface in cached]
+
+def _read_network_interfaces() -> List[Dict]:
+    """Read all network interfaces with their details"""
+    # One pass each over addresses and link state for all interfaces
+    psutil = _get_psutil()
+    try:
+        all_addrs = psutil.net_if_addrs()
+        all_stats = psutil.net_if_stats()
+    except Exception as e:
+        logger.error('Error getting network interfaces: %s', e)
+        return []
+        
     interfaces = []
-    for iface in netifaces.interfaces():
-        try:
-            addrs = netifaces.ifaddresses(iface)
-            # Get IPv4 info if available
-            ipv4 = addrs.get(netifaces.AF_INET, [{}])[0]
-            # Get MAC address if available
-            mac = addrs.get(netifaces.AF_LINK, [{}])[0].get('addr')
-            
-            interface_info = {
-                'name': iface,
-                'ip': ipv4.get('addr', ''),
-                'netmask': ipv4.get('netmask', ''),
-                'mac': mac or '',
-                'is_up': is_interface_up(iface)
-            }
-            interfaces.append(interface_info)
-        except Exception as e:
-            print(f"Error getting interface {iface} info: {str(e)}")
+    for iface, addrs in all_addrs.items():
+        # Get IPv4 info if available
+        ipv4 = next((a for a in addrs if a.family == socket.AF_INET), None)
+        # Get MAC address if available
+        mac = next((a.address for a in addrs if a.family == psutil.AF_LINK), '')
+        stats = all_stats.get(iface)
+        
+        interfaces.append({
+            'name': iface,
+            'ip': ipv4.address if ipv4 else '',
+            'netmask': (ipv4.netmask or '') if ipv4 else '',
+            'mac': mac,
+            'is_up': stats.isup if stats else False
+        })
     return interfaces
 
+_SYS_CLASS_NET_OPERSTATE = '/sys/class/net/{}/operstate'
+
 def is_interface_up(interface: str) -> bool:
-    """Check if a network interface is up"""
+    """Check if a network interface is up
+    
+    Thin wrapper for callers outside this module; get_network_interfaces
+    reads the link state for every interface in one pass instead.
+    
+    On Linux the kernel's operstate is read from sysfs. Interfaces whose
+    driver doesn't report one (such as loopback, 'unknown') and systems
+    without sysfs fall back to psutil's administrative up flag.
+    """
+    if '/' in interface:
+        return False
+    try:
+        with open(_SYS_CLASS_NET_OPERSTATE.format(interface), 'rb') as f:
+            state = f.read().strip()
+        if state != b'unknown':
+            return state == b'up'
+    except (OSError, ValueError):
+        pass
     try:
-        addrs = netifaces.ifaddresses(interface)
-        return netifaces.AF_INET in addrs
+        stats = _get_psutil().net_if_stats().get(interface)
+        return bool(stats and stats.isup)
     except Exception:
         return False
 
+_PROC_NET_WIRELESS = '/proc/net/wireless'
+
+# Matched against raw command output, so it never needs decoding
+_SIGNAL_PCT_RE = re.compile(rb'(\d+)%')
+_IWCONFIG_DBM_RE = re.compile(rb'Signal level=(-\d+)')
+
+# Signal strength usually ranges from -100 dBm (0%) to -50 dBm (100%), so
+# percentages are tabulated per dBm over that range, indexed by dbm + 100
+_DBM_PERCENT = tuple(2 * i for i in range(51))
+_dbm_percent_arr = None
+
+def _dbm_to_percent(dbm: int) -> int:
+    """Convert a signal level in dBm to a rough percentage"""
+    return _DBM_PERCENT[max(0, min(50, dbm + 100))]
+
+def dbm_to_percent(dbm: Any) -> 'np.ndarray':
+    """Convert an array of signal levels in dBm to rough percentages
+    
+    Args:
+        dbm: Signal levels in dBm, any array-like of integers
+        
+    Returns:
+        np.ndarray: Percentages (uint8), same shape as the input
+    """
+    global _dbm_percent_arr
+    np = _get_numpy()
+    if _dbm_percent_arr is None:
+        _dbm_percent_arr = np.array(_DBM_PERCENT, dtype=np.uint8)
+    idx = np.clip(np.asarray(dbm, dtype=np.int64) + 100, 0, 50)
+    return _dbm_percent_arr[idx]
+
+def _read_wireless_signal_dbm(interface: str) -> Optional[int]:
+    """Read an interface's signal level from /proc/net/wireless
+    
+    The kernel keeps the same wireless stats iwconfig prints, so reading
+    them here avoids spawning a process per query.
+    
+    Returns:
+        Signal level in dBm, or None if the interface isn't listed or has
+        no reading (not associated, or a driver reporting relative levels)
+    """
+    try:
+        with open(_PROC_NET_WIRELESS) as f:
+            lines = f.readlines()[2:]  # Skip the two header lines
+    except OSError:
+        return None
+        
+    for line in lines:
+        name, sep, fields = line.partition(':')
+        if not sep or name.strip() != interface:
+            continue
+        try:
+            # Fields: status, link quality, signal level, noise, ...
+            values = fields.split()
+            quality = int(float(values[1].rstrip('.')))
+            level = int(float(values[2].rstrip('.')))
+        except (IndexError, ValueError):
+            return None
+        # Unassociated interfaces are listed with zeroed quality and level,
+        # and only negative levels are already in dBm
+        if quality <= 0 or level >= 0:
+            return None
+        return level
+    return None
+
 def get_wifi_signal_strength(interface: str) -> Optional[int]:
     """Get WiFi signal strength for an interface"""
     if platform.system() == 'Windows':
         try:
             output = subprocess.check_output(
-                ['netsh', 'wlan', 'show', 'interfaces'],
-                universal_newlines=True
+                ['netsh', 'wlan', 'show', 'interfaces']
             )
-            for line in output.split('\n'):
-                if 'Signal' in line and interface in output:
-                    match = re.search(r'(\d+)%', line)
+            iface = interface.encode()
+            for line in output.split(b'\n'):
+                if b'Signal' in line and iface in output:
+                    match = _SIGNAL_PCT_RE.search(line)
                     if match:
                         return int(match.group(1))
         except Exception as e:
-            print(f"Error getting signal strength: {str(e)}")
+            logger.error('Error getting signal strength: %s', e)
     else:
+        dbm = _read_wireless_signal_dbm(interface)
+        if dbm is not None:
+            return _dbm_to_percent(dbm)
         try:
             output = subprocess.check_output(
                 ['iwconfig', interface],
-                universal_newlines=True,
                 stderr=subprocess.DEVNULL
             )
-            match = re.search(r'Signal level=(-\d+)', output)
+            match = _IWCONFIG_DBM_RE.search(output)
             if match:
                 # Convert dBm to percentage (rough approximation)
-                dbm = int(match.group(1))
-                # Signal strength usually ranges from -100 dBm (0%) to -50 dBm (100%)
-                percentage = max(0, min(100, 2 * (dbm + 100)))
-                return percentage
+                return _dbm_to_percent(int(match.group(1)))
         except Exception as e:
-            print(f"Error getting signal strength: {str(e)}")
+            logger.error('Error getting signal strength: %s', e)
+    return None
+
+class NetworkUsage(NamedTuple):
+    """Network usage counters for an interface, as psutil reports them
+    
+    get_network_usage used to return a dict, so counters can still be
+    looked up by name (usage['bytes_sent']) as well as by attribute.
+    """
+    bytes_sent: int
+    bytes_recv: int
+    packets_sent: int
+    packets_recv: int
+    errin: int
+    errout: int
+    dropin: int
+    dropout: int
+    
+    def __getitem__(self, key):
+        """Look up a counter by name or position"""
+        if isinstance(key, str):
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return tuple.__getitem__(self, key)
+
+# Returned for interfaces psutil has no counters for
+_ZERO_IO = NetworkUsage(0, 0, 0, 0, 0, 0, 0, 0)
+
+_PROC_NET_DEV = '/proc/net/dev'
+_PROC_NET_DEV_READ_SIZE = 65536
+_proc_net_dev_fd: Optional[int] = None  # Kept open between polls, -1 if unusable
+
+def _read_proc_net_dev(interface: str) -> Optional[NetworkUsage]:
+    """Read one interface's counters from /proc/net/dev
+    
+    The file stays open and is re-read from offset 0 with pread, so each
+    poll is a single syscall and only the requested row is parsed.
+    
+    Returns:
+        Counters for the interface, or None if they couldn't be read here
+    """
+    global _proc_net_dev_fd
+    if _proc_net_dev_fd is None:
+        try:
+            _proc_net_dev_fd = os.open(_PROC_NET_DEV, os.O_RDONLY)
+        except (OSError, AttributeError):
+            _proc_net_dev_fd = -1
+    if _proc_net_dev_fd < 0:
+        return None
+        
+    try:
+        data = os.pread(_proc_net_dev_fd, _PROC_NET_DEV_READ_SIZE, 0)
+    except OSError:
+        return None
+    if len(data) >= _PROC_NET_DEV_READ_SIZE:
+        return None  # Too many interfaces to read in one go
+        
+    iface = interface.encode()
+    for line in data.split(b'\n')[2:]:  # Skip the two header lines
+        name, sep, fields = line.partition(b':')
+        if not sep or name.strip() != iface:
+            continue
+        # 8 receive columns then 8 transmit columns, starting with bytes,
+        # packets, errs and drop
+        f = fields.split()
+        if len(f) < 12:
+            return None
+        return NetworkUsage(
+            bytes_sent=int(f[8]), bytes_recv=int(f[0]),
+            packets_sent=int(f[9]), packets_recv=int(f[1]),
+            errin=int(f[2]), errout=int(f[10]),
+            dropin=int(f[3]), dropout=int(f[11])
+        )
     return None
 
-def get_network_usage(interface: str) -> Dict[str, float]:
-    """Get network usage statistics for an interface"""
+def get_network_usage(interface: str) -> NetworkUsage:
+    """Get network usage statistics for an interface
+    
+    Returns:
+        Counters for the interface, all zero if it is unknown. The result
+        is a NetworkUsage tuple rather than a dict, but supports the same
+        usage['bytes_sent'] lookups; use _asdict() for a real dict.
+    """
+    usage = _read_proc_net_dev(interface)
+    if usage is not None:
+        return usage
     try:
-        stats = psutil.net_io_counters(pernic=True).get(interface)
+        stats = _get_psutil().net_io_counters(pernic=True).get(interface)
         if stats:
-            return {
-                'bytes_sent': stats.bytes_sent,
-                'bytes_recv': stats.bytes_recv,
-                'packets_sent': stats.packets_sent,
-                'packets_recv': stats.packets_recv,
-                'errin': stats.errin,
-                'errout': stats.errout,
-                'dropin': stats.dropin,
-                'dropout': stats.dropout
-            }
+            return NetworkUsage._make(stats)
     except Exception as e:
-        print(f"Error getting network usage: {str(e)}")
-    return {
-        'bytes_sent': 0,
-        'bytes_recv': 0,
-        'packets_sent': 0,
-        'packets_recv': 0,
-        'errin': 0,
-        'errout': 0,
-        'dropin': 0,
-        'dropout': 0
-    }
-
-def format_bytes(bytes: float) -> str:
+        logger.error('Error getting network usage: %s', e)
+    return _ZERO_IO
+
+_BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+def format_bytes(num_bytes: float) -> str:
     """Format bytes into human readable format"""
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes < 1024:
-            return f"{bytes:.2f} {unit}"
-        bytes /= 1024
-    return f"{bytes:.2f} PB"
+    if num_bytes < 1024:
+        return f"{num_bytes:.2f} B"
+    # Each unit is 10 more bits, so the bit length picks the unit directly
+    idx = min((int(num_bytes).bit_length() - 1) // 10, len(_BYTE_UNITS) - 1)
+    return f"{num_bytes / (1 << (10 * idx)):.2f} {_BYTE_UNITS[idx]}"